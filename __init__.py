@@ -1,24 +1,83 @@
-"""chemname – zero‑dependency IUPAC helper library (v0.3)."""
+"""chemname – zero‑dependency IUPAC helper library (v0.3).
 
-from importlib.metadata import version as _v
+Public names are imported on first use (module ``__getattr__``), so
+``import chemname`` costs almost nothing and a short‑lived process pays
+only for the parts it touches.
+"""
 
-from .core.exceptions import DuplicateAtomError, DuplicateBondError, UnknownAtomError
-from .core.structures import Atom, Bond, Molecule
-from .naming.namer import name
+from importlib import import_module
 
-__all__ = [
-    "Atom",
-    "Bond",
-    "Molecule",
-    "DuplicateAtomError",
-    "DuplicateBondError",
-    "UnknownAtomError",
-    "name",
-]
+TYPE_CHECKING = False  # typing.TYPE_CHECKING without importing typing
 
 __version__ = "0.3.0"
 
-try:  # pragma: no cover
-    __pkg_version = _v(__name__)
-except Exception:  # noqa: BLE001
-    __pkg_version = __version__
+# public name → module it lives in (relative to this package)
+_EXPORTS = {
+    "Atom": ".core.structures",
+    "Bond": ".core.structures",
+    "Molecule": ".core.structures",
+    "FrozenMolecule": ".core.frozen",
+    "MoleculeBatch": ".core.batch",
+    "DuplicateAtomError": ".core.exceptions",
+    "DuplicateBondError": ".core.exceptions",
+    "UnknownAtomError": ".core.exceptions",
+    "NameParseError": ".core.exceptions",
+    "name": ".naming.namer",
+    "name_parts": ".naming.namer",
+    "NameParts": ".naming.parts",
+    "parse": ".naming.parser",
+    "name_many": ".naming.batch",
+    "NameResult": ".naming.batch",
+    "name_shared": ".naming.shared",
+    "NameStore": ".naming.store",
+    "aname": ".naming.aio",
+    "aname_stream": ".naming.aio",
+    "cache_clear": ".naming.cache",
+    "cache_info": ".naming.cache",
+    "set_cache_size": ".naming.cache",
+    "use_store": ".naming.store",
+    "stats": ".instrumentation",
+}
+_SUBMODULES = frozenset(
+    {"benchmarks", "cli", "core", "enumerate", "formats", "instrumentation", "naming", "util"}
+)
+
+__all__ = list(_EXPORTS)
+
+if TYPE_CHECKING:  # pragma: no cover – static tools see the eager imports
+    from .core.batch import MoleculeBatch
+    from .core.exceptions import DuplicateAtomError, DuplicateBondError, NameParseError, UnknownAtomError
+    from .core.frozen import FrozenMolecule
+    from .core.structures import Atom, Bond, Molecule
+    from .instrumentation import stats
+    from .naming.aio import aname, aname_stream
+    from .naming.batch import NameResult, name_many
+    from .naming.cache import cache_clear, cache_info, set_cache_size
+    from .naming.namer import name, name_parts
+    from .naming.parser import parse
+    from .naming.parts import NameParts
+    from .naming.shared import name_shared
+    from .naming.store import NameStore, use_store
+
+
+def __getattr__(attr: str):
+    module = _EXPORTS.get(attr)
+    if module is not None:
+        value = getattr(import_module(module, __name__), attr)
+    elif attr in _SUBMODULES:
+        value = import_module(f".{attr}", __name__)
+    elif attr == "__pkg_version":
+        from importlib.metadata import version
+
+        try:  # pragma: no cover
+            value = version(__name__)
+        except Exception:  # noqa: BLE001
+            value = __version__
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {attr!r}")
+    globals()[attr] = value  # later look‑ups skip this hook
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_EXPORTS) | _SUBMODULES)
@@ -0,0 +1,5 @@
+"""Benchmark suite: scaling sweeps, JSON baselines and regression checks.
+
+Run ``python -m chemname.benchmarks run -o baseline.json`` once, then
+``python -m chemname.benchmarks run --compare baseline.json`` after a change.
+"""
@@ -0,0 +1,195 @@
+"""``python -m chemname.benchmarks {run,compare,vectorized,roundtrip,aio,enumerate,branched,symmetric,startup,columnar,shared,sdf}``."""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+
+from .compare import compare, format_regressions
+from .run import format_curves, run_suite
+
+
+def _load(path: str) -> dict:
+    with open(path, encoding="utf-8") as fh:
+        return json.load(fh)
+
+
+def main(argv=None) -> int:
+    p = argparse.ArgumentParser(prog="python -m chemname.benchmarks")
+    sub = p.add_subparsers(dest="command", required=True)
+
+    run = sub.add_parser("run", help="run the sweeps and print scaling curves")
+    run.add_argument("-o", "--output", help="write results (a baseline) to this JSON file")
+    run.add_argument("--count", type=int, default=500, help="molecules per sweep point")
+    run.add_argument("--repeats", type=int, default=7, help="timed repeats per stage")
+    run.add_argument("--seed", type=int, default=0)
+    run.add_argument("--compare", metavar="BASELINE", help="compare against a stored baseline")
+    run.add_argument("--alpha", type=float, default=0.01)
+    run.add_argument("--threshold", type=float, default=0.05)
+
+    cmp_ = sub.add_parser("compare", help="compare two stored result files")
+    cmp_.add_argument("baseline")
+    cmp_.add_argument("current")
+    cmp_.add_argument("--alpha", type=float, default=0.01)
+    cmp_.add_argument("--threshold", type=float, default=0.05)
+
+    vec = sub.add_parser("vectorized", help="NumPy straight‑chain engine vs name() (needs NumPy)")
+    vec.add_argument("--count", type=int, default=1_000_000)
+    vec.add_argument("--sample", type=int, default=20_000, help="molecules timed through name()")
+    vec.add_argument("--seed", type=int, default=0)
+
+    rt = sub.add_parser("roundtrip", help="parse() and name(parse(s)) == s over many names")
+    rt.add_argument("--count", type=int, default=1_000_000)
+    rt.add_argument("--distinct", type=int, default=20_000, help="different names cycled through")
+    rt.add_argument("--seed", type=int, default=0)
+
+    aio = sub.add_parser("aio", help="event‑loop lag under a naming load, inline vs aname_stream()")
+    aio.add_argument("--count", type=int, default=5000)
+    aio.add_argument("--concurrency", type=int, default=8)
+    aio.add_argument("--workers", type=int, default=2)
+    aio.add_argument("--seed", type=int, default=0)
+
+    en = sub.add_parser("enumerate", help="isomer generation rate (optionally naming each)")
+    en.add_argument("--max-carbons", type=int, default=8)
+    en.add_argument("--halogens", default="", help="comma separated, e.g. F,Cl")
+    en.add_argument("--max-halogens", type=int, default=0)
+    en.add_argument("--max-multiple-bonds", type=int, default=0)
+    en.add_argument("--shard", type=int, default=0)
+    en.add_argument("--of", type=int, default=1)
+    en.add_argument("--name", action="store_true", help="name every isomer as it is generated")
+
+    br = sub.add_parser("branched", help="dendrimer‑like molecules: memoised vs cold branched‑group naming")
+    br.add_argument("--count", type=int, default=2000)
+    br.add_argument("--generation", type=int, default=2)
+    br.add_argument("--branching", type=int, default=3)
+
+    sym = sub.add_parser("symmetric", help="symmetric dendrimers whose longest chains all tie")
+    sym.add_argument("--generation", type=int, default=4)
+    sym.add_argument("--branching", type=int, default=3)
+    sym.add_argument("--arms", type=int, default=4)
+
+    st = sub.add_parser("startup", help="import and first‑name latency in fresh interpreters")
+    st.add_argument("--runs", type=int, default=20)
+
+    col = sub.add_parser("columnar", help="MoleculeBatch memory vs a list of Molecule objects")
+    col.add_argument("--count", type=int, default=1_000_000)
+    col.add_argument("--sample", type=int, default=20_000, help="list‑side molecules actually built")
+    col.add_argument("--seed", type=int, default=0)
+
+    sh = sub.add_parser("shared", help="name_shared() (shared memory) vs name_many() (pickled pool)")
+    sh.add_argument("--count", type=int, default=50_000)
+    sh.add_argument("--workers", type=int, default=2)
+    sh.add_argument("--chunksize", type=int, default=1024)
+    sh.add_argument("--seed", type=int, default=0)
+
+    sd = sub.add_parser("sdf", help="SD file reading, and naming split into byte ranges across workers")
+    sd.add_argument("--count", type=int, default=20_000)
+    sd.add_argument("--workers", type=int, default=2)
+    sd.add_argument("--seed", type=int, default=0)
+
+    args = p.parse_args(argv)
+    if args.command == "sdf":
+        from .sdf import run as run_sdf
+
+        for label, value in run_sdf(args.count, args.workers, seed=args.seed).items():
+            print(f"{label:18} {value:12.1f}")
+        return 0
+    if args.command == "shared":
+        from .shared import run as run_shared
+
+        for label, value in run_shared(args.count, args.workers, args.chunksize, seed=args.seed).items():
+            print(f"{label:14} {value:12.1f}")
+        return 0
+    if args.command == "columnar":
+        from .columnar import run as run_columnar
+
+        for label, value in run_columnar(args.count, args.sample, seed=args.seed).items():
+            print(f"{label:22} {value:12.1f}")
+        return 0
+    if args.command == "startup":
+        from .startup import run as run_startup
+
+        for label, value in run_startup(args.runs).items():
+            print(f"{label:16} {value:10.2f}")
+        return 0
+    if args.command == "symmetric":
+        from .branched import run_symmetric
+
+        print(f"{'generation':>10} {'atoms':>8} {'chains':>10} {'seconds':>9}")
+        for row in run_symmetric(args.generation, args.branching, args.arms):
+            print(f"{row['generation']:10.0f} {row['atoms']:8.0f} {row['chains']:10.0f} {row['seconds']:9.4f}")
+        return 0
+    if args.command == "branched":
+        from .branched import run as run_branched
+
+        doc = run_branched(args.count, args.generation, args.branching)
+        print(doc.pop("name"))
+        for label, value in doc.items():
+            print(f"{label:16} {value:12.1f}")
+        return 0
+    if args.command == "enumerate":
+        from .enumeration import run as run_enumeration
+
+        doc = run_enumeration(
+            args.max_carbons,
+            [h for h in args.halogens.split(",") if h],
+            args.max_halogens,
+            args.max_multiple_bonds,
+            args.shard,
+            args.of,
+            with_names=args.name,
+            progress=lambda s: print(f"{s.count} isomers, {s.rate:.0f}/s", file=sys.stderr),
+        )
+        for label, value in doc.items():
+            print(f"{label:14} {value:12.1f}")
+        return 0
+    if args.command == "aio":
+        from .aio import run as run_aio
+
+        modes = run_aio(args.count, args.concurrency, args.workers, seed=args.seed)
+        print(f"{'mode':12} {'names/s':>10} {'lag p50':>9} {'lag p99':>9} {'lag max':>9}  (ms)")
+        for mode, r in modes.items():
+            print(
+                f"{mode:12} {r['per_s']:10.1f} {r['lag_p50_ms']:9.2f} {r['lag_p99_ms']:9.2f} {r['lag_max_ms']:9.2f}"
+            )
+        return 0
+    if args.command == "roundtrip":
+        from .roundtrip import run as run_roundtrip
+
+        doc = run_roundtrip(args.count, args.distinct, seed=args.seed)
+        print(f"{doc['names']} names ({doc['distinct']} distinct)")
+        print(f"parse        {doc['parse_per_s']:12.1f}/s")
+        print(f"round trip   {doc['roundtrip_per_s']:12.1f}/s")
+        print(f"mismatches   {len(doc['mismatches']):12d}")
+        for s, back in sorted(doc["mismatches"].items()):
+            print(f"  {s} -> {back}")
+        return 0
+    if args.command == "vectorized":
+        from .vectorized import run as run_vectorized
+
+        rates = run_vectorized(args.count, args.sample, seed=args.seed)
+        for label, value in rates.items():
+            print(f"{label:22} {value:12.1f}")
+        print(f"{'speedup (uncached)':22} {rates['vectorized_per_s'] / rates['name_uncached_per_s']:12.1f}x")
+        return 0
+    if args.command == "compare":
+        current = _load(args.current)
+        baseline = _load(args.baseline)
+    else:
+        current = run_suite(args.count, args.repeats, seed=args.seed, progress=lambda c: print(c, file=sys.stderr))
+        print(format_curves(current))
+        if args.output:
+            with open(args.output, "w", encoding="utf-8") as fh:
+                json.dump(current, fh, indent=1)
+        if not args.compare:
+            return 0
+        baseline = _load(args.compare)
+
+    regressions = compare(baseline, current, args.alpha, args.threshold)
+    print(format_regressions(regressions))
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
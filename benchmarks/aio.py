@@ -0,0 +1,98 @@
+"""Event‑loop responsiveness while an asyncio service names molecules.
+
+``python -m chemname.benchmarks aio --count 5000`` runs a 1 ms ticker
+next to a sustained naming load and reports how late its wake‑ups are
+(p50/p99/max, ms) together with the naming rate, for ``name()`` called
+inline in a coroutine (yielding after every molecule, or after requests of
+32) and for :func:`~chemname.naming.aio.aname_stream` on a thread and on a
+process executor (one molecule and 32 per hand‑off).
+"""
+
+from __future__ import annotations
+
+import asyncio
+import random
+import time
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Dict, List, Sequence
+
+from ..core.structures import Molecule
+from ..naming.aio import aname_stream
+from ..naming.cache import _cache
+from ..naming.namer import name
+from .generator import make_molecule
+from .run import _percentile
+
+TICK_S = 0.001
+
+
+def load(count: int, seed: int = 0) -> List[Molecule]:
+    rng = random.Random(seed)
+    return [
+        make_molecule(rng, rng.randint(8, 12), substituents=rng.randint(1, 4), alkyl_size=rng.choice((0, 1, 2)))
+        for _ in range(count)
+    ]
+
+
+async def _ticker(lags: List[float], stop: asyncio.Event) -> None:
+    while not stop.is_set():
+        t0 = time.perf_counter()
+        await asyncio.sleep(TICK_S)
+        lags.append(time.perf_counter() - t0 - TICK_S)
+
+
+async def _inline(mols: Sequence[Molecule], batch: int) -> int:
+    done = 0
+    for start in range(0, len(mols), batch):
+        for mol in mols[start : start + batch]:  # one request's worth, blocking the loop
+            name(mol)
+            done += 1
+        await asyncio.sleep(0)
+    return done
+
+
+async def _streamed(mols: Sequence[Molecule], executor: Executor, concurrency: int, chunksize: int = 1) -> int:
+    done = 0
+    async for _ in aname_stream(mols, concurrency, executor=executor, chunksize=chunksize):
+        done += 1
+    return done
+
+
+async def _measure(work) -> Dict[str, float]:
+    lags: List[float] = []
+    stop = asyncio.Event()
+    ticker = asyncio.ensure_future(_ticker(lags, stop))
+    t0 = time.perf_counter()
+    done = await work
+    elapsed = time.perf_counter() - t0
+    stop.set()
+    await ticker
+    lags.sort()
+    ms = [v * 1e3 for v in lags] or [0.0]
+    return {
+        "per_s": done / elapsed,
+        "lag_p50_ms": _percentile(ms, 0.5),
+        "lag_p99_ms": _percentile(ms, 0.99),
+        "lag_max_ms": ms[-1],
+    }
+
+
+def run(count: int = 5000, concurrency: int = 8, workers: int = 2, seed: int = 0) -> Dict[str, Dict[str, float]]:
+    """Return per‑mode naming rate and ticker lag; the name cache is off throughout."""
+    mols = load(count, seed)
+    previous = _cache.maxsize
+    _cache.resize(0)
+    try:
+        results = {
+            "inline/1": asyncio.run(_measure(_inline(mols, 1))),
+            "inline/32": asyncio.run(_measure(_inline(mols, 32))),
+        }
+        with ThreadPoolExecutor(workers) as pool:
+            results["threads"] = asyncio.run(_measure(_streamed(mols, pool, concurrency)))
+        with ProcessPoolExecutor(workers) as pool:
+            list(pool.map(name, mols[:workers]))  # start the workers outside the timing
+            results["processes"] = asyncio.run(_measure(_streamed(mols, pool, concurrency)))
+            results["processes/32"] = asyncio.run(_measure(_streamed(mols, pool, concurrency, 32)))
+    finally:
+        _cache.resize(previous)
+    return results
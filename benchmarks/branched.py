@@ -0,0 +1,123 @@
+"""Naming dendrimer‑like molecules whose branched groups repeat.
+
+``python -m chemname.benchmarks branched --count 2000 --generation 2``
+builds dodecanes carrying four identical dendritic arms (every arm carbon
+branches ``--branching`` ways, ``--generation`` levels deep) and names them
+with the name cache off, once with the branched‑group shape table kept
+across molecules and once cleared before every molecule.
+
+``python -m chemname.benchmarks symmetric --generation 4`` names symmetric
+dendrimers (``--arms`` identical arms on one carbon) of every generation up
+to ``--generation``.  All their leaf‑to‑leaf paths through the core are
+longest chains and tie on every seniority rule, so the number of chains
+grows with the square of the leaves while the name should not slow down
+with it.
+"""
+
+from __future__ import annotations
+
+import time
+from typing import Dict, List
+
+from ..core.structures import Molecule
+from ..naming.alkyl import shape_cache_clear
+from ..naming.cache import _cache
+from ..naming.namer import name
+
+CHAIN = 12
+ARM_SITES = (5, 6, 7, 8)  # keeps every arm shorter than the dodecane either side
+
+
+def dendrimer(generation: int = 2, branching: int = 3) -> Molecule:
+    """Dodecane with a dendritic arm of ``generation`` levels on C5–C8."""
+    if not 1 <= branching <= 3:
+        raise ValueError("branching must be 1–3 (carbon valence)")
+    if not 0 <= generation <= 2:
+        raise ValueError("generation must be 0–2 for the dodecane to stay the main chain")
+    symbols = ["C"] * CHAIN
+    edges = [(k, k + 1) for k in range(CHAIN - 1)]
+    for site in ARM_SITES:
+        level = [len(symbols)]
+        symbols.append("C")
+        edges.append((site - 1, level[0]))
+        for _ in range(generation):
+            nxt = []
+            for parent in level:
+                for _ in range(branching):
+                    nxt.append(len(symbols))
+                    symbols.append("C")
+                    edges.append((parent, nxt[-1]))
+            level = nxt
+    return Molecule.from_arrays(symbols, edges, [1] * len(edges), trusted=True)
+
+
+def symmetric_dendrimer(generation: int = 3, branching: int = 3, arms: int = 4) -> Molecule:
+    """One carbon carrying ``arms`` identical dendritic arms ``generation`` levels deep."""
+    if not 1 <= branching <= 3 or not 2 <= arms <= 4:
+        raise ValueError("branching must be 1–3 and arms 2–4 (carbon valence)")
+    symbols = ["C"]
+    edges = []
+    for _ in range(arms):
+        level = [len(symbols)]
+        symbols.append("C")
+        edges.append((0, level[0]))
+        for _ in range(generation):
+            nxt = []
+            for parent in level:
+                for _ in range(branching):
+                    nxt.append(len(symbols))
+                    symbols.append("C")
+                    edges.append((parent, nxt[-1]))
+            level = nxt
+    return Molecule.from_arrays(symbols, edges, [1] * len(edges), trusted=True)
+
+
+def run_symmetric(generation: int = 4, branching: int = 3, arms: int = 4) -> List[Dict[str, float]]:
+    """Seconds per name (cache off) for each generation up to ``generation``."""
+    rows = []
+    saved = _cache.maxsize
+    _cache.resize(0)
+    try:
+        for gen in range(generation + 1):
+            mol = symmetric_dendrimer(gen, branching, arms)
+            leaves = branching**gen
+            t0 = time.perf_counter()
+            name(mol)
+            rows.append(
+                {
+                    "generation": float(gen),
+                    "atoms": float(len(mol)),
+                    "chains": float(arms * (arms - 1) // 2 * leaves * leaves),
+                    "seconds": time.perf_counter() - t0,
+                }
+            )
+    finally:
+        _cache.resize(saved)
+    return rows
+
+
+def run(count: int = 2000, generation: int = 2, branching: int = 3) -> Dict[str, float]:
+    mols = [dendrimer(generation, branching) for _ in range(count)]
+    saved = _cache.maxsize
+    _cache.resize(0)
+    try:
+        t0 = time.perf_counter()
+        for mol in mols:
+            shape_cache_clear()
+            name(mol)
+        cold = time.perf_counter() - t0
+
+        shape_cache_clear()
+        t0 = time.perf_counter()
+        for mol in mols:
+            text = name(mol)
+        warm = time.perf_counter() - t0
+    finally:
+        _cache.resize(saved)
+    return {
+        "atoms": float(len(mols[0])),
+        "cold_per_s": count / cold,
+        "memoised_per_s": count / warm,
+        "speedup": cold / warm,
+        "name": text,
+    }
@@ -0,0 +1,59 @@
+"""Memory of a :class:`MoleculeBatch` against a list of ``Molecule`` objects.
+
+``python -m chemname.benchmarks columnar --count 1000000`` fills a batch
+with ``--count`` benchmark molecules (drawn from a pool of distinct ones)
+and measures the bytes it allocates with tracemalloc.  Tracing a million
+separate molecules would itself need gigabytes, so the list side is
+measured on ``--sample`` freshly built molecules and scaled to ``--count``
+(``--sample`` equal to ``--count`` measures it outright).
+"""
+
+from __future__ import annotations
+
+import random
+import time
+import tracemalloc
+from typing import Callable, Dict, Tuple
+
+from ..core.batch import MoleculeBatch
+from .generator import BASE, make_molecule
+
+
+def _traced(factory: Callable[[], object]) -> Tuple[int, object]:
+    tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        obj = factory()
+        return tracemalloc.get_traced_memory()[0] - before, obj
+    finally:
+        tracemalloc.stop()
+
+
+def run(count: int = 1_000_000, sample: int = 20_000, pool: int = 1000, seed: int = 0) -> Dict[str, float]:
+    rng = random.Random(seed)
+    mols = [make_molecule(rng, **BASE) for _ in range(min(pool, count))]
+
+    def fill() -> MoleculeBatch:
+        batch = MoleculeBatch()
+        for k in range(count):
+            batch.append(mols[k % len(mols)])
+        return batch
+
+    t0 = time.perf_counter()
+    batch_bytes, batch = _traced(fill)
+    fill_s = time.perf_counter() - t0
+
+    sample = min(sample, count)
+    sample_rng = random.Random(seed + 1)
+    list_sample, _ = _traced(lambda: [make_molecule(sample_rng, **BASE) for _ in range(sample)])
+    list_bytes = list_sample / sample * count
+    return {
+        "molecules": float(count),
+        "atoms": float(batch.n_atoms),
+        "batch_mb": batch_bytes / 2**20,
+        "list_mb": list_bytes / 2**20,
+        "batch_bytes_per_atom": batch_bytes / batch.n_atoms,
+        "list_bytes_per_atom": list_bytes / batch.n_atoms,
+        "ratio": list_bytes / batch_bytes,
+        "append_per_s": count / fill_s,
+    }
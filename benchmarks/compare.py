@@ -0,0 +1,84 @@
+"""Flag statistically significant per‑stage slowdowns between two result files."""
+
+from __future__ import annotations
+
+import math
+import statistics
+from typing import List, NamedTuple, Sequence
+
+
+class Regression(NamedTuple):
+    case: str
+    stage: str
+    baseline_us: float
+    current_us: float
+    ratio: float
+    p_value: float
+
+
+def mann_whitney_greater(baseline: Sequence[float], current: Sequence[float]) -> float:
+    """One‑sided Mann–Whitney U p‑value for "``current`` tends to be larger".
+
+    Normal approximation with tie and continuity correction; adequate from
+    about five samples per side.
+    """
+    n1, n2 = len(baseline), len(current)
+    if not n1 or not n2:
+        return 1.0
+    pooled = sorted([(v, 0) for v in baseline] + [(v, 1) for v in current])
+    ranks = [0.0] * len(pooled)
+    ties = 0.0
+    i = 0
+    while i < len(pooled):
+        j = i
+        while j + 1 < len(pooled) and pooled[j + 1][0] == pooled[i][0]:
+            j += 1
+        rank = (i + j) / 2 + 1
+        for k in range(i, j + 1):
+            ranks[k] = rank
+        t = j - i + 1
+        ties += t**3 - t
+        i = j + 1
+    r2 = sum(r for r, (_, side) in zip(ranks, pooled) if side == 1)
+    u = r2 - n2 * (n2 + 1) / 2
+    n = n1 + n2
+    var = n1 * n2 / 12 * ((n + 1) - ties / (n * (n - 1)))
+    if var <= 0:
+        return 1.0
+    z = (u - n1 * n2 / 2 - 0.5) / math.sqrt(var)
+    return 0.5 * math.erfc(z / math.sqrt(2))
+
+
+def compare(baseline: dict, current: dict, alpha: float = 0.01, threshold: float = 0.05) -> List[Regression]:
+    """Return every (case, stage) that is both significantly and materially slower.
+
+    A slowdown must have a p‑value below ``alpha`` *and* a median ratio above
+    ``1 + threshold``; cases missing from either document are ignored.
+    """
+    regressions = []
+    for case, cur in current["results"].items():
+        base = baseline["results"].get(case)
+        if base is None:
+            continue
+        for stage, cur_stage in cur["stages"].items():
+            base_stage = base["stages"].get(stage)
+            if base_stage is None:
+                continue
+            b, c = base_stage["samples_us"], cur_stage["samples_us"]
+            b_med, c_med = statistics.median(b), statistics.median(c)
+            ratio = c_med / b_med if b_med else float("inf")
+            p = mann_whitney_greater(b, c)
+            if p < alpha and ratio > 1 + threshold:
+                regressions.append(Regression(case, stage, b_med, c_med, ratio, p))
+    return regressions
+
+
+def format_regressions(regressions: List[Regression]) -> str:
+    if not regressions:
+        return "no significant slowdowns"
+    lines = [f"{'case':<20} {'stage':<13} {'base µs':>9} {'now µs':>9} {'ratio':>6} {'p':>8}"]
+    for r in regressions:
+        lines.append(
+            f"{r.case:<20} {r.stage:<13} {r.baseline_us:9.2f} {r.current_us:9.2f} {r.ratio:6.2f} {r.p_value:8.1e}"
+        )
+    return "\n".join(lines)
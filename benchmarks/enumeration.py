@@ -0,0 +1,47 @@
+"""Generation rate of :func:`chemname.enumerate.isomers`, optionally naming each isomer.
+
+``python -m chemname.benchmarks enumerate --max-carbons 9 --halogens F,Cl
+--max-halogens 2`` reports how many isomers were produced and how fast,
+and with ``--name`` the rate of naming them too (failures are counted:
+the enumerator covers more than the namer supports).
+"""
+
+from __future__ import annotations
+
+import time
+from typing import Callable, Dict, Sequence
+
+from ..enumerate import EnumerationStats, isomers
+from ..naming.namer import name
+
+
+def run(
+    max_carbons: int,
+    halogens: Sequence[str] = (),
+    max_halogens: int = 0,
+    max_multiple_bonds: int = 0,
+    shard: int = 0,
+    of: int = 1,
+    with_names: bool = False,
+    progress: Callable[[EnumerationStats], None] | None = None,
+) -> Dict[str, float]:
+    stream = isomers(
+        max_carbons,
+        halogens=halogens,
+        max_halogens=max_halogens,
+        max_multiple_bonds=max_multiple_bonds,
+        shard=shard,
+        of=of,
+        progress=progress,
+    )
+    count = failed = 0
+    t0 = time.perf_counter()
+    for mol in stream:
+        count += 1
+        if with_names:
+            try:
+                name(mol)
+            except (KeyError, ValueError):
+                failed += 1
+    elapsed = time.perf_counter() - t0
+    return {"isomers": count, "per_s": count / elapsed if elapsed else float("inf"), "name_failures": failed}
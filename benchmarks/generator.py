@@ -0,0 +1,65 @@
+"""Deterministic molecule generator for the benchmark sweeps."""
+
+from __future__ import annotations
+
+import random
+from typing import Dict, List, Tuple
+
+from ..core.structures import Molecule
+
+HALOGENS = ("F", "Cl", "Br", "I")
+
+# every sweep varies one axis and keeps the others at BASE
+AXES: Dict[str, Tuple[int, ...]] = {
+    "chain_length": (2, 4, 8, 12),
+    "substituents": (0, 1, 2, 4, 8),
+    "unsaturations": (0, 1, 2, 3),
+    "alkyl_size": (1, 2, 3, 4),
+}
+BASE = {"chain_length": 8, "substituents": 2, "unsaturations": 0, "alkyl_size": 0}
+# alkyl fragments need room on both sides so they never extend the chain
+ALKYL_BASE = {"chain_length": 12, "substituents": 2}
+
+
+def make_molecule(
+    rng: random.Random,
+    chain_length: int,
+    substituents: int = 0,
+    unsaturations: int = 0,
+    alkyl_size: int = 0,
+) -> Molecule:
+    """Straight chain with ``unsaturations`` multiple bonds of one kind and
+    ``substituents`` halogens (or alkyl fragments of ``alkyl_size`` carbons)."""
+    m = Molecule()
+    for i in range(chain_length):
+        m.add_atom("C", i)
+    bonds = rng.sample(range(chain_length - 1), min(unsaturations, chain_length - 1))
+    order = rng.choice((2, 3))
+    for i in range(chain_length - 1):
+        m.add_bond(i, i + 1, order if i in bonds else 1)
+
+    idx = chain_length
+    alkyl_sites = range(alkyl_size, chain_length - alkyl_size)
+    for _ in range(substituents):
+        if alkyl_size and len(alkyl_sites):
+            prev = rng.choice(alkyl_sites)
+            for _ in range(alkyl_size):
+                m.add_atom("C", idx)
+                m.add_bond(prev, idx)
+                prev = idx
+                idx += 1
+        else:
+            m.add_atom(rng.choice(HALOGENS), idx)
+            m.add_bond(rng.randrange(chain_length), idx)
+            idx += 1
+    return m
+
+
+def corpus(axis: str, value: int, count: int, seed: int = 0) -> List[Molecule]:
+    """Return ``count`` molecules for one point of a sweep (same seed → same corpus)."""
+    params = dict(BASE)
+    if axis == "alkyl_size":
+        params.update(ALKYL_BASE)
+    params[axis] = value
+    rng = random.Random(f"{axis}={value}/{seed}")
+    return [make_molecule(rng, **params) for _ in range(count)]
@@ -0,0 +1,64 @@
+"""Round trip ``name(parse(s)) == s`` at volume.
+
+``python -m chemname.benchmarks roundtrip --count 1000000`` names a
+generated corpus once, then parses (and re‑names) ``count`` names cycled
+from it, reporting parse and round‑trip rates and every mismatch.  The generator
+does not respect valence, so names are parsed with ``strict=False``.
+"""
+
+from __future__ import annotations
+
+import random
+import time
+from itertools import islice, cycle
+from typing import Dict, List
+
+from ..naming.namer import name
+from ..naming.parser import parse
+from .generator import make_molecule
+
+
+def name_corpus(distinct: int, seed: int = 0) -> List[str]:
+    """Up to ``distinct`` different names produced by ``name()``."""
+    rng = random.Random(seed)
+    names: Dict[str, None] = {}
+    for _ in range(distinct * 4):
+        mol = make_molecule(
+            rng,
+            rng.randint(1, 12),
+            substituents=rng.randint(0, 4),
+            unsaturations=rng.randint(0, 3),
+            alkyl_size=rng.choice((0, 0, 1, 2, 3)),
+        )
+        try:
+            names[name(mol)] = None
+        except (KeyError, ValueError):  # outside what the namer supports
+            continue
+        if len(names) >= distinct:
+            break
+    return list(names)
+
+
+def run(count: int = 1_000_000, distinct: int = 20_000, seed: int = 0) -> dict:
+    names = name_corpus(distinct, seed)
+    stream = list(islice(cycle(names), count))
+
+    t0 = time.perf_counter()
+    for s in stream:
+        parse(s, strict=False)
+    parse_rate = count / (time.perf_counter() - t0)
+
+    t0 = time.perf_counter()
+    for s in stream:
+        name(parse(s, strict=False))
+    roundtrip_rate = count / (time.perf_counter() - t0)
+
+    mismatches = {s: name(parse(s, strict=False)) for s in names}
+    mismatches = {s: back for s, back in mismatches.items() if back != s}
+    return {
+        "names": count,
+        "distinct": len(names),
+        "parse_per_s": parse_rate,
+        "roundtrip_per_s": roundtrip_rate,
+        "mismatches": mismatches,
+    }
@@ -0,0 +1,152 @@
+"""Measure per‑stage throughput and latency percentiles across the sweeps."""
+
+from __future__ import annotations
+
+import platform
+import statistics
+import time
+from typing import Callable, Dict, List, Sequence
+
+from .. import __version__
+from ..core.structures import Molecule
+from ..naming.assembler import alphabetic_key, assemble_name
+from ..naming.cache import _cache
+from ..naming.namer import _choose_chain, _convert_locs, _unsaturations, name
+from ..naming.seniority import keeps_direction
+from ..naming.substituents import get_all_substituents
+from .generator import AXES, corpus
+
+SCHEMA = 1
+STAGES = ("chain", "substituents", "orientation", "assemble", "name")
+
+
+def _prepare(mols: Sequence[Molecule]) -> List[dict]:
+    """Precompute each stage's inputs so stages can be timed in isolation."""
+    out = []
+    for m in mols:
+        g = m.freeze()
+        chain = _choose_chain(g)
+        unsat_type, unsat = _unsaturations(g, chain)
+        subs = get_all_substituents(chain, g)
+        length = len(chain)
+        forward = keeps_direction(length, unsat, subs)
+        if not forward:
+            unsat = _convert_locs(unsat, length, False)
+            subs = {k: sorted(_convert_locs(v, length, False)) for k, v in subs.items()}
+        subs_list = sorted(subs.items(), key=lambda kv: alphabetic_key(kv[0]))
+        out.append(
+            {
+                "mol": m,
+                "g": g,
+                "chain": chain,
+                "length": length,
+                "unsat_type": unsat_type,
+                "unsat": sorted(unsat),
+                "subs": subs,
+                "subs_list": subs_list,
+            }
+        )
+    return out
+
+
+_STAGE_CALLS: Dict[str, Callable[[dict], object]] = {
+    "chain": lambda p: _choose_chain(p["g"]),
+    "substituents": lambda p: get_all_substituents(p["chain"], p["g"]),
+    "orientation": lambda p: keeps_direction(p["length"], p["unsat"], p["subs"]),
+    "assemble": lambda p: assemble_name(p["length"], p["unsat_type"], p["unsat"], p["subs_list"]),
+    "name": lambda p: name(p["mol"]),
+}
+
+
+def _percentile(sorted_values: Sequence[float], q: float) -> float:
+    k = (len(sorted_values) - 1) * q
+    lo = int(k)
+    hi = min(lo + 1, len(sorted_values) - 1)
+    return sorted_values[lo] + (sorted_values[hi] - sorted_values[lo]) * (k - lo)
+
+
+def measure(mols: Sequence[Molecule], repeats: int) -> dict:
+    """Time every stage ``repeats`` times (µs per molecule) plus name() latencies."""
+    prepared = _prepare(mols)
+    n = len(prepared)
+    stages = {}
+    for stage in STAGES:
+        call = _STAGE_CALLS[stage]
+        samples = []
+        for _ in range(repeats):
+            t0 = time.perf_counter()
+            for p in prepared:
+                call(p)
+            samples.append((time.perf_counter() - t0) / n * 1e6)
+        median = statistics.median(samples)
+        stages[stage] = {
+            "samples_us": samples,
+            "median_us": median,
+            "throughput_per_s": 1e6 / median if median else float("inf"),
+        }
+
+    latencies = []
+    for p in prepared:
+        t0 = time.perf_counter()
+        name(p["mol"])
+        latencies.append((time.perf_counter() - t0) * 1e6)
+    latencies.sort()
+    return {
+        "count": n,
+        "stages": stages,
+        "latency_us": {f"p{int(q * 100)}": _percentile(latencies, q) for q in (0.5, 0.9, 0.99)},
+    }
+
+
+def run_suite(
+    count: int = 500,
+    repeats: int = 7,
+    axes: Dict[str, Sequence[int]] | None = None,
+    seed: int = 0,
+    progress: Callable[[str], None] | None = None,
+) -> dict:
+    """Run every sweep and return a JSON‑serialisable result document.
+
+    The name cache is disabled for the duration so that repeats measure work,
+    not look‑ups.
+    """
+    axes = AXES if axes is None else axes
+    previous = _cache.maxsize
+    _cache.resize(0)
+    try:
+        results = {}
+        for axis, values in axes.items():
+            for value in values:
+                case = f"{axis}={value}"
+                results[case] = {"axis": axis, "value": value, **measure(corpus(axis, value, count, seed), repeats)}
+                if progress is not None:
+                    progress(case)
+    finally:
+        _cache.resize(previous)
+    return {
+        "schema": SCHEMA,
+        "meta": {
+            "chemname": __version__,
+            "python": platform.python_version(),
+            "machine": platform.machine(),
+            "count": count,
+            "repeats": repeats,
+            "seed": seed,
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        },
+        "results": results,
+    }
+
+
+def format_curves(doc: dict) -> str:
+    """Render one scaling table per axis: median µs/molecule per stage."""
+    lines = []
+    by_axis: Dict[str, List[dict]] = {}
+    for res in doc["results"].values():
+        by_axis.setdefault(res["axis"], []).append(res)
+    for axis, rows in by_axis.items():
+        lines.append(f"\n{axis:>14} " + " ".join(f"{s:>12}" for s in STAGES) + f" {'p99 name':>10}")
+        for row in sorted(rows, key=lambda r: r["value"]):
+            cells = " ".join(f"{row['stages'][s]['median_us']:12.2f}" for s in STAGES)
+            lines.append(f"{row['value']:>14} {cells} {row['latency_us']['p99']:10.2f}")
+    return "\n".join(lines)
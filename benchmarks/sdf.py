@@ -0,0 +1,93 @@
+"""SDF reading rates, serial and split into byte ranges across processes.
+
+``python -m chemname.benchmarks sdf --count 20000 --workers 2`` writes
+``--count`` benchmark molecules to a temporary V2000 SD file, then times
+:func:`~chemname.formats.sdf.read_sdf` building ``Molecule`` objects and
+frozen graphs, and naming the file serially against ``--workers``
+processes that each read one :func:`~chemname.formats.sdf.sdf_ranges` range.
+"""
+
+from __future__ import annotations
+
+import os
+import random
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Mapping, Tuple
+
+from ..core.structures import Molecule
+from ..formats.sdf import read_sdf, sdf_ranges
+from ..naming.namer import name
+from .generator import BASE, make_molecule
+
+
+def molblock(mol: Molecule, title: str = "", properties: Mapping[str, str] | None = None) -> str:
+    """One V2000 SD record (ending in ``$$$$``) for ``mol``; coordinates are zero."""
+    g = mol.freeze()
+    edges = list(g.edges())
+    lines = [title, "  chemname", "", f"{len(g):3d}{len(edges):3d}  0  0  0  0  0  0  0  0999 V2000"]
+    for p in range(len(g)):
+        lines.append(f"    0.0000    0.0000    0.0000 {g.symbol(p):<3} 0  0  0  0  0  0  0  0  0  0  0  0")
+    for p, q, code in edges:
+        lines.append(f"{p + 1:3d}{q + 1:3d}{code:3d}  0  0  0  0")  # order codes 1–4 are the MDL types
+    charged = [(p + 1, c) for p, c in enumerate(g.charges) if c]
+    isotopes = [(p + 1, m) for p, m in enumerate(g.isotopes) if m]
+    for tag, pairs in (("CHG", charged), ("ISO", isotopes)):
+        for k in range(0, len(pairs), 8):
+            chunk = pairs[k : k + 8]
+            lines.append(f"M  {tag}{len(chunk):3d}" + "".join(f" {a:3d} {v:3d}" for a, v in chunk))
+    lines.append("M  END")
+    for key, value in (properties or {}).items():
+        lines += [f"> <{key}>", value, ""]
+    lines.append("$$$$")
+    return "\n".join(lines) + "\n"
+
+
+def _name_range(path: str, start: int, end: int) -> List[Tuple[str, str]]:
+    return [(record.title, name(record)) for record in read_sdf(path, start, end)]
+
+
+def run(count: int = 20_000, workers: int = 2, seed: int = 0) -> Dict[str, float]:
+    rng = random.Random(seed)
+    fd, path = tempfile.mkstemp(suffix=".sdf")
+    try:
+        with os.fdopen(fd, "w") as fh:
+            for k in range(count):
+                fh.write(molblock(make_molecule(rng, **BASE), f"mol{k}", {"ID": str(k)}))
+        size = os.path.getsize(path)
+
+        t0 = time.perf_counter()
+        for record in read_sdf(path):
+            record.to_molecule()
+        molecule_s = time.perf_counter() - t0
+
+        t0 = time.perf_counter()
+        for record in read_sdf(path):
+            record.freeze()
+        frozen_s = time.perf_counter() - t0
+
+        t0 = time.perf_counter()
+        serial = _name_range(path, 0, size)
+        serial_s = time.perf_counter() - t0
+
+        t0 = time.perf_counter()
+        ranges = sdf_ranges(path, workers)
+        with ProcessPoolExecutor(workers) as pool:
+            split = [pair for part in pool.map(_name_range, [path] * len(ranges), *zip(*ranges)) for pair in part]
+        split_s = time.perf_counter() - t0
+    finally:
+        os.unlink(path)
+
+    if split != serial:
+        raise AssertionError("range readers disagree with the serial reader")
+    return {
+        "records": float(count),
+        "file_mb": size / 2**20,
+        "molecules_per_s": count / molecule_s,
+        "frozen_per_s": count / frozen_s,
+        "read_mb_per_s": size / 2**20 / frozen_s,
+        "named_per_s": count / serial_s,
+        "named_split_per_s": count / split_s,
+        "split_speedup": serial_s / split_s,
+    }
@@ -0,0 +1,39 @@
+"""Shared‑memory transport against a pickled process pool.
+
+``python -m chemname.benchmarks shared --count 50000 --workers 2`` names
+the same small benchmark molecules with ``name_many`` (molecules pickled to
+a ``ProcessPoolExecutor``) and with ``name_shared`` (one packed batch in
+shared memory, index ranges out, names back through a shared string
+table).  The shared timing includes packing the batch.
+"""
+
+from __future__ import annotations
+
+import random
+import time
+from typing import Dict
+
+from ..naming.batch import name_many
+from ..naming.shared import name_shared
+from .generator import BASE, make_molecule
+
+
+def run(count: int = 50_000, workers: int = 2, chunksize: int = 1024, seed: int = 0) -> Dict[str, float]:
+    rng = random.Random(seed)
+    mols = [make_molecule(rng, **BASE) for _ in range(count)]
+
+    t0 = time.perf_counter()
+    pickled = [r.name for r in name_many(mols, workers, chunksize)]
+    pickled_s = time.perf_counter() - t0
+
+    t0 = time.perf_counter()
+    shared = [r.name for r in name_shared(mols, workers, chunksize)]
+    shared_s = time.perf_counter() - t0
+
+    if shared != pickled:
+        raise AssertionError("shared‑memory names differ from the pickled pool's")
+    return {
+        "pickled_per_s": count / pickled_s,
+        "shared_per_s": count / shared_s,
+        "speedup": pickled_s / shared_s,
+    }
@@ -0,0 +1,80 @@
+"""Cold start: import cost and first‑name latency in fresh interpreters.
+
+``python -m chemname.benchmarks startup --runs 20`` starts a new Python
+process per run and reports, as medians, the bare interpreter start, the
+wall time of ``import chemname`` and of the first ``name()`` call after it
+(which pays for the modules naming needs), and the total against the bare
+interpreter.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+from typing import Dict, List
+
+_PROBE = """
+import time
+t0 = time.perf_counter()
+import chemname
+t1 = time.perf_counter()
+mol = chemname.Molecule.from_arrays(["C"] * 5, [(0, 1), (1, 2), (2, 3), (1, 4)], [1] * 4)
+chemname.name(mol)
+t2 = time.perf_counter()
+print((t1 - t0) * 1e3, (t2 - t1) * 1e3)
+"""
+
+
+def _spawn(*args: str) -> subprocess.CompletedProcess:
+    env = dict(os.environ)
+    # make the package importable whatever the caller's cwd
+    parent = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    env["PYTHONPATH"] = os.pathsep.join(filter(None, [parent, env.get("PYTHONPATH")]))
+    return subprocess.run([sys.executable, *args], check=True, capture_output=True, text=True, env=env)
+
+
+def run(runs: int = 20) -> Dict[str, float]:
+    bare: List[float] = []
+    total: List[float] = []
+    imports: List[float] = []
+    first: List[float] = []
+    for _ in range(runs):
+        t0 = time.perf_counter()
+        _spawn("-c", "pass")
+        bare.append((time.perf_counter() - t0) * 1e3)
+        t0 = time.perf_counter()
+        out = _spawn("-c", _PROBE).stdout
+        total.append((time.perf_counter() - t0) * 1e3)
+        imp, nm = map(float, out.split())
+        imports.append(imp)
+        first.append(nm)
+    return {
+        "interpreter_ms": statistics.median(bare),
+        "import_ms": statistics.median(imports),
+        "first_name_ms": statistics.median(first),
+        "process_ms": statistics.median(total),
+        "overhead_ms": statistics.median(total) - statistics.median(bare),
+    }
+
+
+def import_profile() -> Dict[str, int]:
+    """Cumulative microseconds per module for ``import chemname`` (``-X importtime``)."""
+    err = _spawn("-X", "importtime", "-c", "import chemname").stderr
+    out: Dict[str, int] = {}
+    for line in err.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, cumulative, module = line.split("|")
+        try:
+            out[module.strip()] = int(cumulative)
+        except ValueError:  # the header line
+            continue
+    return out
+
+
+if __name__ == "__main__":  # pragma: no cover
+    json.dump(run(), sys.stdout, indent=1)
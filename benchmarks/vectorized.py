@@ -0,0 +1,96 @@
+"""Throughput of the NumPy straight‑chain engine against per‑molecule ``name()``.
+
+``python -m chemname.benchmarks vectorized --count 1000000`` generates a
+padded batch directly (no Molecule objects), names it in chunks with
+:func:`~chemname.naming.vectorized.name_padded` and compares the rate with
+``name()`` on a sample of the same molecules, cache on and off.
+"""
+
+from __future__ import annotations
+
+import time
+from typing import Dict
+
+import numpy as np
+
+from ..core.structures import Molecule
+from ..naming.cache import _cache
+from ..naming.namer import name
+from ..naming.vectorized import MAX_CHAIN, PaddedBatch, name_padded
+from ..util import ATOMIC_NUMBERS, ELEMENTS
+
+MAX_HALOGENS = 4
+MAX_UNSATURATIONS = 3
+_HALOGEN_CODES = np.array([ATOMIC_NUMBERS[s] for s in ("F", "Cl", "Br", "I")], dtype=np.int16)
+
+
+def random_batch(count: int, seed: int = 0) -> PaddedBatch:
+    """Straight chains of 1–12 carbons, up to three multiple bonds of one kind
+    and up to four halogens; carbons come first, numbered along the chain."""
+    rng = np.random.default_rng(seed)
+    width = MAX_CHAIN + MAX_HALOGENS
+    length = rng.integers(1, MAX_CHAIN + 1, count)
+
+    cols = np.arange(width)
+    elements = np.full((count, width), -1, dtype=np.int16)
+    elements[cols < length[:, None]] = 6
+    neighbours = np.full((count, width, 2 + MAX_HALOGENS), -1, dtype=np.int16)
+    orders = np.zeros((count, width, 2 + MAX_HALOGENS), dtype=np.int8)
+
+    # backbone: slot 0 → previous carbon, slot 1 → next carbon
+    bond = np.arange(MAX_CHAIN - 1)
+    real = bond < (length - 1)[:, None]
+    wanted = rng.integers(0, MAX_UNSATURATIONS + 1, count)[:, None]
+    keys = np.where(real, rng.random((count, MAX_CHAIN - 1)), 2.0)
+    unsat = keys.argsort(axis=1).argsort(axis=1) < np.minimum(wanted, (length - 1)[:, None])
+    code = np.where(unsat, rng.integers(2, 4, count)[:, None], 1)
+    r, t = np.nonzero(real)
+    neighbours[r, t, 1] = t + 1
+    neighbours[r, t + 1, 0] = t
+    orders[r, t, 1] = orders[r, t + 1, 0] = code[r, t]
+
+    # halogens after the carbons, each on a random carbon (slot 2 + j)
+    halogens = rng.integers(0, MAX_HALOGENS + 1, count)
+    r, j = np.nonzero(np.arange(MAX_HALOGENS) < halogens[:, None])
+    atom = length[r] + j
+    carbon = (rng.random(len(r)) * length[r]).astype(np.int64)
+    elements[r, atom] = _HALOGEN_CODES[rng.integers(0, len(_HALOGEN_CODES), len(r))]
+    neighbours[r, atom, 0] = carbon
+    neighbours[r, carbon, 2 + j] = atom
+    orders[r, atom, 0] = orders[r, carbon, 2 + j] = 1
+    return PaddedBatch(elements, neighbours, orders)
+
+
+def to_molecule(batch: PaddedBatch, row: int) -> Molecule:
+    """Rebuild one padded row as a :class:`Molecule` (for the reference timings)."""
+    elements = batch.elements[row]
+    n = int((elements >= 0).sum())
+    nb, orders = batch.neighbours[row], batch.orders[row]
+    p, k = np.nonzero(nb[:n] > np.arange(n)[:, None])  # each bond once, from its lower end
+    edges = list(zip(p.tolist(), nb[p, k].tolist()))
+    return Molecule.from_arrays([ELEMENTS[z] for z in elements[:n].tolist()], edges, orders[p, k].tolist())
+
+
+def run(count: int = 1_000_000, sample: int = 20_000, chunk: int = 100_000, seed: int = 0) -> Dict[str, float]:
+    """Return molecules per second for each engine."""
+    batch = random_batch(count, seed)
+    t0 = time.perf_counter()
+    named = 0
+    for start in range(0, count, chunk):
+        named += sum(x is not None for x in name_padded(batch[start : start + chunk]))
+    vectorized = count / (time.perf_counter() - t0)
+
+    mols = [to_molecule(batch, i) for i in range(min(sample, count))]
+    rates = {"vectorized_per_s": vectorized, "vectorized_named": named / count}
+    previous = _cache.maxsize
+    try:
+        for label, size in (("name_cached_per_s", previous or 4096), ("name_uncached_per_s", 0)):
+            _cache.resize(size)
+            _cache.clear()
+            t0 = time.perf_counter()
+            for m in mols:
+                name(m)
+            rates[label] = len(mols) / (time.perf_counter() - t0)
+    finally:
+        _cache.resize(previous)
+    return rates
@@ -0,0 +1,105 @@
+"""Command‑line entry point: stream SMILES in, ``smiles<TAB>name`` out."""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+from collections import deque
+from typing import IO, Deque, Iterator, List, Sequence
+
+from .formats.smiles import parse_smiles
+from .naming.batch import NameResult, _Chunk, _stored, _stream
+from .naming.namer import name
+
+
+def _name_smiles_chunk(chunk: _Chunk) -> List[NameResult]:
+    """Worker: parse and name one chunk of SMILES strings."""
+    out: List[NameResult] = []
+    for i, smiles in chunk:
+        try:
+            out.append(NameResult(i, name(parse_smiles(smiles))))
+        except Exception as exc:  # noqa: BLE001 – reported per line
+            out.append(NameResult(i, error=exc))
+    return out
+
+
+def _build_parser() -> argparse.ArgumentParser:
+    p = argparse.ArgumentParser(
+        prog="python -m chemname",
+        description="Name acyclic molecules given as SMILES, one per line.",
+    )
+    p.add_argument("input", nargs="?", default="-", help="SMILES file (default: stdin)")
+    p.add_argument("--format", choices=("tsv", "jsonl"), default="tsv", help="output format")
+    p.add_argument(
+        "--on-error",
+        choices=("record", "skip", "fail"),
+        default="record",
+        help="record bad lines in the output, drop them, or stop (exit 1)",
+    )
+    p.add_argument("--rejects", metavar="FILE", help="also copy bad input lines to FILE")
+    p.add_argument("--buffer", type=int, default=1024, metavar="N", help="flush output every N lines (0 = every line)")
+    p.add_argument("-j", "--workers", type=int, default=1, help="worker processes (default: 1)")
+    p.add_argument("--chunksize", type=int, default=512, help="lines per worker task")
+    p.add_argument("--store", metavar="DB", help="persistent name store (SQLite) to read and add to")
+    return p
+
+
+def _smiles_lines(stream: IO[str], seen: Deque[str]) -> Iterator[str]:
+    """Yield the first token of every non‑blank line, remembering it in ``seen``."""
+    for line in stream:
+        token = line.split(None, 1)[0] if line.strip() else ""
+        if token:
+            seen.append(token)
+            yield token
+
+
+def _format(fmt: str, smiles: str, result: NameResult) -> str:
+    error = None if result.ok else f"{type(result.error).__name__}: {result.error}"
+    if fmt == "jsonl":
+        record = {"smiles": smiles, "name": result.name}
+        if error is not None:
+            record["error"] = error
+        return json.dumps(record, ensure_ascii=False) + "\n"
+    if error is not None:
+        return f"{smiles}\t\t{error}\n"
+    return f"{smiles}\t{result.name}\n"
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    args = _build_parser().parse_args(argv)
+    src = sys.stdin if args.input == "-" else open(args.input, encoding="utf-8")
+    rejects = open(args.rejects, "w", encoding="utf-8") if args.rejects else None
+    out = sys.stdout
+    buf: List[str] = []
+    status = 0
+    seen: Deque[str] = deque()  # input lines still in flight (bounded by the pool)
+    try:
+        results = _stream(
+            _smiles_lines(src, seen), _stored(_name_smiles_chunk, args.store), args.workers, args.chunksize, True, None
+        )
+        for result in results:
+            smiles = seen.popleft()
+            if not result.ok:
+                if rejects is not None:
+                    rejects.write(smiles + "\n")
+                if args.on_error == "fail":
+                    print(f"error: record {result.index + 1} ({smiles}): {result.error}", file=sys.stderr)
+                    status = 1
+                    break
+                if args.on_error == "skip":
+                    continue
+            buf.append(_format(args.format, smiles, result))
+            if len(buf) >= max(args.buffer, 1):
+                out.write("".join(buf))
+                out.flush()
+                buf.clear()
+    finally:
+        if buf:
+            out.write("".join(buf))
+            out.flush()
+        if src is not sys.stdin:
+            src.close()
+        if rejects is not None:
+            rejects.close()
+    return status
@@ -1,3 +1,6 @@
 """Core graph data structures for chemname."""
+from .batch import MoleculeBatch, MoleculeView  # noqa: F401
+from .frozen import FrozenMolecule  # noqa: F401
+from .rings import RingInfo, ring_info  # noqa: F401
 from .structures import Atom, Bond, Molecule  # noqa: F401
 
@@ -0,0 +1,359 @@
+"""Columnar storage for many molecules in a handful of flat arrays.
+
+A batch packs into one flat buffer (native byte order, for sharing between
+processes on one host, e.g. through ``multiprocessing.shared_memory``)::
+
+    header   "CNMB" version:u16 reserved:u16 molecules:u64 atoms:u64 bonds:u64 extra:u64
+    atom_offsets i64[molecules + 1]   bond_offsets i64[molecules + 1]
+    elements u16[atoms]   isotopes u16[atoms]   charges i8[atoms]
+    bond_a u32[bonds]     bond_b u32[bonds]     orders u8[bonds]
+    extra symbols (UTF‑8, NUL separated)
+
+Every section starts 8‑byte aligned.
+"""
+
+from __future__ import annotations
+
+import struct
+from array import array
+from typing import Dict, Iterable, Iterator, Sequence, Tuple
+
+from ..util import BOND_ORDERS, ELEMENTS
+from .exceptions import BinaryFormatError
+from .frozen import FrozenMolecule, _element_code, _order_code
+from .structures import Molecule
+
+BATCH_MAGIC = b"CNMB"
+BATCH_VERSION = 1
+_HEADER = struct.Struct("<4sHHQQQQ")
+# packed column order: (attribute, typecode, count field)
+_COLUMNS = (
+    ("atom_offsets", "q", "molecules"),
+    ("bond_offsets", "q", "molecules"),
+    ("elements", "H", "atoms"),
+    ("isotopes", "H", "atoms"),
+    ("charges", "b", "atoms"),
+    ("bond_a", "I", "bonds"),
+    ("bond_b", "I", "bonds"),
+    ("orders", "B", "bonds"),
+)
+
+
+class MoleculeBatch:
+    """Append‑only table of molecules kept as shared flat arrays.
+
+    Molecule ``k`` owns atoms ``atom_offsets[k]:atom_offsets[k + 1]`` of
+    ``elements``/``charges``/``isotopes`` and bonds
+    ``bond_offsets[k]:bond_offsets[k + 1]`` of ``bond_a``/``bond_b``/
+    ``orders``; bond endpoints are atom positions within the molecule.
+    Elements and orders use the codes of :class:`FrozenMolecule`, with one
+    table of ``extra_symbols`` for the whole batch.  Original atom indices
+    are not kept: atoms are stored in ascending index order, as
+    :meth:`Molecule.freeze` numbers them.
+
+    ``batch[k]`` is a :class:`MoleculeView`, a two‑field handle that copies
+    nothing until it is frozen or converted.  :meth:`from_buffer` gives a
+    read‑only batch whose columns are views into a packed buffer.
+    """
+
+    __slots__ = (
+        "elements",
+        "charges",
+        "isotopes",
+        "bond_a",
+        "bond_b",
+        "orders",
+        "atom_offsets",
+        "bond_offsets",
+        "_extra",
+    )
+
+    def __init__(self, molecules: Iterable[Molecule | FrozenMolecule] = ()) -> None:
+        self.elements = array("H")
+        self.charges = array("b")
+        self.isotopes = array("H")
+        self.bond_a = array("I")
+        self.bond_b = array("I")
+        self.orders = array("B")
+        self.atom_offsets = array("q", [0])
+        self.bond_offsets = array("q", [0])
+        self._extra: Dict[str, int] = {}
+        self.extend(molecules)
+
+    # ------------------------------------------------------------ appending
+    def append(self, mol: Molecule | FrozenMolecule) -> None:
+        """Add one molecule (frozen first; the snapshot is not kept)."""
+        self._check_writable()
+        g = mol.freeze()
+        if g.extra_symbols:
+            extra = self._extra
+            self.elements.extend(
+                _element_code(g.element_symbol(code), extra) for code in g.elements
+            )
+        else:
+            self.elements.extend(g.elements)
+        self.charges.extend(g.charges)
+        self.isotopes.extend(g.isotopes)
+        for p, q, order in g.edges():
+            self.bond_a.append(p)
+            self.bond_b.append(q)
+            self.orders.append(order)
+        self._close()
+
+    def append_arrays(
+        self,
+        symbols: Sequence[str],
+        edges: Sequence[Tuple[int, int]],
+        orders: Sequence[int | str] | None = None,
+        *,
+        charges: Sequence[int] | None = None,
+        isotopes: Sequence[int | None] | None = None,
+    ) -> None:
+        """Add a molecule given as :meth:`Molecule.from_arrays` input (positions
+        ``0…n‑1``) without building it first."""
+        self._check_writable()
+        n = len(symbols)
+        if orders is None:
+            orders = [1] * len(edges)
+        for label, arr, expected in (
+            ("orders", orders, len(edges)),
+            ("charges", charges, n),
+            ("isotopes", isotopes, n),
+        ):
+            if arr is not None and len(arr) != expected:
+                raise ValueError(f"{label} has length {len(arr)}, expected {expected}")
+        seen = set()
+        for i, j in edges:
+            if not (0 <= i < n and 0 <= j < n) or i == j:
+                raise ValueError(f"Bad bond {i}-{j} for a molecule of {n} atoms")
+            key = (i, j) if i < j else (j, i)
+            if key in seen:
+                raise ValueError(f"Bond between {i} and {j} given twice")
+            seen.add(key)
+        # convert (and range‑check) everything before touching the columns
+        codes = [_order_code(o) for o in orders]
+        try:
+            charge_col = array("b", charges if charges is not None else bytes(n))
+        except OverflowError:
+            raise ValueError("charges must lie in -128…127") from None
+        try:
+            isotope_col = array("H", [i or 0 for i in isotopes] if isotopes is not None else bytes(2 * n))
+        except OverflowError:
+            raise ValueError("isotopes must lie in 0…65535") from None
+
+        extra = self._extra
+        self.elements.extend(_element_code(s, extra) for s in symbols)
+        self.charges.extend(charge_col)
+        self.isotopes.extend(isotope_col)
+        self.bond_a.extend(i for i, _ in edges)
+        self.bond_b.extend(j for _, j in edges)
+        self.orders.extend(codes)
+        self._close()
+
+    def extend(self, molecules: Iterable[Molecule | FrozenMolecule]) -> None:
+        for mol in molecules:
+            self.append(mol)
+
+    def _check_writable(self) -> None:
+        if isinstance(self.elements, memoryview):
+            raise TypeError("MoleculeBatch over a buffer is read‑only")
+
+    def _close(self) -> None:
+        self.atom_offsets.append(len(self.elements))
+        self.bond_offsets.append(len(self.orders))
+
+    # -------------------------------------------------------------- queries
+    def __len__(self) -> int:
+        return len(self.atom_offsets) - 1
+
+    def __getitem__(self, k: int) -> "MoleculeView":
+        n = len(self)
+        if k < 0:
+            k += n
+        if not 0 <= k < n:
+            raise IndexError("MoleculeBatch index out of range")
+        return MoleculeView(self, k)
+
+    def __iter__(self) -> Iterator["MoleculeView"]:
+        return (MoleculeView(self, k) for k in range(len(self)))
+
+    @property
+    def extra_symbols(self) -> Tuple[str, ...]:
+        return tuple(self._extra)
+
+    @property
+    def n_atoms(self) -> int:
+        return len(self.elements)
+
+    @property
+    def n_bonds(self) -> int:
+        return len(self.orders)
+
+    @property
+    def nbytes(self) -> int:
+        """Bytes held by the arrays (excluding over‑allocation)."""
+        arrays = (self.elements, self.charges, self.isotopes, self.bond_a, self.bond_b, self.orders)
+        return sum(a.itemsize * len(a) for a in (*arrays, self.atom_offsets, self.bond_offsets))
+
+    # -------------------------------------------------------------- packing
+    def _layout(self, extra: int) -> Tuple[int, ...]:
+        """Start of every column, then of the extra symbols, then the end."""
+        counts = {"molecules": len(self) + 1, "atoms": self.n_atoms, "bonds": self.n_bonds}
+        at = _HEADER.size
+        starts = []
+        for _, typecode, field in _COLUMNS:
+            starts.append(at)
+            at += _aligned(counts[field] * array(typecode).itemsize)
+        return (*starts, at, at + extra)
+
+    def _extra_bytes(self) -> bytes:
+        return "\0".join(self._extra).encode()
+
+    def packed_size(self) -> int:
+        return self._layout(len(self._extra_bytes()))[-1]
+
+    def pack_into(self, buf, offset: int = 0) -> int:
+        """Write the packed batch at ``offset`` of a writable ``buf``; return its size."""
+        extra = self._extra_bytes()
+        layout = self._layout(len(extra))
+        if len(buf) - offset < layout[-1]:
+            raise ValueError(f"buffer too small: {layout[-1]} bytes needed")
+        view = memoryview(buf)
+        _HEADER.pack_into(buf, offset, BATCH_MAGIC, BATCH_VERSION, 0, len(self), self.n_atoms, self.n_bonds, len(extra))
+        for (attr, _, _), at in zip(_COLUMNS, layout):
+            raw = memoryview(getattr(self, attr)).cast("B")
+            view[offset + at : offset + at + len(raw)] = raw
+        view[offset + layout[-2] : offset + layout[-1]] = extra
+        return layout[-1]
+
+    @classmethod
+    def from_buffer(cls, buf, offset: int = 0) -> "MoleculeBatch":
+        """Read‑only batch over a buffer written by :meth:`pack_into`, without copying.
+
+        ``buf`` must outlive the batch and every frozen view taken from it.
+        """
+        if len(buf) - offset < _HEADER.size:
+            raise BinaryFormatError("Truncated batch header")
+        magic, version, _, molecules, atoms, bonds, extra = _HEADER.unpack_from(buf, offset)
+        if magic != BATCH_MAGIC:
+            raise BinaryFormatError(f"Not a molecule batch (magic {magic!r})")
+        if version != BATCH_VERSION:
+            raise BinaryFormatError(f"Unsupported batch version {version}")
+        batch = cls.__new__(cls)
+        counts = {"molecules": molecules + 1, "atoms": atoms, "bonds": bonds}
+        view = memoryview(buf)
+        at = offset + _HEADER.size
+        for attr, typecode, field in _COLUMNS:
+            size = counts[field] * array(typecode).itemsize
+            if len(view) < at + size:
+                raise BinaryFormatError("Truncated batch")
+            setattr(batch, attr, view[at : at + size].cast(typecode))
+            at += _aligned(size)
+        raw = bytes(view[at : at + extra])
+        batch._extra = {s: k for k, s in enumerate(raw.decode().split("\0"))} if extra else {}
+        return batch
+
+    def __repr__(self) -> str:  # pragma: no cover
+        return f"<MoleculeBatch molecules={len(self)} atoms={self.n_atoms} bonds={self.n_bonds}>"
+
+
+class MoleculeView:
+    """Molecule ``index`` of a :class:`MoleculeBatch`.
+
+    Pass it to :func:`~chemname.naming.namer.name` directly (it freezes on
+    demand); pickling ships the frozen molecule, not the batch.
+    """
+
+    __slots__ = ("batch", "index", "_frozen")
+
+    def __init__(self, batch: MoleculeBatch, index: int) -> None:
+        self.batch = batch
+        self.index = index
+        self._frozen: FrozenMolecule | None = None
+
+    def _atoms(self) -> range:
+        offsets = self.batch.atom_offsets
+        return range(offsets[self.index], offsets[self.index + 1])
+
+    def _bonds(self) -> range:
+        offsets = self.batch.bond_offsets
+        return range(offsets[self.index], offsets[self.index + 1])
+
+    def __len__(self) -> int:
+        return len(self._atoms())
+
+    @property
+    def n_bonds(self) -> int:
+        return len(self._bonds())
+
+    def symbols(self) -> Tuple[str, ...]:
+        a = self._atoms()
+        extra = self.batch.extra_symbols
+        return tuple(
+            ELEMENTS[c] if c < len(ELEMENTS) else extra[c - len(ELEMENTS)]
+            for c in self.batch.elements[a.start : a.stop]
+        )
+
+    def edges(self) -> Iterator[Tuple[int, int, int]]:
+        """Yield each bond as ``(p, q, order_code)``."""
+        b = self._bonds()
+        batch = self.batch
+        return zip(batch.bond_a[b.start : b.stop], batch.bond_b[b.start : b.stop], batch.orders[b.start : b.stop])
+
+    def freeze(self) -> FrozenMolecule:
+        """CSR snapshot of this molecule (built once per view)."""
+        if self._frozen is None:
+            batch = self.batch
+            a = self._atoms()
+            n = len(a)
+            nbs = [[] for _ in range(n)]
+            for p, q, order in self.edges():
+                nbs[p].append((q, order))
+                nbs[q].append((p, order))
+            offsets = array("q", [0])
+            targets = array("q")
+            orders = array("B")
+            for row in nbs:
+                row.sort()
+                for q, order in row:
+                    targets.append(q)
+                    orders.append(order)
+                offsets.append(len(targets))
+            self._frozen = FrozenMolecule(
+                array("q", range(n)),
+                batch.elements[a.start : a.stop],
+                batch.charges[a.start : a.stop],
+                batch.isotopes[a.start : a.stop],
+                offsets,
+                targets,
+                orders,
+                batch.extra_symbols,
+            )
+        return self._frozen
+
+    def to_molecule(self) -> Molecule:
+        a = self._atoms()
+        batch = self.batch
+        edges = []
+        orders = []
+        for p, q, order in self.edges():
+            edges.append((p, q))
+            orders.append(BOND_ORDERS[order])
+        return Molecule.from_arrays(
+            self.symbols(),
+            edges,
+            orders,
+            charges=list(batch.charges[a.start : a.stop]),
+            isotopes=list(batch.isotopes[a.start : a.stop]),
+            trusted=True,
+        )
+
+    def __reduce__(self):
+        return self.freeze().__reduce__()
+
+    def __repr__(self) -> str:  # pragma: no cover
+        return f"<MoleculeView {self.index} n_atoms={len(self)} n_bonds={self.n_bonds}>"
+
+
+def _aligned(size: int) -> int:
+    return size + (-size % 8)
@@ -0,0 +1,129 @@
+"""Index‑independent canonical keys for acyclic molecule graphs.
+
+Each tree component is rooted at its centre (vertex or edge) and encoded
+level by level, deepest first (AHU).  Every node signature is
+``(atom label, bond order to parent, sorted child ranks)``; ranks are the
+positions of the signatures in the sorted table of their level, so isomorphic
+trees produce identical tables whatever their atom numbering.  The whole
+process is iterative and O(n log n).
+"""
+
+from __future__ import annotations
+
+from hashlib import blake2b
+from typing import TYPE_CHECKING, Dict, List, Sequence
+
+if TYPE_CHECKING:  # pragma: no cover
+    from .frozen import FrozenMolecule
+    from .structures import Molecule
+
+_EMPTY_KEY = blake2b(b"", digest_size=16).hexdigest()
+
+
+def _centre(component: List[int], offsets: Sequence[int], targets: Sequence[int]) -> List[int]:
+    """Return the one or two centre atoms of a tree component (leaf peeling)."""
+    if len(component) <= 2:
+        return component
+    degree = {v: offsets[v + 1] - offsets[v] for v in component}
+    layer = [v for v in component if degree[v] <= 1]
+    remaining = len(component)
+    while remaining > 2:
+        remaining -= len(layer)
+        nxt = []
+        for v in layer:
+            for k in range(offsets[v], offsets[v + 1]):
+                nb = targets[k]
+                degree[nb] -= 1
+                if degree[nb] == 1:
+                    nxt.append(nb)
+        layer = nxt
+    return layer
+
+
+def _component_code(roots: List[int], g: "FrozenMolecule", label: List[tuple]) -> tuple:
+    offsets, targets, orders = g.offsets, g.targets, g.orders
+    parent: Dict[int, int] = {r: -1 for r in roots}
+    to_parent: Dict[int, int] = {r: 0 for r in roots}
+    levels: List[List[int]] = [list(roots)]
+    while True:
+        nxt = []
+        for v in levels[-1]:
+            for k in range(offsets[v], offsets[v + 1]):
+                nb = targets[k]
+                if nb not in parent:
+                    parent[nb] = v
+                    to_parent[nb] = orders[k]
+                    nxt.append(nb)
+        if not nxt:
+            break
+        levels.append(nxt)
+
+    children: Dict[int, List[int]] = {}
+    rank: Dict[int, int] = {}
+    tables = []
+    for level in reversed(levels):
+        sigs = {}
+        for v in level:
+            kids = tuple(sorted(rank[c] for c in children.get(v, ())))
+            sigs[v] = (label[v], to_parent[v], kids)
+            p = parent[v]
+            if p >= 0:
+                children.setdefault(p, []).append(v)
+        table = sorted(set(sigs.values()))
+        pos = {sig: i for i, sig in enumerate(table)}
+        for v, sig in sigs.items():
+            rank[v] = pos[sig]
+        tables.append(tuple(table))
+
+    if len(roots) == 1:
+        top: tuple = ("v", rank[roots[0]])
+    else:
+        a, b = roots
+        k = offsets[a]
+        while targets[k] != b:
+            k += 1
+        top = ("e", orders[k], tuple(sorted((rank[a], rank[b]))))
+    return (tuple(tables), top)
+
+
+def canonical_key(mol: "Molecule | FrozenMolecule", marks: Dict[int, int] | None = None) -> str | None:
+    """Return a hex digest identical for all numberings of the same graph.
+
+    Atom labels include element, charge and isotope; bond orders are part of
+    the key.  ``marks`` optionally adds an integer tag per atom position of the
+    frozen graph (e.g. a chain position) so that only numberings preserving
+    the tags collide.  Returns ``None`` for graphs containing a ring.
+    """
+    g = mol.freeze()
+    n = len(g)
+    if not n:
+        return _EMPTY_KEY
+    offsets, targets = g.offsets, g.targets
+
+    # components; a forest has exactly n - c edges
+    seen = bytearray(n)
+    components: List[List[int]] = []
+    for start in range(n):
+        if seen[start]:
+            continue
+        seen[start] = 1
+        members = [start]
+        i = 0
+        while i < len(members):
+            v = members[i]
+            i += 1
+            for k in range(offsets[v], offsets[v + 1]):
+                nb = targets[k]
+                if not seen[nb]:
+                    seen[nb] = 1
+                    members.append(nb)
+        components.append(members)
+    if g.n_bonds != n - len(components):
+        return None
+
+    marks = marks or {}
+    label = [
+        (g.symbol(p), g.charges[p], g.isotopes[p], marks.get(p, 0)) for p in range(n)
+    ]
+    codes = sorted(_component_code(_centre(c, offsets, targets), g, label) for c in components)
+    return blake2b(repr(codes).encode(), digest_size=16).hexdigest()
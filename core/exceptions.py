@@ -16,3 +16,19 @@ class DuplicateBondError(ChemnameError):
 class UnknownAtomError(ChemnameError):
     """Raised when a referenced atom index is not present."""
 
+
+
+class SmilesError(ChemnameError, ValueError):
+    """Raised when a SMILES string cannot be read."""
+
+
+class NameParseError(ChemnameError, ValueError):
+    """Raised when a systematic name cannot be turned into a structure."""
+
+
+class BinaryFormatError(ChemnameError, ValueError):
+    """Raised when a binary molecule record or container is malformed."""
+
+
+class SdfError(ChemnameError, ValueError):
+    """Raised when an MDL molfile or SDF record cannot be read."""
@@ -0,0 +1,259 @@
+"""Immutable, array‑backed (CSR) snapshot of a Molecule for the naming hot path."""
+
+from __future__ import annotations
+
+from array import array
+from typing import TYPE_CHECKING, Dict, Iterable, Sequence, Tuple
+
+from ..util import ATOMIC_NUMBERS, BOND_ORDER_CODES, BOND_ORDERS, ELEMENTS
+
+if TYPE_CHECKING:  # pragma: no cover
+    from .rings import RingInfo
+    from .structures import Molecule
+
+
+class FrozenMolecule:
+    """Read‑only graph with contiguous atom positions ``0 … n‑1``.
+
+    Positions follow ascending original atom index; ``indices[p]`` maps back.
+    The neighbours of position ``p`` are ``targets[offsets[p]:offsets[p + 1]]``
+    with the matching bond order codes in ``orders`` (see ``util.BOND_ORDERS``).
+    Elements are atomic numbers; symbols outside the periodic table are kept
+    in ``extra_symbols`` and coded from ``len(ELEMENTS)`` upwards.
+    """
+
+    __slots__ = (
+        "indices",
+        "elements",
+        "charges",
+        "isotopes",
+        "offsets",
+        "targets",
+        "orders",
+        "extra_symbols",
+        "_position",
+        "_rings",
+    )
+
+    def __init__(
+        self,
+        indices: Sequence[int],
+        elements: Sequence[int],
+        charges: Sequence[int],
+        isotopes: Sequence[int],
+        offsets: Sequence[int],
+        targets: Sequence[int],
+        orders: Sequence[int],
+        extra_symbols: Tuple[str, ...] = (),
+    ) -> None:
+        setter = object.__setattr__
+        setter(self, "indices", indices)
+        setter(self, "elements", elements)
+        setter(self, "charges", charges)
+        setter(self, "isotopes", isotopes)
+        setter(self, "offsets", offsets)
+        setter(self, "targets", targets)
+        setter(self, "orders", orders)
+        setter(self, "extra_symbols", extra_symbols)
+        n = len(indices)
+        contiguous = n == 0 or (indices[0] == 0 and indices[n - 1] == n - 1)
+        setter(self, "_position", None if contiguous else {idx: p for p, idx in enumerate(indices)})
+        setter(self, "_rings", None)  # core.rings.ring_info, on first use
+
+    def __setattr__(self, key: str, value: object) -> None:
+        raise AttributeError("FrozenMolecule is immutable")
+
+    # ------------------------------------------------------------ construction
+    @classmethod
+    def from_molecule(cls, mol: "Molecule") -> "FrozenMolecule":
+        atoms = mol._atoms  # type: ignore[attr-defined]
+        adj = mol._adj  # type: ignore[attr-defined]
+        bonds = mol._bonds  # type: ignore[attr-defined]
+        order_idx = sorted(atoms)
+        pos = {idx: p for p, idx in enumerate(order_idx)}
+
+        extra: Dict[str, int] = {}
+        elements = array("H")
+        charges = array("b")
+        isotopes = array("H")
+        offsets = array("q", [0])
+        targets = array("q")
+        orders = array("B")
+        for idx in order_idx:
+            atom = atoms[idx]
+            elements.append(_element_code(atom.symbol, extra))
+            charges.append(atom.charge)
+            isotopes.append(atom.isotope or 0)
+            nbs = adj.get(idx)
+            if nbs:
+                for q in sorted(pos[nb] for nb in nbs):
+                    targets.append(q)
+                    orders.append(_order_code(bonds[frozenset((idx, order_idx[q]))].order))
+            offsets.append(len(targets))
+        return cls(array("q", order_idx), elements, charges, isotopes, offsets, targets, orders, tuple(extra))
+
+    @classmethod
+    def from_arrays(
+        cls,
+        symbols: Sequence[str],
+        edges: Sequence[Tuple[int, int]],
+        orders: Sequence[int | str] | None = None,
+        *,
+        charges: Sequence[int] | None = None,
+        isotopes: Sequence[int | None] | None = None,
+    ) -> "FrozenMolecule":
+        """Snapshot built straight from :meth:`Molecule.from_arrays` input
+        (positions ``0…n‑1``), without an intermediate :class:`Molecule`."""
+        n = len(symbols)
+        if orders is None:
+            orders = [1] * len(edges)
+        for label, arr, expected in (
+            ("orders", orders, len(edges)),
+            ("charges", charges, n),
+            ("isotopes", isotopes, n),
+        ):
+            if arr is not None and len(arr) != expected:
+                raise ValueError(f"{label} has length {len(arr)}, expected {expected}")
+        nbs: list = [[] for _ in range(n)]
+        for (i, j), order in zip(edges, orders):
+            if not (0 <= i < n and 0 <= j < n) or i == j:
+                raise ValueError(f"Bad bond {i}-{j} for a molecule of {n} atoms")
+            code = _order_code(order)
+            nbs[i].append((j, code))
+            nbs[j].append((i, code))
+        extra: Dict[str, int] = {}
+        offsets = array("q", [0])
+        targets = array("q")
+        codes = array("B")
+        for p, row in enumerate(nbs):
+            row.sort()
+            for k in range(1, len(row)):
+                if row[k][0] == row[k - 1][0]:
+                    raise ValueError(f"Bond between {p} and {row[k][0]} given twice")
+            for q, code in row:
+                targets.append(q)
+                codes.append(code)
+            offsets.append(len(targets))
+        return cls(
+            array("q", range(n)),
+            array("H", [_element_code(s, extra) for s in symbols]),
+            array("b", charges if charges is not None else bytes(n)),
+            array("H", [iso or 0 for iso in isotopes] if isotopes is not None else bytes(2 * n)),
+            offsets,
+            targets,
+            codes,
+            tuple(extra),
+        )
+
+    def freeze(self) -> "FrozenMolecule":
+        return self
+
+    def to_bytes(self) -> bytes:
+        from ..formats.binary import encode
+
+        return encode(self)
+
+    @classmethod
+    def from_buffer(cls, buf, offset: int = 0) -> "FrozenMolecule":
+        """Zero‑copy view over a binary record; ``buf`` must outlive it."""
+        from ..formats.binary import decode
+
+        return decode(buf, offset)
+
+    def __reduce__(self):
+        return (
+            _restore,
+            (
+                array("q", self.indices),
+                array("H", self.elements),
+                array("b", self.charges),
+                array("H", self.isotopes),
+                array("q", self.offsets),
+                array("q", self.targets),
+                array("B", self.orders),
+                self.extra_symbols,
+            ),
+        )
+
+    # ----------------------------------------------------------------- queries
+    def __len__(self) -> int:
+        return len(self.indices)
+
+    @property
+    def n_bonds(self) -> int:
+        return len(self.targets) // 2
+
+    def position(self, idx: int) -> int:
+        """Return the position of original atom index ``idx``."""
+        if self._position is None:
+            if 0 <= idx < len(self.indices):
+                return idx
+            raise KeyError(idx)
+        return self._position[idx]
+
+    def symbol(self, p: int) -> str:
+        return self.element_symbol(self.elements[p])
+
+    def element_symbol(self, code: int) -> str:
+        """Decode an entry of ``elements``."""
+        if code < len(ELEMENTS):
+            return ELEMENTS[code]
+        return self.extra_symbols[code - len(ELEMENTS)]
+
+    def symbols(self) -> Tuple[str, ...]:
+        return tuple(self.symbol(p) for p in range(len(self.indices)))
+
+    def neighbours(self, p: int) -> Sequence[int]:
+        return self.targets[self.offsets[p] : self.offsets[p + 1]]
+
+    def degree(self, p: int) -> int:
+        return self.offsets[p + 1] - self.offsets[p]
+
+    def bond_order(self, p: int, q: int) -> int | str:
+        targets = self.targets
+        for k in range(self.offsets[p], self.offsets[p + 1]):
+            if targets[k] == q:
+                return BOND_ORDERS[self.orders[k]]
+        raise KeyError((p, q))
+
+    def edges(self) -> Iterable[Tuple[int, int, int]]:
+        """Yield each bond once as ``(p, q, order_code)`` with ``p < q``."""
+        offsets, targets, orders = self.offsets, self.targets, self.orders
+        for p in range(len(self.indices)):
+            for k in range(offsets[p], offsets[p + 1]):
+                q = targets[k]
+                if p < q:
+                    yield p, q, orders[k]
+
+    def ring_info(self) -> "RingInfo":
+        from .rings import ring_info
+
+        return ring_info(self)
+
+    def canonical_key(self, marks: Dict[int, int] | None = None) -> str | None:
+        from .canonical import canonical_key
+
+        return canonical_key(self, marks)
+
+    def __repr__(self) -> str:  # pragma: no cover
+        return f"<FrozenMolecule n_atoms={len(self)} n_bonds={self.n_bonds}>"
+
+
+def _restore(*state) -> FrozenMolecule:
+    return FrozenMolecule(*state)
+
+
+def _element_code(symbol: str, extra: Dict[str, int]) -> int:
+    code = ATOMIC_NUMBERS.get(symbol)
+    if code is not None:
+        return code
+    if symbol not in extra:
+        extra[symbol] = len(extra)
+    return len(ELEMENTS) + extra[symbol]
+
+
+def _order_code(order: int | str) -> int:
+    try:
+        return BOND_ORDER_CODES[order]
+    except KeyError:
+        raise ValueError(f"Unsupported bond order {order!r}") from None
@@ -0,0 +1,220 @@
+"""Ring perception: biconnected ring systems and a smallest set of smallest rings.
+
+A graph is acyclic iff it has exactly ``n - c`` bonds (``c`` components);
+that count is taken first, so the acyclic molecules the namer mostly sees
+pay one linear pass and nothing else.  Otherwise the ring systems are the
+biconnected blocks that are not bridges (iterative Tarjan, linear time).  A
+block with as many bonds as atoms is a single ring and is walked directly;
+only fused or bridged blocks build Horton's candidate cycles from BFS
+shortest paths and keep the shortest independent ones (Gaussian elimination
+over GF(2) on bond bitsets).
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Dict, FrozenSet, List, Sequence, Tuple
+
+if TYPE_CHECKING:  # pragma: no cover
+    from .frozen import FrozenMolecule
+    from .structures import Molecule
+
+
+@dataclass(frozen=True, slots=True)
+class RingInfo:
+    """Rings of a frozen graph, in its atom positions.
+
+    ``rings`` is a smallest set of smallest rings, each as the positions met
+    walking round it (starting from its lowest position, towards the lower
+    of its two neighbours); ``systems`` holds the atoms of each ring system
+    (fused and bridged rings share one, spiro rings do not).
+    """
+
+    rings: Tuple[Tuple[int, ...], ...]
+    systems: Tuple[FrozenSet[int], ...]
+
+    @property
+    def is_acyclic(self) -> bool:
+        return not self.rings
+
+    @property
+    def ring_atoms(self) -> FrozenSet[int]:
+        return frozenset().union(*self.systems)
+
+
+ACYCLIC = RingInfo((), ())
+
+
+def ring_info(mol: "Molecule | FrozenMolecule") -> RingInfo:
+    """Return the rings of ``mol``; computed once per frozen snapshot."""
+    g = mol.freeze()
+    info = g._rings
+    if info is None:
+        info = _perceive(g)
+        object.__setattr__(g, "_rings", info)
+    return info
+
+
+def _perceive(g: "FrozenMolecule") -> RingInfo:
+    n = len(g)
+    # a forest has exactly n - c bonds, so n or more bonds always close a ring
+    if g.n_bonds < n and g.n_bonds == n - _components(g):
+        return ACYCLIC
+    return _rings_of(g)
+
+
+def _components(g: "FrozenMolecule") -> int:
+    offsets, targets = g.offsets, g.targets
+    seen = bytearray(len(g))
+    count = 0
+    for start in range(len(g)):
+        if seen[start]:
+            continue
+        count += 1
+        seen[start] = 1
+        stack = [start]
+        while stack:
+            v = stack.pop()
+            for k in range(offsets[v], offsets[v + 1]):
+                nb = targets[k]
+                if not seen[nb]:
+                    seen[nb] = 1
+                    stack.append(nb)
+    return count
+
+
+def _rings_of(g: "FrozenMolecule") -> RingInfo:
+    rings: List[Tuple[int, ...]] = []
+    systems: List[FrozenSet[int]] = []
+    for edges in _blocks(g):
+        if len(edges) == 1:  # a bridge
+            continue
+        atoms = frozenset(v for e in edges for v in e)
+        systems.append(atoms)
+        if len(edges) == len(atoms):
+            rings.append(_walk(edges))
+        else:
+            rings.extend(_smallest_rings(g, atoms, edges))
+    rings.sort(key=lambda r: (len(r), r))
+    systems.sort(key=min)
+    return RingInfo(tuple(rings), tuple(systems))
+
+
+def _blocks(g: "FrozenMolecule") -> List[List[Tuple[int, int]]]:
+    """Bonds of every biconnected block (iterative Tarjan)."""
+    offsets, targets = g.offsets, g.targets
+    n = len(g)
+    disc = [0] * n
+    low = [0] * n
+    clock = 0
+    blocks: List[List[Tuple[int, int]]] = []
+    for root in range(n):
+        if disc[root]:
+            continue
+        clock += 1
+        disc[root] = low[root] = clock
+        edge_stack: List[Tuple[int, int]] = []
+        # frames: (vertex, parent, next adjacency slot)
+        stack = [(root, -1, offsets[root])]
+        while stack:
+            v, parent, k = stack[-1]
+            if k < offsets[v + 1]:
+                stack[-1] = (v, parent, k + 1)
+                nb = targets[k]
+                if not disc[nb]:
+                    edge_stack.append((v, nb))
+                    clock += 1
+                    disc[nb] = low[nb] = clock
+                    stack.append((nb, v, offsets[nb]))
+                elif nb != parent and disc[nb] < disc[v]:
+                    edge_stack.append((v, nb))
+                    low[v] = min(low[v], disc[nb])
+                continue
+            stack.pop()
+            if parent < 0:
+                continue
+            low[parent] = min(low[parent], low[v])
+            if low[v] >= disc[parent]:
+                block = []
+                while True:
+                    e = edge_stack.pop()
+                    block.append(e)
+                    if e == (parent, v):
+                        break
+                blocks.append(block)
+    return blocks
+
+
+def _walk(edges: Sequence[Tuple[int, int]]) -> Tuple[int, ...]:
+    """Atoms of a simple cycle in order, from the lowest towards its lower neighbour."""
+    adj: Dict[int, List[int]] = {}
+    for a, b in edges:
+        adj.setdefault(a, []).append(b)
+        adj.setdefault(b, []).append(a)
+    start = min(adj)
+    ring = [start]
+    prev, cur = start, min(adj[start])
+    while cur != start:
+        ring.append(cur)
+        a, b = adj[cur]
+        prev, cur = cur, (b if a == prev else a)
+    return tuple(ring)
+
+
+def _smallest_rings(g: "FrozenMolecule", atoms: FrozenSet[int], edges: Sequence[Tuple[int, int]]) -> List[Tuple[int, ...]]:
+    """Shortest independent cycles of one fused or bridged block (Horton)."""
+    offsets, targets = g.offsets, g.targets
+    bit = {frozenset(e): 1 << i for i, e in enumerate(edges)}
+
+    # shortest path trees inside the block, one per atom
+    parents: Dict[int, Dict[int, int]] = {}
+    for root in atoms:
+        parent = {root: -1}
+        order = [root]
+        for v in order:  # the list grows while it is walked
+            for k in range(offsets[v], offsets[v + 1]):
+                nb = targets[k]
+                if nb in atoms and nb not in parent:
+                    parent[nb] = v
+                    order.append(nb)
+        parents[root] = parent
+
+    def path(root: int, v: int) -> List[int]:
+        parent = parents[root]
+        out = [v]
+        while v != root:
+            v = parent[v]
+            out.append(v)
+        return out[::-1]
+
+    candidates = {}
+    for root in atoms:
+        parent = parents[root]
+        for a, b in edges:
+            if parent[a] == b or parent[b] == a:  # a tree bond closes nothing
+                continue
+            pa, pb = path(root, a), path(root, b)
+            if set(pa) & set(pb) != {root}:
+                continue
+            cycle = pa + pb[:0:-1]
+            mask = 0
+            for i in range(len(cycle)):
+                mask |= bit[frozenset((cycle[i], cycle[i - 1]))]
+            candidates.setdefault(mask, cycle)
+
+    # keep the shortest cycles that are independent over GF(2)
+    need = len(edges) - len(atoms) + 1
+    basis: Dict[int, int] = {}  # leading bit → reduced vector
+    chosen: List[Tuple[int, ...]] = []
+    for mask, cycle in sorted(candidates.items(), key=lambda mc: (len(mc[1]), sorted(mc[1]))):
+        v = mask
+        while v:
+            top = v.bit_length() - 1
+            if top not in basis:
+                basis[top] = v
+                chosen.append(_walk([tuple(e) for e, b in bit.items() if b & mask]))
+                break
+            v ^= basis[top]
+        if len(chosen) == need:
+            break
+    return chosen
@@ -2,11 +2,17 @@
 
 from __future__ import annotations
 
+import gc
 from collections import defaultdict
+from contextlib import contextmanager
 from dataclasses import dataclass, field
-from typing import Dict, FrozenSet, Iterator, List, Set
+from itertools import repeat
+from typing import Dict, FrozenSet, Iterable, Iterator, List, Mapping, Optional, Sequence, Set, Tuple
 
+from .canonical import canonical_key
 from .exceptions import DuplicateAtomError, DuplicateBondError, UnknownAtomError
+from .frozen import FrozenMolecule
+from .rings import RingInfo, ring_info
 
 
 @dataclass(frozen=True, slots=True)
@@ -42,6 +48,12 @@ class Molecule:
         self._atoms: Dict[int, Atom] = {}
         self._bonds: Dict[FrozenSet[int], Bond] = {}
         self._adj: Dict[int, Set[int]] = defaultdict(set)
+        self._frozen: Optional[FrozenMolecule] = None
+        self._version = 0
+        # naming‑layer record of the last full perception (naming.incremental)
+        # and the mutations made since; nothing is journaled without a record
+        self._perception: object | None = None
+        self._journal: List[Tuple] = []
 
     # --------------------------------------------------------------------- API
     def add_atom(self, symbol: str, index: int, /, *, isotope: int | None = None, charge: int = 0) -> Atom:
@@ -49,6 +61,10 @@ class Molecule:
             raise DuplicateAtomError(f"Atom index {index} already present")
         atom = Atom(symbol, index, isotope, charge)
         self._atoms[index] = atom
+        self._frozen = None
+        self._version += 1
+        if self._perception is not None:
+            self._journal.append(("atom", index, symbol))
         return atom
 
     def add_bond(self, idx1: int, idx2: int, order: int | str = 1) -> Bond:
@@ -61,8 +77,115 @@ class Molecule:
         self._bonds[key] = bond
         self._adj[idx1].add(idx2)
         self._adj[idx2].add(idx1)
+        self._frozen = None
+        self._version += 1
+        if self._perception is not None:
+            self._journal.append(("bond", idx1, idx2))
         return bond
 
+    def copy(self) -> "Molecule":
+        """Independent copy; it keeps the naming record, so it re‑names incrementally."""
+        new = Molecule.__new__(Molecule)
+        new._atoms = dict(self._atoms)
+        new._bonds = dict(self._bonds)
+        new._adj = defaultdict(set, {idx: set(nbs) for idx, nbs in self._adj.items()})
+        new._frozen = self._frozen
+        new._version = self._version
+        new._perception = self._perception
+        new._journal = list(self._journal)
+        return new
+
+    # -------------------------------------------------------- bulk construction
+    @classmethod
+    def from_arrays(
+        cls,
+        symbols: Sequence[str],
+        edges: Sequence[Tuple[int, int]],
+        orders: Sequence[int | str] | None = None,
+        *,
+        indices: Sequence[int] | None = None,
+        charges: Sequence[int] | None = None,
+        isotopes: Sequence[int | None] | None = None,
+        trusted: bool = False,
+    ) -> "Molecule":
+        """Build a molecule from parallel arrays in one pass.
+
+        Atom ``k`` gets ``indices[k]`` (default ``k``); ``edges`` are index
+        pairs with matching ``orders`` (default all single).  Raises the same
+        errors as :meth:`add_atom`/:meth:`add_bond`; ``trusted=True`` skips the
+        duplicate and unknown‑atom checks for inputs known to be clean.
+        """
+        n = len(symbols)
+        idx = range(n) if indices is None else indices
+        if orders is None:
+            orders = [1] * len(edges)
+        if not trusted:
+            _check_arrays(n, idx, edges, orders, charges, isotopes)
+
+        keys = [frozenset(e) for e in edges]
+        if not trusted:
+            if len(set(keys)) != len(keys):
+                _raise_duplicate_bond(edges)
+            if any(len(k) != 2 for k in keys):
+                raise ValueError("Bond must connect exactly two distinct atoms")
+
+        mol = cls()
+        with _gc_paused():  # everything built here is acyclic
+            mol._atoms = dict(
+                zip(
+                    idx,
+                    map(
+                        _new_atom,
+                        symbols,
+                        idx,
+                        repeat(None, n) if isotopes is None else isotopes,
+                        repeat(0, n) if charges is None else charges,
+                    ),
+                )
+            )
+            mol._bonds = dict(zip(keys, map(_new_bond, keys, orders)))
+            adj = mol._adj
+            for i, j in edges:
+                adj[i].add(j)
+                adj[j].add(i)
+        return mol
+
+    @classmethod
+    def from_edge_list(
+        cls,
+        atoms: Sequence[str] | Mapping[int, str],
+        edge_list: Iterable[Tuple[int, int] | Tuple[int, int, int | str]],
+        *,
+        trusted: bool = False,
+    ) -> "Molecule":
+        """Build from ``(i, j)`` or ``(i, j, order)`` tuples.
+
+        ``atoms`` is a symbol sequence (indices ``0…n‑1``) or an
+        ``{index: symbol}`` mapping.
+        """
+        edges: List[Tuple[int, int]] = []
+        orders: List[int | str] = []
+        for e in edge_list:
+            edges.append((e[0], e[1]))
+            orders.append(e[2] if len(e) > 2 else 1)
+        if isinstance(atoms, Mapping):
+            return cls.from_arrays(list(atoms.values()), edges, orders, indices=list(atoms), trusted=trusted)
+        return cls.from_arrays(atoms, edges, orders, trusted=trusted)
+
+    # ------------------------------------------------------------ serialisation
+    def to_bytes(self) -> bytes:
+        """Compact versioned binary record (see :mod:`chemname.formats.binary`)."""
+        from ..formats.binary import encode
+
+        return encode(self)
+
+    @classmethod
+    def from_buffer(cls, buf, offset: int = 0) -> "Molecule":
+        """Rebuild a molecule from a record written by :meth:`to_bytes`."""
+        from ..formats.binary import decode, to_molecule
+
+        return to_molecule(decode(buf, offset))
+
     # ---------------------------------------------------------------- queries
     def neighbours(self, idx: int) -> List[int]:
         if idx not in self._atoms:
@@ -72,7 +195,33 @@ class Molecule:
     def degree(self, idx: int) -> int:
         return len(self.neighbours(idx))
 
+    @property
+    def version(self) -> int:
+        """Mutation counter: bumped by every :meth:`add_atom`/:meth:`add_bond`."""
+        return self._version
+
+    def canonical_key(self) -> str | None:
+        """Numbering‑independent graph hash (``None`` if the graph has a ring)."""
+        return canonical_key(self.freeze())
+
+    def ring_info(self) -> RingInfo:
+        """Ring systems and smallest rings (cached with the frozen snapshot)."""
+        return ring_info(self.freeze())
+
+    def freeze(self) -> FrozenMolecule:
+        """Return an immutable CSR snapshot (cached until the next mutation)."""
+        if self._frozen is None:
+            self._frozen = FrozenMolecule.from_molecule(self)
+        return self._frozen
+
     # ----------------------------------------------------------- dunder sugar
+    def __getstate__(self) -> dict:
+        state = self.__dict__.copy()
+        state["_frozen"] = None  # rebuilt on demand, not worth shipping
+        state["_perception"] = None
+        state["_journal"] = []
+        return state
+
     def __len__(self) -> int:
         return len(self._atoms)
 
@@ -83,3 +232,72 @@ class Molecule:
     def __repr__(self) -> str:  # pragma: no cover
         return f"<Molecule n_atoms={len(self)} n_bonds={len(self._bonds)}>"
 
+
+_set_symbol, _set_index = Atom.symbol.__set__, Atom.index.__set__  # type: ignore[attr-defined]
+_set_isotope, _set_charge = Atom.isotope.__set__, Atom.charge.__set__  # type: ignore[attr-defined]
+_set_atoms, _set_order = Bond.atoms.__set__, Bond.order.__set__  # type: ignore[attr-defined]
+
+
+def _new_atom(symbol: str, index: int, isotope: int | None, charge: int) -> Atom:
+    # slot descriptors bypass the frozen‑dataclass __init__ (input is pre‑validated)
+    atom = Atom.__new__(Atom)
+    _set_symbol(atom, symbol)
+    _set_index(atom, index)
+    _set_isotope(atom, isotope or None)
+    _set_charge(atom, charge)
+    return atom
+
+
+def _new_bond(key: FrozenSet[int], order: int | str) -> Bond:
+    bond = Bond.__new__(Bond)
+    _set_atoms(bond, key)
+    _set_order(bond, order)
+    return bond
+
+
+@contextmanager
+def _gc_paused() -> Iterator[None]:
+    was_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        yield
+    finally:
+        if was_enabled:
+            gc.enable()
+
+
+def _check_arrays(
+    n: int,
+    indices: Sequence[int],
+    edges: Sequence[Tuple[int, int]],
+    orders: Sequence[int | str],
+    charges: Sequence[int] | None,
+    isotopes: Sequence[int | None] | None,
+) -> None:
+    """Validate bulk input up front so construction itself cannot fail midway."""
+    for name, arr in (("indices", indices), ("orders", orders), ("charges", charges), ("isotopes", isotopes)):
+        expected = len(edges) if name == "orders" else n
+        if arr is not None and len(arr) != expected:
+            raise ValueError(f"{name} has length {len(arr)}, expected {expected}")
+    known = set(indices)
+    if len(known) != n:
+        seen: Set[int] = set()
+        dup = next(i for i in indices if i in seen or seen.add(i))  # type: ignore[func-returns-value]
+        raise DuplicateAtomError(f"Atom index {dup} already present")
+    if any(i < 0 for i in known):
+        raise ValueError("Atom index must be non‑negative")
+    endpoints = {i for e in edges for i in e}
+    unknown = endpoints - known
+    if unknown:
+        bad = next((i, j) for i, j in edges if i in unknown or j in unknown)
+        raise UnknownAtomError(f"Cannot create bond; unknown atom(s) {bad[0]}, {bad[1]}")
+
+
+def _raise_duplicate_bond(edges: Sequence[Tuple[int, int]]) -> None:
+    seen: Set[FrozenSet[int]] = set()
+    for i, j in edges:
+        key = frozenset((i, j))
+        if key in seen:
+            raise DuplicateBondError(f"Bond between {i} and {j} already exists")
+        seen.add(key)
+
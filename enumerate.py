@@ -0,0 +1,265 @@
+"""Lazy enumeration of non‑isomorphic acyclic hydrocarbons and haloalkanes.
+
+Molecules are grown one atom at a time by canonical augmentation: a child
+made by attaching a new leaf is kept only if that leaf is in the canonical
+orbit of deletable leaves (halogens first, then the largest orbit code), and
+each parent is extended once per orbit of its atoms.  Every isomer is
+therefore produced exactly once with no look‑up table of earlier output, so
+memory stays proportional to the search depth.
+
+Orbits come from the same centre‑rooted, level‑by‑level ranking as
+:mod:`chemname.core.canonical`: two atoms are equivalent iff the rank paths
+from the centre to them agree.
+"""
+
+from __future__ import annotations
+
+import time
+from dataclasses import dataclass
+from typing import Callable, Iterator, List, Sequence
+
+from .core.structures import Molecule
+
+HALOGENS = ("F", "Cl", "Br", "I")
+_VALENCE_C = 4
+_SPLIT_NODES = 8  # search‑tree nodes per shard at the level where shards part
+
+
+@dataclass(frozen=True, slots=True)
+class EnumerationStats:
+    """Progress of an :func:`isomers` run."""
+
+    count: int
+    elapsed_s: float
+
+    @property
+    def rate(self) -> float:
+        return self.count / self.elapsed_s if self.elapsed_s else float("inf")
+
+
+class _Node:
+    """A tree in insertion order: atom ``k > 0`` hangs off ``parent[k] < k``."""
+
+    __slots__ = ("labels", "parent", "order", "used", "degree", "carbons", "halogens", "multiples", "orbits")
+
+    def __init__(self) -> None:
+        self.labels: List[int] = [0]  # 0 = carbon, 1… = halogens in the order given
+        self.parent: List[int] = [-1]
+        self.order: List[int] = [0]  # bond order to ``parent``
+        self.used: List[int] = [0]  # bond orders summed per atom
+        self.degree: List[int] = [0]
+        self.carbons = 1
+        self.halogens = 0
+        self.multiples = 0
+        self.orbits: List[tuple] = [(0,)]  # computed on demand
+
+    def grow(self, at: int, label: int, order: int) -> "_Node":
+        child = _Node.__new__(_Node)
+        child.labels = self.labels + [label]
+        child.parent = self.parent + [at]
+        child.order = self.order + [order]
+        child.used = self.used + [order]
+        child.used[at] += order
+        child.degree = self.degree + [1]
+        child.degree[at] += 1
+        child.carbons = self.carbons + (label == 0)
+        child.halogens = self.halogens + (label != 0)
+        child.multiples = self.multiples + (order > 1)
+        child.orbits = []
+        return child
+
+    def molecule(self, symbols: Sequence[str]) -> Molecule:
+        n = len(self.labels)
+        return Molecule.from_arrays(
+            [symbols[lab] for lab in self.labels],
+            [(self.parent[k], k) for k in range(1, n)],
+            self.order[1:],
+            trusted=True,
+        )
+
+
+def _orbits(node: _Node) -> List[tuple]:
+    """Orbit code per atom: equal codes ⇔ related by an automorphism."""
+    labels, parent, order = node.labels, node.parent, node.order
+    n = len(labels)
+    adj: List[List[int]] = [[] for _ in range(n)]
+    for k in range(1, n):
+        adj[k].append(parent[k])
+        adj[parent[k]].append(k)
+
+    # centre by leaf peeling
+    degree = list(node.degree)
+    layer = [v for v in range(n) if degree[v] <= 1]
+    remaining = n
+    while remaining > 2:
+        remaining -= len(layer)
+        nxt = []
+        for v in layer:
+            for nb in adj[v]:
+                degree[nb] -= 1
+                if degree[nb] == 1:
+                    nxt.append(nb)
+        layer = nxt
+
+    up = [-1] * n
+    to_up = [0] * n
+    levels = [layer]
+    seen = set(layer)
+    while True:
+        nxt = []
+        for v in levels[-1]:
+            for nb in adj[v]:
+                if nb not in seen:
+                    seen.add(nb)
+                    up[nb] = v
+                    to_up[nb] = order[nb] if parent[nb] == v else order[v]
+                    nxt.append(nb)
+        if not nxt:
+            break
+        levels.append(nxt)
+
+    rank = [0] * n
+    kids: List[List[int]] = [[] for _ in range(n)]
+    for level in reversed(levels):
+        sigs = {v: (labels[v], to_up[v], tuple(sorted(kids[v]))) for v in level}
+        table = {sig: i for i, sig in enumerate(sorted(set(sigs.values())))}
+        for v, sig in sigs.items():
+            rank[v] = table[sig]
+            if up[v] >= 0:
+                kids[up[v]].append(rank[v])
+
+    code: List[tuple] = [()] * n
+    for level in levels:
+        for v in level:
+            code[v] = (code[up[v]] if up[v] >= 0 else ()) + (rank[v],)
+    return code
+
+
+def _is_canonical(child: _Node) -> bool:
+    """Is the newest atom in the canonical orbit of deletable leaves?
+
+    Leaves are ordered halogens first, then by label and bond order (cheap,
+    so most children are rejected here), then by orbit code.
+    """
+    labels, used, degree = child.labels, child.used, child.degree
+    new = len(labels) - 1
+    # a leaf's only bond order is its whole valence use
+    mine = (labels[new] != 0, labels[new], used[new])
+    contenders = []
+    for v in range(new + 1):
+        if degree[v] != 1:
+            continue
+        key = (labels[v] != 0, labels[v], used[v])
+        if key > mine:
+            return False
+        if key == mine:
+            contenders.append(v)
+    if len(contenders) == 1:
+        return True
+    orbits = child.orbits = _orbits(child)
+    return orbits[new] == max(orbits[v] for v in contenders)
+
+
+class _Rules:
+    __slots__ = ("max_carbons", "max_halogens", "max_multiples", "labels", "multiple_orders")
+
+    def __init__(self, max_carbons, max_halogens, max_multiples, n_halogens, multiple_orders) -> None:
+        self.max_carbons = max_carbons
+        self.max_halogens = max_halogens if n_halogens else 0
+        self.max_multiples = max_multiples
+        self.labels = range(n_halogens + 1)
+        self.multiple_orders = tuple(multiple_orders)
+
+    def children(self, node: _Node) -> Iterator[_Node]:
+        """Canonical children, one augmentation per orbit of ``node``'s atoms."""
+        grow_carbon = node.carbons < self.max_carbons
+        grow_halogen = node.halogens < self.max_halogens
+        if not (grow_carbon or grow_halogen):
+            return
+        orders = (1,) + (self.multiple_orders if node.multiples < self.max_multiples else ())
+        if not node.orbits:
+            node.orbits = _orbits(node)
+        done = set()
+        for v, orbit in enumerate(node.orbits):
+            if orbit in done or node.labels[v] != 0:
+                continue
+            done.add(orbit)
+            free = _VALENCE_C - node.used[v]
+            for label in self.labels:
+                if (grow_halogen if label else grow_carbon) is False:
+                    continue
+                for order in orders if label == 0 else (1,):
+                    if order > free:
+                        break
+                    child = node.grow(v, label, order)
+                    if _is_canonical(child):
+                        yield child
+
+
+def isomers(
+    max_carbons: int,
+    *,
+    min_carbons: int = 1,
+    halogens: Sequence[str] = (),
+    max_halogens: int = 0,
+    max_multiple_bonds: int = 0,
+    multiple_orders: Sequence[int] = (2, 3),
+    shard: int = 0,
+    of: int = 1,
+    progress: Callable[[EnumerationStats], None] | None = None,
+    report_every: int = 100_000,
+) -> Iterator[Molecule]:
+    """Yield every acyclic molecule in bounds exactly once, up to isomorphism.
+
+    A molecule has ``min_carbons``–``max_carbons`` connected carbons, up to
+    ``max_halogens`` atoms from ``halogens`` (each on a carbon) and up to
+    ``max_multiple_bonds`` carbon–carbon bonds of the ``multiple_orders``
+    given; hydrogens are implicit.  ``shard=i, of=n`` yields the ``i``‑th of
+    ``n`` disjoint parts whose union is the whole set, so ``n`` workers can
+    split a run without talking to each other.  ``progress`` is called every
+    ``report_every`` molecules and once at the end.
+    """
+    if max_carbons < 1 or min_carbons < 1:
+        raise ValueError("carbon bounds must be >= 1")
+    if not 0 <= shard < of:
+        raise ValueError("need 0 <= shard < of")
+    unknown = set(halogens) - set(HALOGENS)
+    if unknown:
+        raise ValueError(f"Unsupported halogen(s) {sorted(unknown)}")
+    if not set(multiple_orders) <= {2, 3}:
+        raise ValueError("multiple_orders may only contain 2 and 3")
+    if max_halogens < 0 or max_multiple_bonds < 0:
+        raise ValueError("limits must be >= 0")
+
+    rules = _Rules(max_carbons, max_halogens, max_multiple_bonds, len(halogens), sorted(multiple_orders))
+    symbols = ("C", *halogens)
+    start = time.perf_counter()
+    count = 0
+    for node in _shard(rules, shard, of):
+        if node.carbons < min_carbons:
+            continue
+        yield node.molecule(symbols)
+        count += 1
+        if progress is not None and count % report_every == 0:
+            progress(EnumerationStats(count, time.perf_counter() - start))
+    if progress is not None:
+        progress(EnumerationStats(count, time.perf_counter() - start))
+
+
+def _shard(rules: _Rules, shard: int, of: int) -> Iterator[_Node]:
+    """Nodes of one shard: the search tree is cut at the first level with
+    enough nodes, which are dealt round robin; shard 0 also owns the levels
+    above the cut."""
+    level = [_Node()]
+    while len(level) < _SPLIT_NODES * of:
+        below = [child for node in level for child in rules.children(node)]
+        if not below:
+            break
+        if shard == 0:
+            yield from level
+        level = below
+    stack = level[shard::of][::-1]
+    while stack:
+        node = stack.pop()
+        yield node
+        stack.extend(reversed(list(rules.children(node))))
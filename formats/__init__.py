@@ -0,0 +1,6 @@
+"""Readers and writers turning external formats into Molecule graphs."""
+from .binary import MoleculeFile, MoleculeWriter, dump  # noqa: F401
+from .sdf import SdfRecord, read_sdf, sdf_ranges  # noqa: F401
+from .smiles import parse_smiles  # noqa: F401
+
+__all__ = ["MoleculeFile", "MoleculeWriter", "SdfRecord", "dump", "parse_smiles", "read_sdf", "sdf_ranges"]
@@ -0,0 +1,321 @@
+"""Versioned binary molecule records and an mmap‑able multi‑molecule container.
+
+A record is the :class:`~chemname.core.frozen.FrozenMolecule` CSR arrays
+written back to back, little‑endian, after a fixed header::
+
+    header   "CNMb" version:u8 flags:u8 reserved:u16 atoms:u32 slots:u32 extra:u32 pad:u32
+    indices  u32[atoms]       offsets  u32[atoms + 1]    targets  u32[slots]
+    elements u16[atoms]       isotopes u16[atoms]        charges  i8[atoms]
+    orders   u8[slots]        extra symbols (UTF‑8, NUL separated)
+
+``slots`` is twice the bond count.  :func:`decode` returns a frozen graph
+whose arrays are ``memoryview`` casts into the buffer, so nothing is copied.
+
+A container file is a header, records (8‑byte aligned) and an offset index::
+
+    header   "CNMF" version:u16 reserved:u16 count:u64 index_at:u64
+    records  …
+    index    u64[count + 1]   (record k spans index[k]:index[k + 1])
+
+:class:`MoleculeFile` maps it read‑only and decodes record ``k`` on demand.
+"""
+
+from __future__ import annotations
+
+import mmap
+import os
+import struct
+import sys
+from array import array
+from functools import lru_cache, partial
+from typing import BinaryIO, Dict, Iterable, Iterator, List, Tuple
+
+from ..core.exceptions import BinaryFormatError
+from ..core.frozen import FrozenMolecule
+from ..core.structures import Molecule
+from ..naming.batch import NameResult, _name_chunk, _stored, _stream
+from ..util import BOND_ORDERS
+
+VERSION = 1
+RECORD_MAGIC = b"CNMb"
+FILE_MAGIC = b"CNMF"
+_RECORD = struct.Struct("<4sBBHIIII")
+_FILE = struct.Struct("<4sHHQQ")
+_NATIVE = sys.byteorder == "little"
+_ALIGN = 8
+
+
+def _pad(n: int, align: int = 4) -> int:
+    return -n % align
+
+
+def _section(typecode: str, values) -> bytes:
+    arr = array(typecode, values)
+    if not _NATIVE:  # pragma: no cover – big‑endian hosts
+        arr.byteswap()
+    raw = arr.tobytes()
+    return raw + bytes(_pad(len(raw)))
+
+
+def encode(mol: Molecule | FrozenMolecule) -> bytes:
+    """Serialise ``mol`` to one record (see the module docstring)."""
+    g = mol.freeze()
+    extra = "\0".join(g.extra_symbols).encode()
+    n, slots = len(g.indices), len(g.targets)
+    try:
+        parts = [
+            _RECORD.pack(RECORD_MAGIC, VERSION, 0, 0, n, slots, len(extra), 0),
+            _section("I", g.indices),
+            _section("I", g.offsets),
+            _section("I", g.targets),
+            _section("H", g.elements),
+            _section("H", g.isotopes),
+            _section("b", g.charges),
+            _section("B", g.orders),
+            extra,
+        ]
+    except OverflowError as exc:
+        raise BinaryFormatError(f"Molecule does not fit the v{VERSION} record: {exc}") from None
+    return b"".join(parts)
+
+
+@lru_cache(maxsize=1024)
+def _layout(n: int, slots: int, extra: int) -> Tuple[Tuple[str, int, int], ...]:
+    """(typecode, start, length in bytes) of every section after the header."""
+    out = []
+    at = _RECORD.size
+    for typecode, count in (("I", n), ("I", n + 1), ("I", slots), ("H", n), ("H", n), ("b", n), ("B", slots)):
+        size = count * array(typecode).itemsize
+        out.append((typecode, at, size))
+        at += size + _pad(size)
+    out.append(("", at, extra))
+    return tuple(out)
+
+
+def record_size(buf, offset: int = 0) -> int:
+    """Length in bytes of the record starting at ``offset``."""
+    n, slots, extra = _header(buf, offset)
+    _, at, size = _layout(n, slots, extra)[-1]
+    return at + size
+
+
+def _header(buf, offset: int) -> Tuple[int, int, int]:
+    if len(buf) - offset < _RECORD.size:
+        raise BinaryFormatError("Truncated record header")
+    magic, version, _, _, n, slots, extra, _ = _RECORD.unpack_from(buf, offset)
+    if magic != RECORD_MAGIC:
+        raise BinaryFormatError(f"Not a molecule record (magic {magic!r})")
+    if version != VERSION:
+        raise BinaryFormatError(f"Unsupported record version {version}")
+    return n, slots, extra
+
+
+def decode(buf, offset: int = 0) -> FrozenMolecule:
+    """Frozen graph over the record at ``offset`` of ``buf`` without copying.
+
+    The arrays are views into ``buf``, which must stay alive (and, for an
+    ``mmap``, open) as long as the graph is used.  Only the header is
+    checked; records are trusted to come from :func:`encode`.
+    """
+    n, slots, extra = _header(buf, offset)
+    sections = _layout(n, slots, extra)
+    end = offset + sections[-1][1] + extra
+    if len(buf) < end:
+        raise BinaryFormatError("Truncated record")
+    view = memoryview(buf)
+    arrays = []
+    for typecode, at, size in sections[:-1]:
+        raw = view[offset + at : offset + at + size]
+        if _NATIVE:
+            arrays.append(raw.cast(typecode))
+        else:  # pragma: no cover – big‑endian hosts copy
+            arr = array(typecode, raw.tobytes())
+            arr.byteswap()
+            arrays.append(arr)
+    indices, offsets, targets, elements, isotopes, charges, orders = arrays
+    at = offset + sections[-1][1]
+    symbols = tuple(bytes(view[at : at + extra]).decode().split("\0")) if extra else ()
+    return FrozenMolecule(indices, elements, charges, isotopes, offsets, targets, orders, symbols)
+
+
+def to_molecule(g: FrozenMolecule) -> Molecule:
+    """Mutable :class:`Molecule` with the same atoms and bonds as ``g``."""
+    indices = g.indices
+    symbols = g.symbols()
+    edges = []
+    orders = []
+    for p, q, code in g.edges():
+        edges.append((indices[p], indices[q]))
+        orders.append(BOND_ORDERS[code])
+    return Molecule.from_arrays(
+        symbols,
+        edges,
+        orders,
+        indices=list(indices),
+        charges=list(g.charges),
+        isotopes=list(g.isotopes),
+        trusted=True,
+    )
+
+
+# ------------------------------------------------------------------ container
+class MoleculeWriter:
+    """Append molecules to a container file; the index is written on close."""
+
+    def __init__(self, path: str) -> None:
+        self._fh: BinaryIO = open(path, "wb")
+        self._offsets: List[int] = []
+        self._fh.write(_FILE.pack(FILE_MAGIC, VERSION, 0, 0, 0))
+        self._at = _FILE.size
+
+    def add(self, mol: Molecule | FrozenMolecule) -> int:
+        """Write ``mol`` and return its position in the file."""
+        record = encode(mol)
+        self._offsets.append(self._at)
+        self._fh.write(record)
+        pad = _pad(len(record), _ALIGN)
+        self._fh.write(bytes(pad))
+        self._at += len(record) + pad
+        return len(self._offsets) - 1
+
+    def close(self) -> None:
+        if self._fh.closed:
+            return
+        index = array("Q", self._offsets + [self._at])
+        if not _NATIVE:  # pragma: no cover
+            index.byteswap()
+        self._fh.write(index.tobytes())
+        self._fh.seek(0)
+        self._fh.write(_FILE.pack(FILE_MAGIC, VERSION, 0, len(self._offsets), self._at))
+        self._fh.close()
+
+    def __enter__(self) -> "MoleculeWriter":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
+def dump(molecules: Iterable[Molecule | FrozenMolecule], path: str) -> int:
+    """Write ``molecules`` to a container file; return how many were written."""
+    with MoleculeWriter(path) as writer:
+        count = 0
+        for mol in molecules:
+            writer.add(mol)
+            count += 1
+    return count
+
+
+class MoleculeFile:
+    """Read‑only, memory‑mapped container: ``len()``, O(1) ``[k]`` and iteration.
+
+    ``frozen(k)`` is a zero‑copy view into the map; ``[k]`` builds a
+    :class:`Molecule`.  Views keep the mapping alive after :meth:`close`
+    (``closed`` stays false until it is really unmapped).
+    """
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        with open(path, "rb") as fh:
+            if os.fstat(fh.fileno()).st_size < _FILE.size:  # mmap refuses an empty file
+                raise BinaryFormatError("Truncated container header")
+            self._map = mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, version, _, count, index_at = _FILE.unpack_from(self._map, 0)
+        if magic != FILE_MAGIC:
+            raise BinaryFormatError(f"Not a molecule container (magic {magic!r})")
+        if version != VERSION:
+            raise BinaryFormatError(f"Unsupported container version {version}")
+        if index_at + 8 * (count + 1) > len(self._map):
+            raise BinaryFormatError("Truncated container index")
+        raw = memoryview(self._map)[index_at : index_at + 8 * (count + 1)]
+        self._index = raw.cast("Q") if _NATIVE else _swapped(raw)
+        self._count = count
+        self._reading = True
+
+    @property
+    def closed(self) -> bool:
+        return self._map.closed
+
+    def __len__(self) -> int:
+        return self._count
+
+    def _offset(self, k: int) -> int:
+        if not self._reading:
+            raise ValueError("MoleculeFile is closed")
+        if k < 0:
+            k += self._count
+        if not 0 <= k < self._count:
+            raise IndexError("molecule index out of range")
+        return self._index[k]
+
+    def frozen(self, k: int) -> FrozenMolecule:
+        return decode(self._map, self._offset(k))
+
+    def __getitem__(self, k: int) -> Molecule:
+        return to_molecule(self.frozen(k))
+
+    def __iter__(self) -> Iterator[Molecule]:
+        for k in range(self._count):
+            yield self[k]
+
+    def iter_frozen(self) -> Iterator[FrozenMolecule]:
+        for k in range(self._count):
+            yield self.frozen(k)
+
+    def name_many(
+        self,
+        workers: int | None = None,
+        chunksize: int = 256,
+        *,
+        ordered: bool = True,
+        max_pending: int | None = None,
+        store: str | None = None,
+    ) -> Iterator[NameResult]:
+        """:func:`~chemname.naming.batch.name_many` over the file.
+
+        Workers map the file themselves and are sent record numbers only.
+        """
+        if workers is None:
+            workers = os.cpu_count() or 1
+        work = partial(_name_records, self.path) if workers > 1 else self._name_chunk
+        return _stream(range(self._count), _stored(work, store), workers, chunksize, ordered, max_pending)
+
+    def _name_chunk(self, chunk: List[Tuple[int, int]]) -> List[NameResult]:
+        return _name_chunk([(i, self.frozen(k)) for i, k in chunk])
+
+    def close(self) -> None:
+        """Stop reading and unmap the file.
+
+        While frozen views still point into the map it stays mapped and
+        ``closed`` false; call ``close()`` again once they are gone.
+        """
+        self._reading = False
+        if isinstance(self._index, memoryview):
+            self._index.release()
+        try:
+            self._map.close()
+        except BufferError:  # frozen views still point into the map: retried by the next close()
+            pass
+
+    def __enter__(self) -> "MoleculeFile":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
+def _swapped(raw: memoryview) -> array:  # pragma: no cover – big‑endian hosts
+    arr = array("Q", raw.tobytes())
+    arr.byteswap()
+    return arr
+
+
+_open_files: Dict[str, MoleculeFile] = {}
+
+
+def _name_records(path: str, chunk: List[Tuple[int, int]]) -> List[NameResult]:
+    """Pool worker entry point: name records ``k`` of ``path`` (one map per process)."""
+    reader = _open_files.get(path)
+    if reader is None:
+        reader = _open_files[path] = MoleculeFile(path)
+    return reader._name_chunk(chunk)
@@ -0,0 +1,330 @@
+"""Streaming reader for MDL molfiles and SD files (V2000 and V3000 tables).
+
+:func:`read_sdf` yields one :class:`SdfRecord` per ``$$$$``‑terminated
+record, holding only that record's lines, so memory stays flat however
+large the file.  A record keeps its title (first header line) and its
+``> <KEY>`` data items, and turns its connection table into a
+:class:`Molecule` (:meth:`~SdfRecord.to_molecule`) or straight into a
+:class:`~chemname.core.frozen.FrozenMolecule` (:meth:`~SdfRecord.freeze`,
+also what :func:`~chemname.naming.name` uses when handed a record).
+
+Read: atom symbols, ``M  CHG``/``M  ISO`` (or, without them, atom‑block
+charges), V3000 ``CHG=``/``MASS=``, bond types 1–3 and 4 (aromatic).
+Coordinates, stereo, S‑groups and other blocks are skipped.  Query atoms
+(``A``, ``Q``, ``L``, ``*`` and V3000 atom lists) and charges or masses a
+frozen graph cannot hold are errors.  A record whose table cannot be read
+still yields, with :attr:`~SdfRecord.error` set; its
+``freeze()``/``to_molecule()`` raise that :class:`SdfError`.
+
+:func:`sdf_ranges` cuts a file into byte ranges that start on record
+boundaries; ``read_sdf(path, start, end)`` reads the records beginning in
+one of them, so workers can share a file without coordinating.
+"""
+
+from __future__ import annotations
+
+import os
+import re
+from typing import IO, Dict, Iterator, List, Tuple, Union
+
+from ..core.exceptions import SdfError
+from ..core.frozen import FrozenMolecule
+from ..core.structures import Molecule
+
+Source = Union[str, "os.PathLike[str]", IO[bytes]]
+
+_V2000_CHARGES = {"": 0, "0": 0, "1": 3, "2": 2, "3": 1, "4": 0, "5": -1, "6": -2, "7": -3}  # 4: doublet radical
+_BOND_TYPES = {1: 1, 2: 2, 3: 3, 4: "ar"}
+_QUERY_SYMBOLS = frozenset({"A", "Q", "L", "*"})  # any atom, any hetero atom, atom list, anything
+_CHARGES = range(-128, 128)  # what the frozen graph stores
+_ISOTOPES = range(0, 1 << 16)
+_V30_TOKEN = re.compile(r'(?:[^\s"(]|"[^"]*"|\([^)]*\))+')
+_DATA_KEY = re.compile(r"<([^>]*)>")
+
+
+class SdfRecord:
+    """One SDF record: title, data items and its connection table as arrays.
+
+    ``symbols``, ``edges`` (0‑based atom pairs), ``orders``, ``charges`` and
+    ``isotopes`` are :meth:`Molecule.from_arrays` input.  ``offset`` is the
+    byte position of the record in its file.
+    """
+
+    __slots__ = ("title", "properties", "offset", "symbols", "edges", "orders", "charges", "isotopes", "error")
+
+    def __init__(self, title: str, properties: Dict[str, str], offset: int) -> None:
+        self.title = title
+        self.properties = properties
+        self.offset = offset
+        self.symbols: List[str] = []
+        self.edges: List[Tuple[int, int]] = []
+        self.orders: List[int | str] = []
+        self.charges: List[int] = []
+        self.isotopes: List[int] = []
+        self.error: SdfError | None = None
+
+    def freeze(self) -> FrozenMolecule:
+        self._check()
+        try:
+            return FrozenMolecule.from_arrays(
+                self.symbols, self.edges, self.orders, charges=self.charges, isotopes=self.isotopes
+            )
+        except ValueError as exc:
+            raise SdfError(f"Record at byte {self.offset}: {exc}") from None
+
+    def to_molecule(self) -> Molecule:
+        self._check()
+        try:
+            return Molecule.from_arrays(
+                self.symbols,
+                self.edges,
+                self.orders,
+                charges=self.charges,
+                isotopes=self.isotopes,
+            )
+        except ValueError as exc:
+            raise SdfError(f"Record at byte {self.offset}: {exc}") from None
+
+    def _check(self) -> None:
+        if self.error is not None:
+            raise self.error
+
+    def __repr__(self) -> str:  # pragma: no cover
+        return f"<SdfRecord {self.title!r} atoms={len(self.symbols)} bonds={len(self.edges)}>"
+
+
+def read_sdf(source: Source, start: int = 0, end: int | None = None) -> Iterator[SdfRecord]:
+    """Yield the records of an SD file (or a lone molfile) one at a time.
+
+    ``source`` is a path or a binary file object.  With ``start``/``end``
+    only records beginning at a byte in ``[start, end)`` are read;
+    ``start`` must be a record boundary (see :func:`sdf_ranges`).
+    """
+    if isinstance(source, (str, os.PathLike)):
+        with open(source, "rb") as fh:
+            yield from _records(fh, start, end)
+    else:
+        yield from _records(source, start, end)
+
+
+def sdf_ranges(path: Union[str, "os.PathLike[str]"], parts: int) -> List[Tuple[int, int]]:
+    """Split ``path`` into at most ``parts`` byte ranges cut after ``$$$$`` lines.
+
+    The ranges cover the file, and each record starts in exactly one of
+    them.  Only the bytes near each cut are read.
+    """
+    if parts < 1:
+        raise ValueError("parts must be at least 1")
+    size = os.path.getsize(path)
+    cuts = [0]
+    with open(path, "rb") as fh:
+        for k in range(1, parts):
+            at = max(size * k // parts, cuts[-1])
+            fh.seek(max(at - 1, 0))
+            if at:
+                fh.readline()  # finish the line holding byte at - 1
+            while True:
+                line = fh.readline()
+                if not line:
+                    break
+                if line.rstrip() == b"$$$$":
+                    break
+            cut = fh.tell()
+            if cut >= size:
+                break
+            if cut > cuts[-1]:
+                cuts.append(cut)
+    cuts.append(size)
+    return list(zip(cuts, cuts[1:]))
+
+
+# ------------------------------------------------------------------- records
+def _records(fh: IO[bytes], start: int, end: int | None) -> Iterator[SdfRecord]:
+    if start:
+        fh.seek(start)
+    try:
+        at = fh.tell()
+    except (OSError, ValueError):  # pipes
+        at = start
+    chunk: List[bytes] = []
+    first = at
+    if end is not None and at >= end:
+        return
+    for raw in fh:
+        at += len(raw)
+        if raw.startswith(b"$$$$") and raw.rstrip() == b"$$$$":
+            yield _record(_lines(chunk), first)
+            chunk = []
+            first = at
+            if end is not None and at >= end:
+                return
+        else:
+            chunk.append(raw)
+    lines = _lines(chunk)
+    if any(line.strip() for line in lines):
+        yield _record(lines, first)
+
+
+def _lines(chunk: List[bytes]) -> List[str]:
+    text = b"".join(chunk).decode("utf-8", "replace").replace("\r\n", "\n")
+    lines = text.split("\n")  # not splitlines(): data items may hold form feeds and the like
+    if lines[-1] == "":
+        lines.pop()
+    return lines
+
+
+def _record(lines: List[str], offset: int) -> SdfRecord:
+    stop = next((k for k, line in enumerate(lines) if line.startswith("M  END")), len(lines))
+    record = SdfRecord(lines[0].strip() if lines else "", _properties(lines, stop + 1), offset)
+    try:
+        if stop == len(lines):
+            raise SdfError("no 'M  END' line")
+        if stop < 4:
+            raise SdfError("truncated header")
+        if lines[3].rstrip().endswith("V3000"):
+            _v3000(record, lines, stop)
+        else:
+            _v2000(record, lines, stop)
+    except (SdfError, ValueError, IndexError) as exc:
+        record.symbols, record.edges, record.orders, record.charges, record.isotopes = [], [], [], [], []
+        record.error = SdfError(f"Record at byte {offset} ({record.title!r}): {exc}")
+    return record
+
+
+def _properties(lines: List[str], k: int) -> Dict[str, str]:
+    """``> <KEY>`` data items after ``M  END``; values end at a blank line."""
+    props: Dict[str, str] = {}
+    n = len(lines)
+    while k < n:
+        line = lines[k]
+        k += 1
+        if not line.startswith(">"):
+            continue
+        match = _DATA_KEY.search(line)
+        key = match.group(1) if match else line[1:].strip()
+        values = []
+        while k < n and lines[k].strip():
+            values.append(lines[k])
+            k += 1
+        props[key] = "\n".join(values)
+    return props
+
+
+def _field(line: str, a: int, b: int) -> int:
+    text = line[a:b].strip()
+    return int(text) if text else 0
+
+
+def _bond(record: SdfRecord, a: int, b: int, kind: int) -> None:
+    order = _BOND_TYPES.get(kind)
+    if order is None:
+        raise SdfError(f"unsupported bond type {kind} between atoms {a + 1} and {b + 1}")
+    record.edges.append((a, b))
+    record.orders.append(order)
+
+
+def _v2000(record: SdfRecord, lines: List[str], stop: int) -> None:
+    counts = lines[3]
+    n, m = _field(counts, 0, 3), _field(counts, 3, 6)
+    if 4 + n + m > stop:
+        raise SdfError(f"counts line promises {n} atoms and {m} bonds, the table is shorter")
+    symbols = record.symbols
+    charges = record.charges
+    mass_shift = False
+    for line in lines[4 : 4 + n]:
+        symbol = line[31:34].strip()
+        if not symbol:
+            raise SdfError(f"atom line without a symbol: {line!r}")
+        symbols.append(_structure_symbol(symbol))
+        mass_shift = mass_shift or line[34:36].strip() not in ("", "0")
+        charges.append(_V2000_CHARGES.get(line[36:39].strip(), 0))
+    record.isotopes = [0] * n
+    for line in lines[4 + n : 4 + n + m]:  # bond lines always fill their first three fields
+        a, b = int(line[0:3]), int(line[3:6])
+        if not (1 <= a <= n and 1 <= b <= n):
+            raise SdfError(f"bond to a missing atom: {line!r}")
+        _bond(record, a - 1, b - 1, int(line[6:9]))
+
+    charged = isotoped = False
+    for line in lines[4 + n + m : stop]:
+        tag = line[:6]
+        if tag in ("M  CHG", "M  RAD") and not charged:  # either resets the atom‑block charges
+            record.charges = [0] * n
+            charged = True
+        if tag not in ("M  CHG", "M  ISO"):
+            continue
+        fields = line[6:].split()
+        pairs = fields[1 : 1 + 2 * int(fields[0])]
+        target = record.charges if tag == "M  CHG" else record.isotopes
+        isotoped = isotoped or tag == "M  ISO"
+        for k in range(0, len(pairs) - 1, 2):
+            atom = int(pairs[k])
+            if not 1 <= atom <= n:
+                raise SdfError(f"{tag} names a missing atom {atom}")
+            target[atom - 1] = _in_range(tag, int(pairs[k + 1]), _CHARGES if tag == "M  CHG" else _ISOTOPES)
+    if mass_shift and not isotoped:
+        raise SdfError("atom-block mass differences need standard masses; give isotopes with 'M  ISO'")
+
+
+def _v3000(record: SdfRecord, lines: List[str], stop: int) -> None:
+    statements: List[str] = []
+    pending = ""
+    for line in lines[4:stop]:
+        if not line.startswith("M  V30 "):
+            continue
+        text = pending + line[7:]
+        if text.endswith("-"):
+            pending = text[:-1]
+            continue
+        pending = ""
+        statements.append(text.strip())
+
+    block = None
+    found = False
+    atoms: Dict[int, int] = {}
+    for text in statements:
+        if text.startswith("BEGIN "):
+            block = text[6:].split()[0]
+            found = found or block == "CTAB"
+            continue
+        if text.startswith("END "):
+            block = None
+            continue
+        tokens = _V30_TOKEN.findall(text)
+        if block == "ATOM":
+            idx, symbol = int(tokens[0]), tokens[1]
+            if symbol.startswith("[") or symbol == "NOT":
+                raise SdfError(f"atom list {symbol!r} is a query, not a structure")
+            atoms[idx] = len(record.symbols)
+            record.symbols.append(_structure_symbol(symbol))
+            props = _v30_props(tokens[6:])
+            record.charges.append(_in_range("CHG", int(props.get("CHG", 0)), _CHARGES))
+            record.isotopes.append(_in_range("MASS", int(props.get("MASS", 0)), _ISOTOPES))
+        elif block == "BOND":
+            kind, a, b = int(tokens[1]), int(tokens[2]), int(tokens[3])
+            if a not in atoms or b not in atoms:
+                raise SdfError(f"bond {tokens[0]} to a missing atom")
+            _bond(record, atoms[a], atoms[b], kind)
+    if not found:
+        raise SdfError("no V3000 connection table")
+
+
+def _structure_symbol(symbol: str) -> str:
+    if symbol in _QUERY_SYMBOLS:
+        raise SdfError(f"atom symbol {symbol!r} is a query, not a structure")
+    return symbol
+
+
+def _in_range(tag: str, value: int, allowed: range) -> int:
+    if value not in allowed:
+        raise SdfError(f"{tag} value {value} outside {allowed.start}…{allowed.stop - 1}")
+    return value
+
+
+def _v30_props(tokens: List[str]) -> Dict[str, str]:
+    props = {}
+    for token in tokens:
+        key, sep, value = token.partition("=")
+        if sep:
+            props[key.upper()] = value
+    return props
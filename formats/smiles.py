@@ -0,0 +1,160 @@
+"""Minimal SMILES reader for the acyclic, non‑aromatic subset the namer supports.
+
+Supported: organic‑subset atoms, bracket atoms (isotope, H count, charge;
+chirality and atom classes are accepted and ignored), explicit bonds
+``- = #`` (``/`` and ``\\`` read as single bonds), branches and ``.``
+separated fragments.  Hydrogens stay implicit; atoms are indexed 0… in the
+order they are written.  By default anything the namer would misname is
+refused: elements other than carbon and the halogens, charges, more than
+one fragment and atoms bonded beyond their valence.
+"""
+
+from __future__ import annotations
+
+from typing import List
+
+from ..core.exceptions import SmilesError
+from ..core.structures import Molecule
+
+_ORGANIC = {"B", "C", "N", "O", "P", "S", "F", "Cl", "Br", "I"}
+_BOND_ORDERS = {"-": 1, "/": 1, "\\": 1, "=": 2, "#": 3}
+_AROMATIC = set("bcnops")
+_VALENCE = {"C": 4, "F": 1, "Cl": 1, "Br": 1, "I": 1}  # what ``strict`` accepts
+
+
+def _bracket_atom(text: str, i: int, end: int) -> tuple[str, int | None, int, int]:
+    """Parse ``[...]`` contents between ``i`` and ``end``; return (symbol, isotope, charge, H count)."""
+    j = i
+    while j < end and text[j].isdigit():
+        j += 1
+    isotope = int(text[i:j]) if j > i else None
+    if j >= end or not text[j].isalpha():
+        raise SmilesError(f"Missing element symbol in bracket atom at {i - 1}")
+    if text[j].islower():
+        raise SmilesError(f"Aromatic atom at {j} is not supported")
+    symbol = text[j]
+    j += 1
+    if j < end and text[j].islower():
+        symbol += text[j]
+        j += 1
+    while j < end and text[j] == "@":  # chirality carries no naming information
+        j += 1
+    hydrogens = 0
+    if j < end and text[j] == "H":
+        k = j + 1
+        while k < end and text[k].isdigit():
+            k += 1
+        hydrogens = int(text[j + 1 : k]) if k > j + 1 else 1
+        j = k
+    charge = 0
+    if j < end and text[j] in "+-":
+        sign = 1 if text[j] == "+" else -1
+        k = j + 1
+        while k < end and text[k] == text[j]:
+            k += 1
+        if k > j + 1:
+            charge = sign * (k - j)
+        else:
+            while k < end and text[k].isdigit():
+                k += 1
+            charge = sign * (int(text[j + 1 : k]) if k > j + 1 else 1)
+        j = k
+    if j < end and text[j] == ":":
+        j = end
+    if j != end:
+        raise SmilesError(f"Unexpected {text[j]!r} in bracket atom at {j}")
+    return symbol, isotope, charge, hydrogens
+
+
+def parse_smiles(text: str, *, strict: bool = True) -> Molecule:
+    """Build a :class:`Molecule` from a SMILES string.
+
+    ``strict=False`` reads any element, charge and fragment count (valence is
+    then not checked either).
+    """
+    text = text.strip()
+    if not text:
+        raise SmilesError("Empty SMILES")
+    mol = Molecule()
+    stack: List[int] = []
+    room: List[int] = []  # per atom: valence left for bonds (strict only)
+    prev: int | None = None
+    order: int | None = None
+    n = 0
+    i = 0
+    length = len(text)
+    while i < length:
+        ch = text[i]
+        if ch == "(":
+            if prev is None:
+                raise SmilesError(f"Branch without a preceding atom at {i}")
+            stack.append(prev)
+            i += 1
+            continue
+        if ch == ")":
+            if not stack or order is not None:
+                raise SmilesError(f"Unbalanced ')' at {i}")
+            prev = stack.pop()
+            i += 1
+            continue
+        if ch == ".":
+            if order is not None:
+                raise SmilesError(f"Bond before '.' at {i}")
+            prev = None
+            i += 1
+            continue
+        if ch in _BOND_ORDERS:
+            if prev is None or order is not None:
+                raise SmilesError(f"Misplaced bond {ch!r} at {i}")
+            order = _BOND_ORDERS[ch]
+            i += 1
+            continue
+        if ch.isdigit() or ch == "%":
+            raise SmilesError(f"Ring closure at {i} is not supported")
+
+        start = i
+        isotope, charge, hydrogens = None, 0, 0
+        if ch == "[":
+            end = text.find("]", i)
+            if end < 0:
+                raise SmilesError(f"Unclosed bracket atom at {i}")
+            symbol, isotope, charge, hydrogens = _bracket_atom(text, i + 1, end)
+            i = end + 1
+        elif text.startswith(("Cl", "Br"), i):
+            symbol = text[i : i + 2]
+            i += 2
+        elif ch in _ORGANIC:
+            symbol = ch
+            i += 1
+        elif ch in _AROMATIC:
+            raise SmilesError(f"Aromatic atom at {i} is not supported")
+        else:
+            raise SmilesError(f"Unexpected {ch!r} at {i}")
+        if strict:
+            if symbol not in _VALENCE:
+                raise SmilesError(f"Element {symbol} at {start} is not supported")
+            if charge:
+                raise SmilesError(f"Charged atom at {start} is not supported")
+            if prev is None and n:
+                raise SmilesError(f"Second fragment at {start} is not supported")
+            room.append(_VALENCE[symbol] - hydrogens)
+        mol.add_atom(symbol, n, isotope=isotope, charge=charge)
+
+        if prev is not None:
+            mol.add_bond(prev, n, order or 1)
+            if strict:
+                room[prev] -= order or 1
+                room[n] -= order or 1
+        if strict:
+            for k in (prev, n):
+                if k is not None and room[k] < 0:
+                    raise SmilesError(f"Atom {k} has too many bonds at {start}")
+        order = None
+        prev = n
+        n += 1
+
+    if stack:
+        raise SmilesError("Unclosed branch")
+    if order is not None:
+        raise SmilesError("SMILES ends with a bond")
+    return mol
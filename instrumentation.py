@@ -0,0 +1,174 @@
+"""Opt‑in per‑stage timing and counters for the naming pipeline.
+
+Disabled by default; every probe then costs one flag check.  Once enabled,
+each stage records call count, cumulative/max wall time, net allocated
+blocks (and traced bytes with ``enable(allocations=True)``) and, for whole
+``name()`` calls, graph sizes.  Stages nest, so records are keyed by their
+call path (``"name;find_chain;substituents"``), which is exactly what the
+collapsed‑stack export needs.  Statistics are per process.
+"""
+
+from __future__ import annotations
+
+import sys
+import threading
+import time
+from typing import Any, Callable, Dict, List, TypeVar
+
+T = TypeVar("T")
+
+enabled = False
+_allocations = False
+_started_tracemalloc = False
+_lock = threading.Lock()
+_local = threading.local()
+
+
+class _StageStats:
+    __slots__ = (
+        "calls",
+        "total",
+        "max",
+        "alloc_blocks",
+        "alloc_bytes",
+        "atoms",
+        "atoms_max",
+        "bonds",
+        "bonds_max",
+    )
+
+    def __init__(self) -> None:
+        self.calls = 0
+        self.total = self.max = 0.0
+        self.alloc_blocks = self.alloc_bytes = 0
+        self.atoms = self.atoms_max = self.bonds = self.bonds_max = 0
+
+    def as_dict(self) -> Dict[str, Any]:
+        out: Dict[str, Any] = {
+            "calls": self.calls,
+            "total_s": self.total,
+            "max_s": self.max,
+            "mean_s": self.total / self.calls if self.calls else 0.0,
+            "alloc_blocks": self.alloc_blocks,
+        }
+        if _allocations:
+            out["alloc_bytes"] = self.alloc_bytes
+        if self.atoms:
+            out.update(atoms=self.atoms, atoms_max=self.atoms_max, bonds=self.bonds, bonds_max=self.bonds_max)
+        return out
+
+
+_records: Dict[str, _StageStats] = {}
+
+
+def enable(*, allocations: bool = False) -> None:
+    """Start recording; ``allocations=True`` also traces bytes via tracemalloc."""
+    global enabled, _allocations, _started_tracemalloc
+    _allocations = allocations
+    if allocations:
+        import tracemalloc  # imported only when asked for: it is slow to load
+
+        if not tracemalloc.is_tracing():
+            tracemalloc.start()
+            _started_tracemalloc = True
+    enabled = True
+
+
+def disable() -> None:
+    """Stop recording (collected statistics are kept until :func:`reset`)."""
+    global enabled, _started_tracemalloc
+    enabled = False
+    if _started_tracemalloc:
+        import tracemalloc
+
+        tracemalloc.stop()
+        _started_tracemalloc = False
+
+
+def reset() -> None:
+    with _lock:
+        _records.clear()
+
+
+def timed(stage: str, fn: Callable[..., T], *args: Any, graph: Any = None) -> T:
+    """Call ``fn(*args)``, recording it under ``stage`` when enabled.
+
+    ``graph`` (anything with ``len()`` and ``n_bonds``) adds graph sizes.
+    """
+    if not enabled:
+        return fn(*args)
+
+    stack: List[str] | None = getattr(_local, "stack", None)
+    if stack is None:
+        stack = _local.stack = []
+    stack.append(stage)
+    path = ";".join(stack)
+    traced = False
+    if _allocations:
+        import tracemalloc
+
+        traced = tracemalloc.is_tracing()
+    mem0 = tracemalloc.get_traced_memory()[0] if traced else 0
+    blocks0 = sys.getallocatedblocks()
+    t0 = time.perf_counter()
+    try:
+        return fn(*args)
+    finally:
+        elapsed = time.perf_counter() - t0
+        blocks = sys.getallocatedblocks() - blocks0
+        mem = tracemalloc.get_traced_memory()[0] - mem0 if traced else 0
+        stack.pop()
+        with _lock:
+            rec = _records.get(path)
+            if rec is None:
+                rec = _records[path] = _StageStats()
+            rec.calls += 1
+            rec.total += elapsed
+            if elapsed > rec.max:
+                rec.max = elapsed
+            rec.alloc_blocks += blocks
+            rec.alloc_bytes += mem
+            if graph is not None:
+                n_atoms, n_bonds = len(graph), graph.n_bonds
+                rec.atoms += n_atoms
+                rec.bonds += n_bonds
+                rec.atoms_max = max(rec.atoms_max, n_atoms)
+                rec.bonds_max = max(rec.bonds_max, n_bonds)
+
+
+def stats() -> Dict[str, Dict[str, Any]]:
+    """Return ``{call path: counters}`` for everything recorded so far."""
+    with _lock:
+        return {path: rec.as_dict() for path, rec in _records.items()}
+
+
+def to_json(path: str | None = None) -> str:
+    """Serialise :func:`stats` as JSON (and write it to ``path`` if given)."""
+    import json
+
+    text = json.dumps({"enabled": enabled, "stages": stats()}, indent=1, sort_keys=True)
+    if path is not None:
+        with open(path, "w", encoding="utf-8") as fh:
+            fh.write(text)
+    return text
+
+
+def to_collapsed(path: str | None = None) -> str:
+    """Export self time per call path in collapsed‑stack format (µs).
+
+    One ``name;find_chain;substituents 123`` line per path, ready for
+    ``flamegraph.pl`` or speedscope.
+    """
+    with _lock:
+        totals = {p: rec.total for p, rec in _records.items()}
+    self_time = dict(totals)
+    for p, total in totals.items():
+        parent, _, _ = p.rpartition(";")
+        if parent in self_time:
+            self_time[parent] -= total
+    lines = [f"{p} {max(0, round(t * 1e6))}" for p, t in sorted(self_time.items())]
+    text = "\n".join(lines) + ("\n" if lines else "")
+    if path is not None:
+        with open(path, "w", encoding="utf-8") as fh:
+            fh.write(text)
+    return text
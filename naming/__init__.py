@@ -1,5 +1,53 @@
-"""Straight‑chain naming (v0.2.0)."""
+"""Straight‑chain naming (v0.2.0).
 
-from .namer import name  # noqa: F401
+Public names are imported on first use, so importing one naming module
+(``naming.namer``, say) does not pull in asyncio, the process pool or
+SQLite.
+"""
 
-__all__ = ["name"]
+from importlib import import_module
+
+TYPE_CHECKING = False  # typing.TYPE_CHECKING without importing typing
+
+_EXPORTS = {
+    "CacheInfo": ".cache",
+    "NameParts": ".parts",
+    "NameResult": ".batch",
+    "NameStore": ".store",
+    "aname": ".aio",
+    "aname_stream": ".aio",
+    "cache_clear": ".cache",
+    "cache_info": ".cache",
+    "name": ".namer",
+    "name_many": ".batch",
+    "name_parts": ".namer",
+    "name_shared": ".shared",
+    "parse": ".parser",
+    "set_cache_size": ".cache",
+    "use_store": ".store",
+}
+
+__all__ = list(_EXPORTS)
+
+if TYPE_CHECKING:  # pragma: no cover
+    from .aio import aname, aname_stream
+    from .batch import NameResult, name_many
+    from .cache import CacheInfo, cache_clear, cache_info, set_cache_size
+    from .namer import name, name_parts
+    from .parser import parse
+    from .parts import NameParts
+    from .shared import name_shared
+    from .store import NameStore, use_store
+
+
+def __getattr__(attr: str):
+    module = _EXPORTS.get(attr)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {attr!r}")
+    value = getattr(import_module(module, __name__), attr)
+    globals()[attr] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_EXPORTS))
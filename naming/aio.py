@@ -0,0 +1,139 @@
+"""asyncio front‑end: name molecules off the event loop, with backpressure."""
+
+from __future__ import annotations
+
+import asyncio
+from concurrent.futures import Executor
+from itertools import islice
+from typing import AsyncIterable, AsyncIterator, Iterable, Iterator, List, Tuple
+
+from ..core.structures import Molecule
+from .batch import NameResult, _name_chunk
+from .namer import name
+
+
+async def aname(mol: Molecule, *, executor: Executor | None = None) -> str:
+    """``await`` :func:`name` run in ``executor`` (default: the loop's thread pool).
+
+    Naming is CPU‑bound and pure Python, so a
+    :class:`~concurrent.futures.ProcessPoolExecutor` keeps the loop far more
+    responsive than threads, which still share the GIL with it.
+    """
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(executor, name, mol)
+
+
+_END = object()
+
+
+async def aname_stream(
+    molecules: AsyncIterable[Molecule] | Iterable[Molecule],
+    concurrency: int = 4,
+    *,
+    executor: Executor | None = None,
+    ordered: bool = True,
+    chunksize: int = 1,
+) -> AsyncIterator[NameResult]:
+    """Name ``molecules`` in ``executor``, yielding one :class:`NameResult` each.
+
+    At most ``concurrency`` chunks of ``chunksize`` molecules are being
+    named or waiting to be consumed at any time: the input is not read
+    further until the caller takes a result, so a slow consumer throttles a
+    fast producer.  Larger chunks amortise the hand‑off to a process pool
+    but hold back the first result of each chunk until it is full.  With
+    ``ordered=False`` results come back as their chunks finish.  Closing or
+    cancelling the iterator stops reading the input and cancels queued work;
+    an exception raised by the input is re‑raised here after the results
+    already named.  A plain (non‑async) iterable other than a list or tuple
+    is read ``chunksize`` items at a time in the loop's default thread pool,
+    so a slow generator does not block the loop either.
+    """
+    if concurrency < 1:
+        raise ValueError("concurrency must be >= 1")
+    if chunksize < 1:
+        raise ValueError("chunksize must be >= 1")
+    loop = asyncio.get_running_loop()
+    slots = asyncio.Semaphore(concurrency)
+    ready: asyncio.Queue = asyncio.Queue()  # futures, bounded by ``slots``
+    submitted: set[asyncio.Future] = set()
+    fed = 0
+    failure: BaseException | None = None
+
+    async def submit(chunk: List[Tuple[int, Molecule]]) -> None:
+        nonlocal fed
+        await slots.acquire()
+        try:
+            fut = loop.run_in_executor(executor, _name_chunk, chunk)
+        except BaseException:
+            slots.release()
+            raise
+        submitted.add(fut)
+        fut.add_done_callback(submitted.discard)
+        if ordered:
+            ready.put_nowait(fut)
+        else:
+            fut.add_done_callback(ready.put_nowait)
+        fed += 1
+
+    async def feed() -> None:
+        nonlocal failure
+        chunk: List[Tuple[int, Molecule]] = []
+        index = 0
+        try:
+            try:
+                async for mol in _aiter(molecules, chunksize):
+                    chunk.append((index, mol))
+                    index += 1
+                    if len(chunk) == chunksize:
+                        full, chunk = chunk, []
+                        await submit(full)
+            except Exception as exc:  # noqa: BLE001 – re‑raised by the consumer
+                failure = exc
+            if chunk:
+                await submit(chunk)
+        except Exception as exc:  # noqa: BLE001 – e.g. a shut‑down executor
+            failure = failure or exc
+        finally:
+            ready.put_nowait(_END)
+
+    producer = asyncio.ensure_future(feed())
+    taken = 0
+    ended = False
+    try:
+        while not (ended and taken == fed):
+            item = await ready.get()
+            if item is _END:
+                ended = True
+                continue
+            for result in await item:
+                yield result
+            taken += 1
+            slots.release()
+    finally:
+        producer.cancel()
+        for fut in list(submitted):
+            fut.cancel()
+    if failure is not None:
+        raise failure
+
+
+async def _aiter(items: AsyncIterable[Molecule] | Iterable[Molecule], size: int) -> AsyncIterator[Molecule]:
+    if hasattr(items, "__aiter__"):
+        async for item in items:  # type: ignore[union-attr]
+            yield item
+    elif isinstance(items, (list, tuple)):
+        for item in items:
+            yield item
+    else:
+        loop = asyncio.get_running_loop()
+        it = iter(items)  # type: ignore[arg-type]
+        while True:
+            batch = await loop.run_in_executor(None, _take, it, size)
+            if not batch:
+                return
+            for item in batch:
+                yield item
+
+
+def _take(it: Iterator[Molecule], size: int) -> List[Molecule]:
+    return list(islice(it, size))
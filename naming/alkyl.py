@@ -1,41 +1,179 @@
-"""Collect straight‑chain alkyl substituents."""
+"""Collect alkyl substituents, straight‑chain and branched.
+
+A branched group is named from its own longest chain starting at the atom
+of attachment (most branches, then lowest locants break ties), its branches
+named the same way: ``1-methylethyl``, ``2,2-dimethylpropyl``,
+``1,1-bis(1-methylethyl)propyl``.  Groups are described bottom‑up over the
+fragment's BFS tree without recursion, and every rooted subtree is interned
+by its shape, so a shape seen before (in this molecule or an earlier one)
+is named from the table at the cost of a dictionary look‑up.  The table is
+shared by all threads behind one lock.
+"""
 
 from collections import defaultdict
-from typing import Dict, List
+from threading import Lock
+from typing import Dict, Iterator, List, Sequence, Tuple
 
+from ..core.frozen import FrozenMolecule
 from ..core.structures import Molecule
-from ..util import YL_NAMES
+from ..util import ROOT_NAMES, YL_NAMES
+from .assembler import alphabetic_key, substituent_prefix
+from .fragments import Fragment, label_fragments
 
+_MAX_SHAPES = 1 << 16  # interned subtree shapes kept before the table restarts
 
-def get_alkyl_substituents(chain: list[int], mol: Molecule) -> Dict[str, List[int]]:
-    """Return {alkyl_name: [locants]}."""
-    backbone = set(chain)
-    loc_by_idx = {idx: pos for pos, idx in enumerate(chain, 1)}
-    subs = defaultdict(list)
 
-    for c in chain:
-        for nb in mol.neighbours(c):
-            if nb in backbone:
-                continue
-            frag = []
-            stack = [nb]
-            seen = set(stack)
-            while stack:
-                a = stack.pop()
-                atom = mol._atoms[a]  # type: ignore[attr-defined]
-                if atom.symbol != "C":
-                    frag = []  # hetero atom encountered – skip
-                    break
-                frag.append(a)
-                for x in mol.neighbours(a):
-                    if x not in seen and x not in backbone:
-                        stack.append(x)
-                        seen.add(x)
-            if frag:
-                length = len(frag)
-                if 1 <= length <= 12:
-                    subs[YL_NAMES[length]].append(loc_by_idx[c])
+def get_alkyl_substituents(
+    chain: list[int],
+    mol: Molecule | FrozenMolecule | None,
+    fragments: Sequence[Fragment] | None = None,
+) -> Dict[str, List[int]]:
+    """Return {alkyl_name: [locants]}.
+
+    ``fragments`` (from :func:`label_fragments` on the same chain) skips the
+    labelling pass (``mol`` is then unused); fragments containing hetero
+    atoms are ignored.  Raises :class:`ValueError` for an alkyl group with no
+    name (a chain beyond the numerical terms).
+    """
+    if fragments is None:
+        g = mol.freeze()
+        if g is not mol:
+            chain = [g.position(i) for i in chain]
+        fragments = label_fragments(g, chain)
+    subs = defaultdict(list)
+    for frag in fragments:
+        if not frag.is_hydrocarbon:
+            continue
+        if not frag.branch_points:
+            group = YL_NAMES[frag.size] if frag.size in YL_NAMES else None
+        else:
+            group = branched_name(frag.parents)
+        if group is None:
+            raise ValueError(f"Alkyl substituents of {frag.size} carbons not yet supported")
+        subs[group].append(frag.locant)
 
     for v in subs.values():
         v.sort()
     return dict(subs)
+
+
+class _Shape:
+    """A rooted subtree: children (shape ids) and the senior chain through it.
+
+    ``name`` and ``locants`` are filled in on first use (``_UNSET`` until
+    then): most shapes are only ever a link in a longer chain, and building
+    either eagerly would cost the chain length per shape.
+    """
+
+    __slots__ = ("kids", "height", "count", "next", "locants", "name")
+
+    def __init__(self, kids, height, count, next_) -> None:
+        self.kids: Tuple[int, ...] = kids
+        self.height: int = height  # carbons in the senior chain
+        self.count: int = count  # branches along it
+        self.next: int = next_  # child shape the chain continues into (-1: ends)
+        self.locants = _UNSET  # branch locants along the chain, ascending
+        self.name = _UNSET  # None when the chain has no root name
+
+
+_UNSET: object = object()
+_ids: Dict[Tuple[int, ...], int] = {}
+_shapes: List[_Shape] = []
+_lock = Lock()  # guards the two tables and the lazily filled shape fields
+
+
+def branched_name(parents: Sequence[int]) -> str | None:
+    """Name the group whose BFS tree is ``parents`` (see :class:`Fragment`)."""
+    n = len(parents)
+    children: List[List[int]] = [[] for _ in range(n)]
+    for k in range(1, n):
+        children[parents[k]].append(k)
+    ids = [0] * n
+    with _lock:
+        if len(_shapes) > _MAX_SHAPES:
+            _ids.clear()
+            _shapes.clear()
+        for k in range(n - 1, -1, -1):  # children come after their parent in BFS order
+            kids = tuple(sorted(ids[c] for c in children[k]))
+            sid = _ids.get(kids)
+            if sid is None:
+                sid = _ids[kids] = len(_shapes)
+                _shapes.append(_describe(kids))
+            ids[k] = sid
+        return _name(ids[0])
+
+
+def shape_cache_clear() -> None:
+    with _lock:
+        _ids.clear()
+        _shapes.clear()
+
+
+def _describe(kids: Tuple[int, ...]) -> _Shape:
+    shapes = _shapes
+    if not kids:
+        return _Shape(kids, 1, 0, -1)
+    tallest = max(shapes[c].height for c in kids)
+    contenders = sorted({c for c in kids if shapes[c].height == tallest})
+    if len(contenders) > 1:
+        most = max(shapes[c].count for c in contenders)
+        contenders = [c for c in contenders if shapes[c].count == most]
+    # ids depend on interning order, so only structure may pick the winner
+    best = contenders[0] if len(contenders) == 1 else min(contenders, key=lambda c: (_locants(c), _name(c) or ""))
+    return _Shape(kids, tallest + 1, len(kids) - 1 + shapes[best].count, best)
+
+
+def _chain(sid: int) -> Iterator[Tuple[int, List[int]]]:
+    """Walk the senior chain of shape ``sid``: (locant, branch shape ids) per carbon."""
+    shapes = _shapes
+    here, loc = shapes[sid], 1
+    while True:
+        rest = list(here.kids)
+        if here.next >= 0:
+            rest.remove(here.next)
+        yield loc, rest
+        if here.next < 0:
+            return
+        here, loc = shapes[here.next], loc + 1
+
+
+def _locants(sid: int) -> Tuple[int, ...]:
+    shape = _shapes[sid]
+    if shape.locants is _UNSET:
+        shape.locants = tuple(loc for loc, rest in _chain(sid) for _ in rest)
+    return shape.locants
+
+
+def _name(sid: int) -> str | None:
+    """Name of shape ``sid``, naming the branches it needs first (no recursion)."""
+    shapes = _shapes
+    if shapes[sid].name is not _UNSET:
+        return shapes[sid].name
+    todo = [(sid, False)]
+    while todo:  # post‑order: a shape is rendered after the branches it needs
+        s, ready = todo.pop()
+        shape = shapes[s]
+        if shape.name is not _UNSET:
+            continue
+        if ready:
+            shape.name = _render(s)
+            continue
+        todo.append((s, True))
+        for _, rest in _chain(s):
+            todo.extend((c, False) for c in rest if shapes[c].name is _UNSET)
+    return shapes[sid].name
+
+
+def _render(sid: int) -> str | None:
+    shapes = _shapes
+    height = shapes[sid].height
+    if height not in ROOT_NAMES:
+        return None
+    groups: Dict[str, List[int]] = {}
+    for loc, rest in _chain(sid):
+        for c in rest:
+            groups.setdefault(shapes[c].name, []).append(loc)
+    if not groups:
+        return YL_NAMES[height]
+    cited = sorted(groups.items(), key=lambda kv: alphabetic_key(kv[0]))
+    return substituent_prefix(cited, height)
@@ -2,7 +2,44 @@
 
 from typing import List, Sequence, Tuple
 
-from ..util import MULTIPLIER_PREFIXES, ROOT_NAMES
+from ..util import GROUP_MULTIPLIERS, MAX_NUMERAL, MULTIPLIER_PREFIXES, ROOT_NAMES
+
+
+def alphabetic_key(s: str) -> str:
+    """Sort key of a substituent name (multipliers are only added at assembly).
+
+    A branched group (``1,1-dimethylethyl``) is alphabetised at the first
+    letter of its complete name, multipliers included; a simple one such as
+    ``tridecyl`` at its own first letter.
+    """
+    if s[:1].isdigit():
+        return s.lstrip("0123456789,-([{")
+    return s
+
+
+def _root(length: int) -> str:
+    try:
+        return ROOT_NAMES[length]
+    except KeyError:
+        raise ValueError(f"No IUPAC numerical term for a {length}‑carbon parent (at most {MAX_NUMERAL})") from None
+
+
+def is_branched(name: str) -> bool:
+    """Does the substituent name carry its own locants (and so need parentheses)?"""
+    return name[:1].isdigit()
+
+
+def _enclosure(name: str) -> Tuple[str, str]:
+    """Enclosing marks for a branched group: ( ), then [ ], then { } as groups nest."""
+    depth = deepest = 0
+    for ch in name:
+        if ch in "([{":
+            depth += 1
+            deepest = max(deepest, depth)
+        elif ch in ")]}":
+            depth -= 1
+    k = deepest % 3
+    return "([{"[k], ")]}"[k]
 
 
 def _subs_to_string(groups: Sequence[Tuple[str, List[int]]]) -> str:
@@ -11,18 +48,28 @@ def _subs_to_string(groups: Sequence[Tuple[str, List[int]]]) -> str:
     frags = []
     for name, locs in groups:
         locants = ",".join(map(str, locs))
+        if is_branched(name):
+            opening, closing = _enclosure(name)
+            frags.append(f"{locants}-{GROUP_MULTIPLIERS.get(len(locs), '')}{opening}{name}{closing}")
+            continue
         mult = MULTIPLIER_PREFIXES.get(len(locs), "")
         prefix = f"{mult}{name}" if mult else name
         frags.append(f"{locants}-{prefix}")
     return "-".join(frags)
 
 
+def substituent_prefix(groups: Sequence[Tuple[str, List[int]]], chain_len: int) -> str:
+    """Name of a substituent group: its own substituents (in citation order),
+    then the root of its chain, numbered from the atom of attachment."""
+    return f"{_subs_to_string(groups)}{_root(chain_len)}yl"
+
+
 def assemble_parent(
     chain_len: int,
     unsat_type: str | None,
     unsat_locs: List[int],
 ) -> str:
-    root = ROOT_NAMES[chain_len]
+    root = _root(chain_len)
     if not unsat_type:
         return f"{root}ane"
 
@@ -59,3 +106,26 @@ def assemble_name(
     ):
         return name[2:]
     return name
+
+
+def assemble_ring_name(
+    ring_size: int,
+    unsat_type: str | None,
+    unsat_locs: List[int],
+    substituents: List[Tuple[str, List[int]]],
+) -> str:
+    """Name a monocyclic carbocycle: ``cyclo`` + the chain root of its size."""
+    subs_part = _subs_to_string(substituents)
+    root = "cyclo" + _root(ring_size)
+    if not unsat_type:
+        parent = f"{root}ane"
+        # a single substituent on a saturated ring needs no locant
+        if len(substituents) == 1 and substituents[0][1] == [1]:
+            subs_part = subs_part[2:]
+    elif len(unsat_locs) == 1:
+        # the lone multiple bond is C1–C2: implied unless substituents are numbered
+        parent = f"{root}{unsat_type}" if not substituents else f"{root}-{unsat_locs[0]}-{unsat_type}"
+    else:
+        locs = ",".join(map(str, unsat_locs))
+        parent = f"{root}a-{locs}-{MULTIPLIER_PREFIXES[len(unsat_locs)]}{unsat_type}"
+    return f"{subs_part}{parent}"
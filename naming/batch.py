@@ -0,0 +1,163 @@
+"""Batch naming over a process pool (chunked, streaming, per‑item errors)."""
+
+from __future__ import annotations
+
+import os
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from dataclasses import dataclass
+from functools import partial
+from itertools import islice
+from typing import Any, Callable, Deque, Iterable, Iterator, List, Tuple
+
+from ..core.structures import Molecule
+from .namer import name
+from .store import stored
+
+
+@dataclass(frozen=True, slots=True)
+class NameResult:
+    """Outcome of naming one molecule of a batch (``index`` = input position)."""
+
+    index: int
+    name: str | None = None
+    error: BaseException | None = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+_Chunk = List[Tuple[int, Any]]
+_Worker = Callable[[_Chunk], List[NameResult]]
+
+
+def _name_chunk(chunk: _Chunk) -> List[NameResult]:
+    """Worker entry point – never raises for a single bad molecule."""
+    out: List[NameResult] = []
+    for i, mol in chunk:
+        try:
+            out.append(NameResult(i, name(mol)))
+        except Exception as exc:  # noqa: BLE001 – reported per item
+            out.append(NameResult(i, error=exc))
+    return out
+
+
+def _with_store(path: str, work: _Worker, chunk: _Chunk) -> List[NameResult]:
+    with stored(path):
+        return work(chunk)
+
+
+def _stored(work: _Worker, path: str | None) -> _Worker:
+    """``work`` consulting the name store at ``path`` (opened once per worker)."""
+    return work if path is None else partial(_with_store, path, work)
+
+
+def _chunks(items: Iterable[Any], size: int) -> Iterator[_Chunk]:
+    numbered = enumerate(items)
+    while True:
+        chunk = list(islice(numbered, size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def _submit(pool: ProcessPoolExecutor, work: Callable[..., Any], *args: Any) -> Future:
+    """``pool.submit``, with a refusal (e.g. a broken pool) kept in the future."""
+    try:
+        return pool.submit(work, *args)
+    except Exception as exc:  # noqa: BLE001 – reported per item by _collect
+        fut: Future = Future()
+        fut.set_exception(exc)
+        return fut
+
+
+def _collect(fut: Future, chunk: _Chunk) -> List[NameResult]:
+    try:
+        return fut.result()
+    except Exception as exc:  # noqa: BLE001 – e.g. BrokenProcessPool
+        return [NameResult(i, error=exc) for i, _ in chunk]
+
+
+def name_many(
+    molecules: Iterable[Molecule],
+    workers: int | None = None,
+    chunksize: int = 256,
+    *,
+    ordered: bool = True,
+    max_pending: int | None = None,
+    store: str | None = None,
+) -> Iterator[NameResult]:
+    """Name an iterable of molecules, yielding one :class:`NameResult` each.
+
+    The input is consumed lazily in chunks of ``chunksize``; at most
+    ``max_pending`` chunks (default ``2 * workers``) are in flight, so memory
+    stays bounded for arbitrarily long inputs.  With ``ordered=False`` results
+    are yielded as chunks complete.  ``workers <= 1`` names in‑process.
+    ``store`` is the path of a :class:`~chemname.naming.store.NameStore`
+    every worker reads and adds to (one write per chunk).
+    """
+    return _stream(molecules, _stored(_name_chunk, store), workers, chunksize, ordered, max_pending)
+
+
+def _stream(
+    items: Iterable[Any],
+    work: _Worker,
+    workers: int | None,
+    chunksize: int,
+    ordered: bool,
+    max_pending: int | None,
+) -> Iterator[NameResult]:
+    """Run a picklable chunk ``work``er over ``items`` (shared by all batch front‑ends)."""
+    if chunksize < 1:
+        raise ValueError("chunksize must be >= 1")
+    if workers is None:
+        workers = os.cpu_count() or 1
+    return _serial(items, work, chunksize) if workers <= 1 else _pooled(
+        items, work, workers, chunksize, ordered, max_pending or 2 * workers
+    )
+
+
+def _serial(items: Iterable[Any], work: _Worker, chunksize: int) -> Iterator[NameResult]:
+    for chunk in _chunks(items, chunksize):
+        yield from work(chunk)
+
+
+def _pooled(
+    items: Iterable[Any],
+    work: _Worker,
+    workers: int,
+    chunksize: int,
+    ordered: bool,
+    limit: int,
+) -> Iterator[NameResult]:
+    pool = ProcessPoolExecutor(max_workers=workers)
+    pending: Deque[Tuple[Future, _Chunk]] = deque()
+    try:
+        for chunk in _chunks(items, chunksize):
+            pending.append((_submit(pool, work, chunk), chunk))
+            if len(pending) < limit:
+                continue
+            if ordered:
+                yield from _collect(*pending.popleft())
+            else:
+                yield from _drain_completed(pending)
+        while pending:
+            if ordered:
+                yield from _collect(*pending.popleft())
+            else:
+                yield from _drain_completed(pending)
+    finally:
+        pool.shutdown(wait=True, cancel_futures=True)
+
+
+def _drain_completed(pending: Deque[Tuple[Future, _Chunk]]) -> Iterator[NameResult]:
+    done, _ = wait([f for f, _ in pending], return_when=FIRST_COMPLETED)
+    keep: Deque[Tuple[Future, _Chunk]] = deque()
+    finished: List[Tuple[Future, _Chunk]] = []
+    for item in pending:
+        (finished if item[0] in done else keep).append(item)
+    pending.clear()
+    pending.extend(keep)
+    for fut, chunk in finished:
+        yield from _collect(fut, chunk)
@@ -0,0 +1,90 @@
+"""Bounded LRU name cache keyed by canonical (index‑independent) graph keys."""
+
+from __future__ import annotations
+
+from collections import OrderedDict
+from threading import Lock
+from typing import NamedTuple
+
+DEFAULT_MAXSIZE = 4096
+
+
+class CacheInfo(NamedTuple):
+    hits: int
+    misses: int
+    evictions: int
+    maxsize: int
+    currsize: int
+
+
+class NameCache:
+    """Thread‑safe LRU mapping ``canonical key → name``; ``maxsize=0`` disables it."""
+
+    def __init__(self, maxsize: int = DEFAULT_MAXSIZE) -> None:
+        if maxsize < 0:
+            raise ValueError("maxsize must be >= 0")
+        self._data: OrderedDict[str, str] = OrderedDict()
+        self._lock = Lock()
+        self.maxsize = maxsize
+        self.hits = self.misses = self.evictions = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self.maxsize > 0
+
+    def get(self, key: str) -> str | None:
+        with self._lock:
+            value = self._data.get(key)
+            if value is None:
+                self.misses += 1
+                return None
+            self._data.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def put(self, key: str, value: str) -> None:
+        if not self.maxsize:
+            return
+        with self._lock:
+            self._data[key] = value
+            self._data.move_to_end(key)
+            self._evict()
+
+    def resize(self, maxsize: int) -> None:
+        if maxsize < 0:
+            raise ValueError("maxsize must be >= 0")
+        with self._lock:
+            self.maxsize = maxsize
+            self._evict()
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+            self.hits = self.misses = self.evictions = 0
+
+    def info(self) -> CacheInfo:
+        with self._lock:
+            return CacheInfo(self.hits, self.misses, self.evictions, self.maxsize, len(self._data))
+
+    def _evict(self) -> None:
+        while len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+            self.evictions += 1
+
+
+_cache = NameCache()
+
+
+def cache_info() -> CacheInfo:
+    """Return hit/miss/eviction counters of the process‑wide name cache."""
+    return _cache.info()
+
+
+def cache_clear() -> None:
+    """Drop all cached names and reset the counters."""
+    _cache.clear()
+
+
+def set_cache_size(maxsize: int) -> None:
+    """Resize the name cache; ``0`` disables caching entirely."""
+    _cache.resize(maxsize)
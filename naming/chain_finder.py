@@ -1,54 +1,151 @@
-"""Detect the (unique) longest carbon chain in an unbranched molecule."""
+"""Longest‑chain selection for acyclic carbon skeletons.
 
-from collections import deque
-from typing import List
+The diameter of every carbon tree is found with a double BFS (linear time).
+All diameter paths of a tree share its centre, so every maximal‑length chain
+is a pair of deepest leaves hanging off *different* centre branches; they are
+enumerated lazily, in time proportional to the output.
+"""
 
+from typing import Dict, Iterator, List, Tuple
+
+from ..core.frozen import FrozenMolecule
 from ..core.structures import Molecule
 
+_CARBON = 6
+
+
+class _CarbonGraph:
+    """Carbon‑only view over the CSR arrays (no adjacency copy)."""
+
+    __slots__ = ("elements", "offsets", "targets")
+
+    def __init__(self, g: FrozenMolecule) -> None:
+        self.elements, self.offsets, self.targets = g.elements, g.offsets, g.targets
+
+    def bfs(self, start: int, blocked: int = -1) -> Tuple[List[int], Dict[int, int]]:
+        """Return (visit order, parent map) of a BFS that never enters ``blocked``."""
+        elements, offsets, targets = self.elements, self.offsets, self.targets
+        parent = {start: -1, blocked: -1}
+        order = [start]
+        for v in order:  # the list grows while it is walked
+            for k in range(offsets[v], offsets[v + 1]):
+                nb = targets[k]
+                if nb not in parent and elements[nb] == _CARBON:
+                    parent[nb] = v
+                    order.append(nb)
+        del parent[blocked]
+        return order, parent
 
-def _distance(n: int, parents: dict[int, int | None]) -> int:
-    d = 0
-    while parents[n] is not None:
-        n = parents[n]  # type: ignore[assignment]
-        d += 1
-    return d
-
-
-def find_chain(mol: Molecule) -> List[int]:
-    """Return carbon indices in order along the chain (0‑based)."""
-    carbons = [a.index for a in mol if a.symbol == "C"]
-    if not carbons:  # pragma: no cover – invalid input
-        return []
-
-    # adjacency limited to carbon–carbon bonds
-    adj: dict[int, list[int]] = {c: [] for c in carbons}
-    for bond in mol._bonds.values():  # type: ignore[attr-defined]
-        i, j = tuple(bond.atoms)
-        if i in adj and j in adj:
-            adj[i].append(j)
-            adj[j].append(i)
-
-    # pick an endpoint (degree 1) or the first carbon
-    start = next((c for c in carbons if len(adj[c]) == 1), carbons[0])
-
-    # BFS tree
-    parent = {start: None}
-    q = deque([start])
-    while q:
-        v = q.popleft()
-        for nb in adj[v]:
-            if nb not in parent:
-                parent[nb] = v
-                q.append(nb)
-
-    # farthest node from start
-    end = max(parent, key=lambda n: _distance(n, parent))
-
-    # reconstruct path
-    path: list[int] = []
-    cur: int | None = end
-    while cur is not None:
-        path.append(cur)
-        cur = parent[cur]
-    path.reverse()
+
+def _climb(v: int, parent: Dict[int, int]) -> List[int]:
+    path = [v]
+    while parent[v] >= 0:
+        v = parent[v]
+        path.append(v)
     return path
+
+
+def _deepest(cg: _CarbonGraph, root: int, blocked: int, radius: int):
+    """Group the leaves at depth ``radius`` below ``root`` by root branch."""
+    order, parent = cg.bfs(root, blocked)
+    depth = {root: 0}
+    branch = {root: root}
+    groups: Dict[int, List[int]] = {}
+    for v in order[1:]:
+        p = parent[v]
+        depth[v] = depth[p] + 1
+        branch[v] = v if p == root else branch[p]
+        if depth[v] == radius:
+            groups.setdefault(branch[v], []).append(v)
+    if radius == 0:
+        groups[root] = [root]
+    return groups, parent
+
+
+def _oriented(path: List[int]) -> List[int]:
+    return path if path[0] <= path[-1] else path[::-1]
+
+
+def _centres(cg: _CarbonGraph, spine: List[int]) -> Tuple[Tuple[int, ...], List[List[int]], Dict[int, int]]:
+    diameter = len(spine) - 1
+    if diameter == 0:
+        return (spine[0],), [], {spine[0]: -1}
+    radius = diameter // 2
+    if diameter % 2 == 0:
+        centre = spine[radius]
+        groups, parent = _deepest(cg, centre, -1, radius)
+        return (centre,), list(groups.values()), parent
+    u, v = spine[radius], spine[radius + 1]
+    groups_u, parent_u = _deepest(cg, u, v, radius)
+    groups_v, parent_v = _deepest(cg, v, u, radius)
+    ends_u = [x for grp in groups_u.values() for x in grp]
+    ends_v = [y for grp in groups_v.values() for y in grp]
+    return (u, v), [ends_u, ends_v], {**parent_u, **parent_v}
+
+
+def chain_centres(mol: Molecule | FrozenMolecule) -> Iterator[Tuple[Tuple[int, ...], List[List[int]], Dict[int, int]]]:
+    """Yield ``(centre, branches, parent)`` for every group of longest chains.
+
+    A longest chain joins deepest leaves of two different ``branches`` (each
+    a list of leaf positions) through ``centre``: one atom, or the two atoms
+    of the central bond, whose two sides are then the only branches.
+    ``parent`` climbs from a leaf to the centre.  A lone carbon has no
+    branches.  :func:`longest_chains` enumerates chains in this order.
+    """
+    g = mol.freeze()
+    cg = _CarbonGraph(g)
+    seen: set = set()
+    best = -1
+    spines: List[List[int]] = []
+    elements = g.elements
+    for c in range(len(g)):
+        if elements[c] != _CARBON or c in seen:
+            continue
+        order, _ = cg.bfs(c)
+        seen.update(order)
+        a = order[-1]  # a BFS visits the farthest atom last
+        order, parent = cg.bfs(a)
+        spine = _climb(order[-1], parent)
+        if len(spine) > best:
+            best = len(spine)
+            spines = [spine]
+        elif len(spine) == best:
+            spines.append(spine)
+    for spine in spines:
+        yield _centres(cg, spine)
+
+
+def join(x: int, y: int, centre: Tuple[int, ...], parent: Dict[int, int]) -> List[int]:
+    """The chain from leaf ``x`` through ``centre`` to leaf ``y``, oriented low → high end."""
+    down = _climb(x, parent)
+    up = _climb(y, parent)
+    if len(centre) == 1:
+        up.pop()
+    return _oriented(down + up[::-1])
+
+
+def longest_chains(mol: Molecule | FrozenMolecule) -> Iterator[List[int]]:
+    """Yield every maximal‑length carbon chain once, oriented low → high end.
+
+    Indices are atom positions of the frozen graph.  Each chain is produced in
+    O(length); locating the diameters is O(n) for the whole molecule.
+    """
+    for centre, branches, parent in chain_centres(mol):
+        if not branches:
+            yield [centre[0]]
+            continue
+        for i, left in enumerate(branches):
+            for right in branches[i + 1 :]:
+                for x in left:
+                    for y in right:
+                        yield join(x, y, centre, parent)
+
+
+def find_chain(mol: Molecule | FrozenMolecule) -> List[int]:
+    """Return carbon indices in order along a longest chain (0‑based).
+
+    For a :class:`FrozenMolecule` the indices are its atom positions.
+    """
+    g = mol.freeze()
+    path = next(longest_chains(g), [])
+    return path if g is mol else [g.indices[p] for p in path]
@@ -0,0 +1,122 @@
+"""Keep perception results across small mutations of a :class:`Molecule`.
+
+After a full naming run the namer stores a :class:`Perception` on the
+molecule: the chosen chain, the substituent fragments and the unsaturations,
+all in atom indices.  The molecule journals its mutations from then on, and
+:func:`advance` replays them onto the record when they are local: a new
+non‑carbon atom that stays isolated, or one bonded to a backbone carbon (a
+new single‑atom fragment).  A new carbon, a bond between existing atoms or a
+second bond to the new atom may change the main chain, so :func:`advance`
+then gives up and the full path runs.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field, replace
+from typing import Callable, Dict, List, Sequence, Tuple
+
+from ..core.frozen import FrozenMolecule
+from ..core.structures import Molecule
+from .fragments import Fragment
+
+
+@dataclass(frozen=True, slots=True)
+class Perception:
+    """What the pipeline found for ``version`` of a molecule (atom indices).
+
+    ``chain_fixed`` says whether ``chain`` was the only longest chain with
+    the most multiple bonds, so that new substituents cannot move it
+    (``None`` until first needed); ``pending`` holds new non‑carbon atoms
+    that have no bond yet.
+    """
+
+    version: int
+    chain: Tuple[int, ...]
+    locants: Dict[int, int]
+    unsat_type: str | None
+    unsat_pos: Tuple[int, ...]
+    fragments: Tuple[Fragment, ...]
+    chain_fixed: bool | None = None
+    pending: Dict[int, str] = field(default_factory=dict)
+
+
+def perceive(
+    mol: Molecule,
+    g: FrozenMolecule,
+    chain: Sequence[int],
+    unsat_type: str | None,
+    unsat_pos: Sequence[int],
+    fragments: Sequence[Fragment],
+    chain_fixed: bool | None = None,
+) -> Perception:
+    """Record a full run (positions of ``g``) on ``mol`` and start its journal."""
+    indices = g.indices
+    if g._position is not None:  # positions differ from atom indices
+        chain = [indices[p] for p in chain]
+        fragments = [
+            Fragment(
+                indices[f.attachment], f.locant, indices[f.root], [indices[a] for a in f.atoms],
+                f.elements, f.branch_points, f.parents,
+            )
+            for f in fragments
+        ]
+    record = Perception(
+        mol.version,
+        tuple(chain),
+        {idx: loc for loc, idx in enumerate(chain, 1)},
+        unsat_type,
+        tuple(unsat_pos),
+        tuple(fragments),
+        chain_fixed,
+    )
+    mol._perception = record
+    mol._journal = []
+    return record
+
+
+def forget(mol: Molecule) -> None:
+    """Drop the record (the molecule is now named some other way)."""
+    mol._perception = None
+    mol._journal = []
+
+
+def advance(mol: Molecule, record: Perception, chain_fixed: Callable[[], bool]) -> Perception | None:
+    """Replay the journal onto ``record``; ``None`` if the change is not local.
+
+    ``chain_fixed`` is called (once per record lineage) before the first new
+    fragment is accepted.
+    """
+    if record.version == mol.version:
+        return record
+    pending = dict(record.pending)
+    added: List[Fragment] = []
+    locants = record.locants
+    for entry in mol._journal:
+        if entry[0] == "atom":
+            _, idx, symbol = entry
+            if symbol == "C":
+                return None
+            pending[idx] = symbol
+            continue
+        _, i, j = entry
+        if j in locants:
+            i, j = j, i
+        if i not in locants or j not in pending:
+            return None
+        added.append(Fragment(i, locants[i], j, [j], {pending.pop(j): 1}, 0))
+
+    fixed = record.chain_fixed
+    if added and fixed is None:
+        fixed = chain_fixed()
+    if added and not fixed:
+        return None
+    updated = replace(
+        record,
+        version=mol.version,
+        fragments=record.fragments + tuple(added),
+        chain_fixed=fixed,
+        pending=pending,
+    )
+    mol._perception = updated
+    mol._journal = []
+    return updated
@@ -3,86 +3,303 @@
 from itertools import chain as it_chain
 from typing import Dict, List, Tuple
 
+from ..core.canonical import canonical_key
+from ..core.frozen import FrozenMolecule
+from ..core.rings import RingInfo, ring_info
 from ..core.structures import Molecule
-from .assembler import assemble_name
-from .chain_finder import find_chain
-from .substituents import get_all_substituents
+from ..instrumentation import timed
+from .assembler import alphabetic_key, assemble_name
+from .cache import _cache
+from .fragments import label_fragments
+from .incremental import Perception, advance, forget, perceive
+from .parts import NameParts
+from .seniority import LOCANT_RULES, Numbering, Parent, keeps_direction, select, senior_longest_chains
+from .store import _active
+from .substituents import perceive_substituents, substituents_from_fragments
 
-
-def _alphabetic_key(s: str) -> str:
-    """Ignore multiplier prefixes when sorting."""
-    for p in ("di", "tri", "tetra"):
-        if s.startswith(p):
-            return s[len(p) :]
-    return s
+# Naming rules revision; bump whenever name() output changes for any input
+# (a new name or a new refusal), so persistent stores drop what it replaces.
+RULES_VERSION = 1
 
 
 def _convert_locs(locs: List[int], length: int, forward: bool) -> List[int]:
     return locs if forward else [length + 1 - l for l in locs]
 
 
-def _orientation_score(
-    length: int,
-    unsat_locs: List[int],
-    subs: Dict[str, List[int]],
-    forward: bool,
-) -> Tuple:
-    convert = (lambda ls: _convert_locs(ls, length, forward))
+def _find_chains(g: FrozenMolecule) -> Tuple[List[List[int]], bool]:
+    """Senior chains, and whether substituents could ever change the choice.
 
-    uns_conv = convert(unsat_locs) or [999]
-    sub_locs = sorted(convert(list(it_chain.from_iterable(subs.values())))) or [999]
-    return (*uns_conv, *sub_locs)
+    The senior chain comes first (see :mod:`~chemname.naming.seniority`),
+    then one chain for every other way a tie on seniority can look.
+    """
+    chains, contenders = senior_longest_chains(g)
+    return chains, contenders == 1
 
 
-def name(mol: Molecule) -> str:  # noqa: C901
-    chain = find_chain(mol)
-    if not chain:
-        raise ValueError("No carbon chain found")
+def _choose_chain(g: FrozenMolecule) -> List[int]:
+    """Pick the senior chain among all longest ones (first candidate wins ties)."""
+    chains, _ = senior_longest_chains(g)
+    return chains[0] if chains else []
+
+
+def name(mol: Molecule | FrozenMolecule) -> str:
+    """Return the IUPAC name, served from the canonical‑key LRU cache if possible.
+
+    A :class:`Molecule` named before and changed only locally since (see
+    :mod:`~chemname.naming.incremental`) is re‑named from its kept perception.
+    Anything with a ``freeze()``, such as a :class:`~chemname.core.batch.MoleculeView`,
+    is named from its snapshot.
+    """
+    record = getattr(mol, "_perception", None)
+    if record is not None and mol._journal:  # unchanged molecules go to the cache
+        result = timed("name", _rename, mol, record)
+        if result is not None:
+            return result
+    g = mol.freeze()
+    keep = mol if isinstance(mol, Molecule) else None  # only molecules keep a perception
+    return timed("name", _name_cached, g, keep, graph=g)
+
+
+def _rename(mol: Molecule, record: Perception) -> str | None:
+    record = advance(mol, record, lambda: senior_longest_chains(mol.freeze())[1] == 1)
+    if record is None:
+        return None
+    chain = record.chain
+    subs = substituents_from_fragments(chain, record.fragments)
+    length = len(chain)
+    forward = keeps_direction(length, list(record.unsat_pos), subs)
+    return _assemble(length, record.unsat_type, list(record.unsat_pos), subs, forward)
+
+
+def _name_cached(g: FrozenMolecule, keep: Molecule | None = None) -> str:
+    rings = timed("rings", ring_info, g)
+    if rings.rings:
+        if keep is not None:
+            forget(keep)
+        return timed("ring", _name_ring, g, rings)
+    store = _active.store
+    if not _cache.enabled and store is None:
+        return _name_uncached(g, keep=keep)
+
+    chain = None
+    marks = None
+    if any(o != 1 for o in g.orders):
+        # reversed unsaturation locants depend on the direction the chain is
+        # walked in, so key unsaturated molecules on the directed chain too
+        chain = timed("find_chain", _choose_chain, g)
+        marks = {p: pos for pos, p in enumerate(chain, 1)}
+    key = timed("canonical_key", canonical_key, g, marks)
+    if key is None:
+        return _name_uncached(g, chain, keep)
+    cached = _cache.get(key)
+    if cached is not None:
+        return cached
+    if store is not None:
+        stored = timed("store", store.get, key)
+        if stored is not None:
+            _cache.put(key, stored)
+            return stored
+    if chain is not None:
+        result = _name_uncached(g, chain, keep)
+        numbering_free = True
+    else:
+        result, numbering_free = _name_checked(g, check=True, keep=keep)
+    if numbering_free:
+        _cache.put(key, result)
+        if store is not None:
+            store.put(key, result)
+    return result
+
+
+def _name_ring(g: FrozenMolecule, rings: RingInfo) -> str:
+    return _ring_parts(g, rings).name
+
+
+def _ring_parts(g: FrozenMolecule, rings: RingInfo) -> NameParts:
+    """Parts of a substituted monocyclic cycloalkane, ‑alkene or ‑alkyne.
+
+    The ring is numbered from every atom in both directions and the lowest
+    numbering wins: multiple bonds first, then the substituent locant set,
+    then the locants in order of citation.  Rings have no canonical key, so
+    these names are not cached.
+    """
+    if len(rings.rings) > 1:
+        raise ValueError("Only monocyclic rings are supported")
+    ring = rings.rings[0]
+    if any(g.symbol(p) != "C" for p in ring):
+        raise ValueError("Heterocycles not yet supported")
+    size = len(ring)
+    members = set(ring)
+    for p in ring:
+        for q in g.neighbours(p):
+            if q not in members and g.bond_order(p, q) != 1:
+                raise ValueError("Exocyclic multiple bonds not yet supported")
+
+    fragments = timed("fragments", label_fragments, g, ring)
+    if size + sum(f.size for f in fragments) != len(g):
+        raise ValueError("Disconnected molecules not supported")
+    subs = substituents_from_fragments(ring, fragments)
+
+    # ring bond k joins ring[k] and ring[k + 1]; walking locants start at 1
+    unsat_type = None
+    unsat_bonds: List[int] = []
+    for k in range(size):
+        order = g.bond_order(ring[k], ring[(k + 1) % size])
+        if order not in (2, 3):
+            if order != 1:
+                raise ValueError("Aromatic rings not yet supported")
+            continue
+        typ = "ene" if order == 2 else "yne"
+        if unsat_type and typ != unsat_type:
+            raise ValueError("Mixed double/triple bonds not yet supported")
+        unsat_type = typ
+        unsat_bonds.append(k)
+
+    cited = sorted(subs, key=alphabetic_key)
+    best = None
+    for start in range(size):
+        for step in (1, -1):
+            # locant of walking position i under this numbering
+            loc = [0] * size
+            for j in range(size):
+                loc[(start + step * j) % size] = j + 1
+            unsat = []
+            for k in unsat_bonds:
+                a, b = loc[k], loc[(k + 1) % size]
+                unsat.append(min(a, b) if abs(a - b) == 1 else size)  # C(n)–C1 is bond n
+            unsat.sort()
+            groups = [sorted(loc[i - 1] for i in subs[s]) for s in cited]
+            score = (unsat, sorted(it_chain.from_iterable(groups)), groups)
+            if best is None or score[:3] < best[:3]:
+                best = (*score, start, step)
+    unsat, _, groups, start, step = best
+    order = tuple(g.indices[ring[(start + step * j) % size]] for j in range(size))
+    cited_groups = tuple((s, tuple(locs)) for s, locs in zip(cited, groups))
+    return NameParts(order, unsat_type, tuple(unsat), cited_groups, cyclic=True)
+
 
-    # collect unsaturations
+def _unsaturations(g: FrozenMolecule, chain: List[int]) -> Tuple[str | None, List[int]]:
+    """Return the unsaturation suffix (``ene``/``yne``) and its chain locants."""
     unsat_type = None
     unsat_pos: List[int] = []
     for i in range(len(chain) - 1):
-        bond = mol._bonds[frozenset({chain[i], chain[i + 1]})]  # type: ignore[attr-defined]
-        if bond.order in {2, 3}:
-            typ = "ene" if bond.order == 2 else "yne"
+        order = g.bond_order(chain[i], chain[i + 1])
+        if order in {2, 3}:
+            typ = "ene" if order == 2 else "yne"
             if unsat_type and typ != unsat_type:
                 raise ValueError("Mixed double/triple bonds not yet supported")
             unsat_type = typ
             unsat_pos.append(i + 1)
+    return unsat_type, unsat_pos
 
-    subs = get_all_substituents(chain, mol)
+
+def _name_uncached(g: FrozenMolecule, chain: List[int] | None = None, keep: Molecule | None = None) -> str:
+    return _name_checked(g, None if chain is None else [chain], keep=keep)[0]
+
+
+def _name_checked(
+    g: FrozenMolecule,
+    chains: List[List[int]] | None = None,
+    check: bool = False,
+    keep: Molecule | None = None,
+) -> Tuple[str, bool]:
+    """Name ``g`` from ``chains[0]``; with ``check``, report if numbering can't matter.
+
+    With ``keep`` (the molecule ``g`` was frozen from) the perception is
+    stored on it for incremental re‑naming.
+
+    Ties the seniority rules leave open (equally senior chains, a chain that
+    scores the same walked either way) go to the first candidate, so
+    isomorphic inputs numbered differently can be named differently; only
+    names that come out the same every way are shared through the cache.
+    """
+    fixed = None
+    if chains is None:
+        chains, fixed = timed("find_chain", _find_chains, g)
+    if not chains or not chains[0]:
+        raise ValueError("No carbon chain found")
+    chain = chains[0]
+
+    unsat_type, unsat_pos = _unsaturations(g, chain)
+    subs, fragments = timed("substituents", perceive_substituents, chain, g)
     length = len(chain)
 
-    # choose orientation with full lowest‑set + alphabetical tie‑break
-    fwd_score = _orientation_score(length, unsat_pos, subs, True)
-    rev_score = _orientation_score(length, unsat_pos, subs, False)
+    forward = timed("orientation", keeps_direction, length, unsat_pos, subs)
+    result = timed("assemble", _assemble, length, unsat_type, unsat_pos, subs, forward)
+    if keep is not None:
+        perceive(keep, g, chain, unsat_type, unsat_pos, fragments, fixed)
+
+    if not check:
+        return result, False
+    numbering_free = True
+    parent = Parent(g, chain, unsat_pos, subs)
+    if len(select((Numbering(parent, True), Numbering(parent, False)), LOCANT_RULES)) == 2:
+        numbering_free = _assemble(length, unsat_type, unsat_pos, subs, not forward) == result
+    for other in chains[1:]:
+        if not numbering_free:
+            break
+        other_name, other_free = _name_checked(g, [other], check=True)
+        numbering_free = other_free and other_name == result
+    return result, numbering_free
+
+
+def _assemble(
+    length: int,
+    unsat_type: str | None,
+    unsat_pos: List[int],
+    subs: Dict[str, List[int]],
+    forward: bool,
+) -> str:
+    unsat_locs, subs_list = _numbered(length, unsat_pos, subs, forward)
+    return assemble_name(length, unsat_type, unsat_locs, subs_list)
 
-    if fwd_score < rev_score:
-        forward = True
-    elif rev_score < fwd_score:
-        forward = False
-    else:
-        # tie‑break: find alphabetically first substituent (ignoring di/tri)
-        keys = sorted(subs.keys(), key=lambda s: _alphabetic_key(s))
-        if keys:
-            first = keys[0]
-            # compare locant for that substituent
-            loc_fwd = subs[first][0]
-            loc_rev = length + 1 - loc_fwd
-            forward = loc_fwd < loc_rev
-        else:
-            forward = True
 
+def _numbered(
+    length: int,
+    unsat_pos: List[int],
+    subs: Dict[str, List[int]],
+    forward: bool,
+) -> Tuple[List[int], List[Tuple[str, List[int]]]]:
+    """Unsaturation locants and substituents in citation order, walking ``forward`` or not."""
     if not forward:
-        chain.reverse()
         unsat_pos = _convert_locs(unsat_pos, length, False)
         subs = {k: sorted(_convert_locs(v, length, False)) for k, v in subs.items()}
 
     # α‑order substituents (ignoring di/tri)
     subs_list = sorted(
         subs.items(),
-        key=lambda kv: _alphabetic_key(kv[0]),
+        key=lambda kv: alphabetic_key(kv[0]),
     )
+    return sorted(unsat_pos), subs_list
+
 
-    return assemble_name(length, unsat_type, sorted(unsat_pos), subs_list)
+def name_parts(mol: Molecule | FrozenMolecule) -> NameParts:
+    """Return the pieces :func:`name` builds its string from, string not yet rendered.
+
+    The parent's atom order depends on how ``mol`` is numbered, so these are
+    always perceived afresh rather than served from the name cache; the
+    rendered :attr:`NameParts.name` equals ``name(mol)``.
+    """
+    return timed("name_parts", _parts, mol.freeze())
+
+
+def _parts(g: FrozenMolecule) -> NameParts:
+    rings = timed("rings", ring_info, g)
+    if rings.rings:
+        return timed("ring", _ring_parts, g, rings)
+    chains, _ = timed("find_chain", _find_chains, g)
+    if not chains or not chains[0]:
+        raise ValueError("No carbon chain found")
+    chain = chains[0]
+    unsat_type, unsat_pos = _unsaturations(g, chain)
+    subs, _ = timed("substituents", perceive_substituents, chain, g)
+    length = len(chain)
+    forward = timed("orientation", keeps_direction, length, unsat_pos, subs)
+    unsat_locs, subs_list = _numbered(length, unsat_pos, subs, forward)
+    order = chain if forward else chain[::-1]
+    return NameParts(
+        tuple(g.indices[p] for p in order),
+        unsat_type,
+        tuple(unsat_locs),
+        tuple((group, tuple(locs)) for group, locs in subs_list),
+    )
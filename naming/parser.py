@@ -0,0 +1,301 @@
+"""Name → structure: the inverse of :func:`~chemname.naming.name`.
+
+Reads every name the assembler can produce: parents with ``ane``, one
+``-n-ene``/``-n-yne`` (bare for ``ethene``/``ethyne``) or multiplied
+unsaturations (``hexa-1,3-diene``), and locant‑prefixed halo and alkyl
+groups with ``di``/``tri``/``penta``… (``1‑`` may be dropped on methane and
+ethane) or bracketed branched groups with ``bis``/``tris``/``tetrakis``…
+(``2,3-bis(1-methylethyl)``, nested with an explicit stack).  A ``cyclo``
+parent closes the chain into a ring (``methylcyclohexane``,
+``cyclohexa-1,3-diene``; a lone ``ene``/``yne`` is at C1–C2).  Halogen and
+suffix words are matched by longest prefix on a trie; chain roots
+(``meth`` … ``tridec``, ``hect``, up to ``util.MAX_NUMERAL``) are read as
+IUPAC numerical terms, one component per place value, and checked against
+``util.ROOT_NAMES``.  Scanning is linear with no backtracking.
+"""
+
+from __future__ import annotations
+
+from typing import Dict, List, Tuple
+
+from ..core.exceptions import NameParseError
+from ..core.structures import Molecule
+from ..util import GROUP_MULTIPLIERS, HALO_PREFIXES, MULTIPLIER_PREFIXES, ROOT_NAMES
+
+# token kinds
+_ROOT, _HALO, _ALKYL, _SUFFIX, _BRANCHED = range(5)
+_SUBSTITUENT = (_HALO, _ALKYL)
+_SUFFIXES = {"ane": 1, "ene": 2, "yne": 3}
+_CLOSING = {"(": ")", "[": "]", "{": "}"}
+
+
+def _compile() -> dict:
+    words: Dict[str, Tuple[int, object]] = {}
+    words.update((prefix, (_HALO, symbol)) for symbol, prefix in HALO_PREFIXES.items())
+    words.update((suffix, (_SUFFIX, order)) for suffix, order in _SUFFIXES.items())
+    trie: dict = {}
+    for word, token in words.items():
+        node = trie
+        for ch in word:
+            node = node.setdefault(ch, {})
+        node[""] = token  # "" marks the end of a word
+    return trie
+
+
+_TRIE = _compile()
+
+# numerical‑term components by place value, with their spelling variants
+_PLACES = (
+    (("hen", 1), ("un", 1), ("do", 2), ("tri", 3), ("tetra", 4), ("penta", 5), ("hexa", 6), ("hepta", 7),
+     ("octa", 8), ("nona", 9)),
+    (("deca", 10), ("icosa", 20), ("cosa", 20), ("triaconta", 30), ("tetraconta", 40), ("pentaconta", 50),
+     ("hexaconta", 60), ("heptaconta", 70), ("octaconta", 80), ("nonaconta", 90)),
+    (("hecta", 100), ("dicta", 200), ("tricta", 300), ("tetracta", 400), ("pentacta", 500), ("hexacta", 600),
+     ("heptacta", 700), ("octacta", 800), ("nonacta", 900)),
+    (("kilia", 1000), ("dilia", 2000), ("trilia", 3000), ("tetralia", 4000), ("pentalia", 5000),
+     ("hexalia", 6000), ("heptalia", 7000), ("octalia", 8000), ("nonalia", 9000)),
+)
+_SHORT_ROOTS = ((1, "meth"), (2, "eth"), (3, "prop"), (4, "but"))
+
+
+def _roots(text: str, i: int) -> List[Tuple[int, int]]:
+    """Every chain root spelled at ``i`` → [(length, end)].
+
+    Components are tried place by place (units first); a root is a term
+    whose last component lost its final ``a`` (``trideca`` → ``tridec``).
+    Candidates are checked against ``ROOT_NAMES``, so only canonical
+    spellings are accepted.
+    """
+    found = [(n, i + len(root)) for n, root in _SHORT_ROOTS if text.startswith(root, i)]
+    todo = [(i, 0, 0)]  # (position, next place, value so far)
+    while todo:
+        at, place, value = todo.pop()
+        for p in range(place, len(_PLACES)):
+            for spelling, v in _PLACES[p]:
+                if text.startswith(spelling, at):
+                    todo.append((at + len(spelling), p + 1, value + v))
+                if spelling[-1] == "a" and text.startswith(spelling[:-1], at):
+                    end = at + len(spelling) - 1
+                    if value + v > 4 and ROOT_NAMES[value + v] == text[i:end]:
+                        found.append((value + v, end))
+    return found
+
+
+def _word(text: str, i: int, kinds: Tuple[int, ...]) -> Tuple[int, object, int]:
+    """Longest word of one of ``kinds`` starting at ``i`` → (kind, value, end)."""
+    best = None
+    if _ROOT in kinds or _ALKYL in kinds:
+        for length, end in _roots(text, i):
+            if _ALKYL in kinds and text.startswith("yl", end):
+                candidate = (_ALKYL, length, end + 2)
+            elif _ROOT in kinds:
+                candidate = (_ROOT, length, end)
+            else:
+                continue
+            if best is None or candidate[2] > best[2]:
+                best = candidate
+    node = _TRIE
+    j = i
+    n = len(text)
+    while True:
+        token = node.get("")
+        if token is not None and token[0] in kinds and (best is None or j > best[2]):
+            best = (token[0], token[1], j)
+        if j == n:
+            break
+        node = node.get(text[j])
+        if node is None:
+            break
+        j += 1
+    if best is None:
+        raise NameParseError(f"Unexpected {text[i:i + 8]!r} at {i}")
+    return best
+
+
+def _locants(text: str, i: int) -> Tuple[List[int], int]:
+    """Read ``n[,n…]`` followed by ``-`` → (locants, index after the hyphen)."""
+    locs: List[int] = []
+    n = len(text)
+    while True:
+        j = i
+        while j < n and text[j].isdigit():
+            j += 1
+        if j == i:
+            raise NameParseError(f"Expected a locant at {i}")
+        locs.append(int(text[i:j]))
+        if j < n and text[j] == ",":
+            i = j + 1
+            continue
+        if j < n and text[j] == "-":
+            return locs, j + 1
+        raise NameParseError(f"Expected ',' or '-' after locant at {j}")
+
+
+def _multiplied(text: str, i: int, count: int, kinds: Tuple[int, ...]) -> Tuple[int, object, int]:
+    """A word of ``kinds`` carrying the multiplier ``count`` locants call for."""
+    expected = MULTIPLIER_PREFIXES.get(count)
+    if expected is not None:
+        if not text.startswith(expected, i):
+            raise NameParseError(f"Expected '{expected}' for {count} locants at {i}")
+        i += len(expected)
+    return _word(text, i, kinds)
+
+
+def _opening(text: str, i: int, count: int) -> int:
+    """Index after ``bis(``‑style or bare ``(`` opening a branched group, else ``-1``."""
+    mult = GROUP_MULTIPLIERS.get(count, "")
+    if text.startswith(mult, i) and text[i + len(mult) : i + len(mult) + 1] in _CLOSING:
+        return i + len(mult)
+    return -1
+
+
+def _substituent(text: str, i: int, count: int) -> Tuple[int, object, int]:
+    """The group after ``count`` locants: a word, or a bracketed branched group.
+
+    A branched group reads as ``(length, groups)``: its chain of ``length``
+    carbons (locant 1 bonded to the parent) and the groups on it, shaped
+    like the parent's.
+    """
+    start = _opening(text, i, count)
+    if start < 0:
+        return _multiplied(text, i, count, _SUBSTITUENT)
+    n = len(text)
+    stack: List[Tuple[List, List[int], str]] = []  # enclosing groups, their locants, closing mark
+    groups: List[Tuple[int, object, List[int]]] = []
+    closing = _CLOSING[text[start]]
+    i = start + 1
+    while True:
+        if i < n and text[i].isdigit():
+            locs, i = _locants(text, i)
+            inner = _opening(text, i, len(locs))
+            if inner >= 0:
+                stack.append((groups, locs, closing))
+                groups, closing, i = [], _CLOSING[text[inner]], inner + 1
+                continue
+            kind, value, i = _multiplied(text, i, len(locs), _SUBSTITUENT)
+            groups.append((kind, value, locs))
+        else:
+            _, length, i = _word(text, i, (_ALKYL,))
+            if not text.startswith(closing, i):
+                raise NameParseError(f"Expected {closing!r} at {i}")
+            i += 1
+            value = (length, groups)
+            if not stack:
+                return _BRANCHED, value, i
+            groups, locs, closing = stack.pop()
+            groups.append((_BRANCHED, value, locs))
+        if text.startswith("-", i) and i + 1 < n and text[i + 1].isdigit():
+            i += 1
+
+
+def parse(text: str, *, strict: bool = True) -> Molecule:
+    """Build the :class:`Molecule` a systematic name describes.
+
+    Chain carbons get indices ``0 … n‑1`` in locant order; substituent atoms
+    follow in the order they are written.  Raises :class:`NameParseError`,
+    including (unless ``strict=False``) for a carbon with more than four bonds.
+    """
+    text = text.strip()
+    n = len(text)
+    i = 0
+    groups: List[Tuple[int, object, List[int]]] = []
+    dropped_one = i < n and (text[i] in _CLOSING or not text[i].isdigit() and _starts_substituent(text, i))
+    if dropped_one:  # "chloromethane", "(1-methylethyl)cyclohexane": a lone prefix whose "1-" was dropped
+        kind, value, i = _substituent(text, i, 1)
+        groups.append((kind, value, [1]))
+    while i < n and text[i].isdigit():
+        locs, i = _locants(text, i)
+        kind, value, i = _substituent(text, i, len(locs))
+        groups.append((kind, value, locs))
+        if i < n and text[i] == "-":
+            i += 1
+            if i >= n or not text[i].isdigit():
+                raise NameParseError(f"Expected a locant at {i}")
+
+    cyclic = text.startswith("cyclo", i)
+    if cyclic:
+        i += len("cyclo")
+    _, length, i = _word(text, i, (_ROOT,))
+    if cyclic and length < 3:
+        raise NameParseError(f"A ring needs at least 3 carbons, not {length}")
+    unsat: List[int] = []
+    order = 1
+    if text.startswith("a-", i) and i + 2 < n and text[i + 2].isdigit():
+        unsat, i = _locants(text, i + 2)
+        if len(unsat) < 2:
+            raise NameParseError(f"Connecting 'a' needs several locants at {i}")
+        _, order, i = _multiplied(text, i, len(unsat), (_SUFFIX,))
+    elif text.startswith("-", i):
+        unsat, i = _locants(text, i + 1)
+        if len(unsat) != 1:
+            raise NameParseError(f"Several unsaturation locants need a multiplier at {i}")
+        _, order, i = _word(text, i, (_SUFFIX,))
+    else:
+        _, order, i = _word(text, i, (_SUFFIX,))
+        if order != 1:
+            if length != 2 and not cyclic:
+                raise NameParseError(f"Missing unsaturation locant at {i}")
+            unsat = [1]
+    if i != n:
+        raise NameParseError(f"Unexpected {text[i:i + 8]!r} at {i}")
+    if unsat and order == 1:
+        raise NameParseError("Locants given for a saturated parent")
+    if dropped_one and (unsat if cyclic else length > 2):
+        raise NameParseError(f"Locant required for a substituent on a {length}‑carbon chain")
+    return _build(length, order, unsat, groups, cyclic, strict)
+
+
+def _starts_substituent(text: str, i: int) -> bool:
+    try:
+        _word(text, i, _SUBSTITUENT)
+    except NameParseError:
+        return False
+    return True
+
+
+def _build(length: int, order: int, unsat: List[int], groups, cyclic: bool = False, strict: bool = True) -> Molecule:
+    if len(set(unsat)) != len(unsat):
+        raise NameParseError("Repeated unsaturation locant")
+    symbols = ["C"] * length
+    edges = [(k, k + 1) for k in range(length - 1)]
+    if cyclic:
+        edges.append((length - 1, 0))  # ring bond n joins C(n) and C1
+    orders = [1] * len(edges)
+    for loc in unsat:
+        if not 1 <= loc <= len(edges):
+            raise NameParseError(f"Unsaturation locant {loc} outside a {length}‑carbon chain")
+        orders[loc - 1] = order
+    # (chain atom of locant 1, its length, groups on it); branched groups queue up
+    todo = [(0, length, groups)]
+    while todo:
+        first, size, on = todo.pop()
+        for kind, value, locs in on:
+            for loc in locs:
+                if not 1 <= loc <= size:
+                    raise NameParseError(f"Locant {loc} outside a {size}‑carbon chain")
+                prev = first + loc - 1
+                if kind == _BRANCHED:
+                    sub_len, sub_groups = value
+                    todo.append((len(symbols), sub_len, sub_groups))
+                    run = ["C"] * sub_len
+                else:
+                    run = [value] if kind == _HALO else ["C"] * value
+                for symbol in run:
+                    symbols.append(symbol)
+                    edges.append((prev, len(symbols) - 1))
+                    orders.append(1)
+                    prev = len(symbols) - 1
+    if strict:
+        _check_valence(length, len(symbols), edges, orders)
+    return Molecule.from_arrays(symbols, edges, orders, trusted=True)
+
+
+def _check_valence(length: int, atoms: int, edges: List[Tuple[int, int]], orders: List[int]) -> None:
+    bonds = [0] * atoms
+    for (a, b), bond_order in zip(edges, orders):
+        bonds[a] += bond_order
+        bonds[b] += bond_order
+    for k, count in enumerate(bonds):
+        if count > 4:
+            where = f"C{k + 1}" if k < length else "A substituent carbon"
+            raise NameParseError(f"{where} would have {count} bonds")
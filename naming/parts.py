@@ -0,0 +1,50 @@
+"""Structured name: the pieces ``assemble_name`` flattens, string on demand."""
+
+from __future__ import annotations
+
+from typing import Tuple
+
+from .assembler import assemble_name, assemble_ring_name
+
+
+class NameParts:
+    """Parent, unsaturation and substituents of a name, as numbered in it.
+
+    ``chain`` lists the parent's atoms (original indices) in locant order:
+    ``chain[0]`` is C1.  ``substituents`` holds ``(group, locants)`` pairs
+    in citation order.  :attr:`name` renders the string on first access and
+    keeps it.
+    """
+
+    __slots__ = ("chain", "length", "cyclic", "unsat_type", "unsat_locants", "substituents", "_name")
+
+    def __init__(
+        self,
+        chain: Tuple[int, ...],
+        unsat_type: str | None,
+        unsat_locants: Tuple[int, ...],
+        substituents: Tuple[Tuple[str, Tuple[int, ...]], ...],
+        cyclic: bool = False,
+    ) -> None:
+        self.chain = chain
+        self.length = len(chain)
+        self.cyclic = cyclic
+        self.unsat_type = unsat_type  # "ene", "yne" or None
+        self.unsat_locants = unsat_locants
+        self.substituents = substituents
+        self._name: str | None = None
+
+    @property
+    def name(self) -> str:
+        if self._name is None:
+            build = assemble_ring_name if self.cyclic else assemble_name
+            groups = [(group, list(locs)) for group, locs in self.substituents]
+            self._name = build(self.length, self.unsat_type, list(self.unsat_locants), groups)
+        return self._name
+
+    def __str__(self) -> str:
+        return self.name
+
+    def __repr__(self) -> str:  # pragma: no cover
+        kind = "ring" if self.cyclic else "chain"
+        return f"<NameParts {kind}={self.length} unsat={self.unsat_type} substituents={len(self.substituents)}>"
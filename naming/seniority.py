@@ -0,0 +1,340 @@
+"""Parent‑chain selection and numbering as a cascade of lazy comparison rules.
+
+Every way of numbering a parent (a chain, walked forward or backward) is a
+:class:`Numbering`; a rule maps a numbering to a sortable key, lower being
+more senior.  :func:`select` applies the rules in order and keeps only the
+numberings tied on the best key, stopping as soon as one is left, so later
+rules run on fewer candidates and are often not run at all.  A chain's
+substituents are perceived the first time a rule asks for them and then
+shared by both of its directions.
+
+The rules follow the IUPAC order for acyclic parents: more substituents,
+then lowest locants for multiple bonds, then for substituents taken
+together, then for substituents in order of citation (alphabetical).
+
+Longest chains all run through the centre of the carbon skeleton, so
+:func:`senior_longest_chains` compares halves instead of chains: each
+branch's centre‑to‑leaf halves are described once, only the best of a
+branch are kept, and halves that look alike stand in for each other when
+the rules pick the pairs of branches to join.
+"""
+
+from __future__ import annotations
+
+from itertools import chain as it_chain
+from typing import Callable, Dict, Iterable, List, Sequence, Tuple
+
+from ..core.frozen import FrozenMolecule
+from ..util import ATOMIC_NUMBERS, HALO_PREFIXES, MAX_NUMERAL
+from .assembler import alphabetic_key
+from .chain_finder import _climb, chain_centres, join
+from .substituents import perceive_substituents
+
+_CARBON = 6
+_HALOGENS = frozenset(ATOMIC_NUMBERS[s] for s in HALO_PREFIXES)
+
+
+class Parent:
+    """A candidate parent chain; unsaturations and substituents are perceived on demand."""
+
+    __slots__ = ("g", "chain", "_unsat", "_subs")
+
+    def __init__(
+        self,
+        g: FrozenMolecule | None,
+        chain: Sequence[int],
+        unsat: List[int] | None = None,
+        subs: Dict[str, List[int]] | None = None,
+    ) -> None:
+        self.g = g
+        self.chain = chain
+        self._unsat = unsat
+        self._subs = subs
+
+    @property
+    def length(self) -> int:
+        return len(self.chain)
+
+    @property
+    def unsat(self) -> List[int]:
+        """Multiple‑bond locants, walking the chain forward."""
+        if self._unsat is None:
+            g, chain = self.g, self.chain
+            self._unsat = [i + 1 for i in range(len(chain) - 1) if g.bond_order(chain[i], chain[i + 1]) in {2, 3}]
+        return self._unsat
+
+    @property
+    def subs(self) -> Dict[str, List[int]]:
+        """Substituent name → sorted locants, walking the chain forward."""
+        if self._subs is None:
+            self._subs = perceive_substituents(self.chain, self.g, partial=True)[0]
+        return self._subs
+
+
+class Numbering:
+    """``parent`` numbered from its first atom (``forward``) or its last."""
+
+    __slots__ = ("parent", "forward")
+
+    def __init__(self, parent: Parent, forward: bool) -> None:
+        self.parent = parent
+        self.forward = forward
+
+    def convert(self, locs: Iterable[int]) -> List[int]:
+        if self.forward:
+            return list(locs)
+        ends = self.parent.length + 1
+        return [ends - loc for loc in locs]
+
+
+Rule = Callable[[Numbering], object]
+
+
+def most_substituents(n: Numbering) -> int:
+    return -sum(map(len, n.parent.subs.values()))
+
+
+def multiple_bond_locants(n: Numbering) -> List[int]:
+    # reversed locants keep the walking order (so they descend)
+    return n.convert(n.parent.unsat)
+
+
+def substituent_locants(n: Numbering) -> List[int]:
+    return sorted(n.convert(it_chain.from_iterable(n.parent.subs.values())))
+
+
+def citation_locants(n: Numbering) -> List[List[int]]:
+    subs = n.parent.subs
+    return [sorted(n.convert(subs[s])) for s in sorted(subs, key=alphabetic_key)]
+
+
+LOCANT_RULES: Tuple[Rule, ...] = (multiple_bond_locants, substituent_locants)
+CHAIN_RULES: Tuple[Rule, ...] = (most_substituents, *LOCANT_RULES)
+NUMBERING_RULES: Tuple[Rule, ...] = (*LOCANT_RULES, citation_locants)
+
+
+def select(candidates: Iterable[Numbering], rules: Sequence[Rule]) -> List[Numbering]:
+    """Return the candidates no rule separates from the most senior, in input order."""
+    survivors = list(candidates)
+    for rule in rules:
+        if len(survivors) <= 1:
+            break
+        keys = [rule(n) for n in survivors]
+        best = min(keys)
+        survivors = [n for n, key in zip(survivors, keys) if key == best]
+    return survivors
+
+
+def senior_chains(g: FrozenMolecule, chains: Sequence[Sequence[int]]) -> List[Sequence[int]]:
+    """The ``chains`` (already equal in length and multiple bonds) that tie for seniority."""
+    if len(chains) <= 1:
+        return list(chains)
+    parents = [Parent(g, chain) for chain in chains]
+    numberings = [Numbering(p, forward) for p in parents for forward in (True, False)]
+    kept = {id(n.parent) for n in select(numberings, CHAIN_RULES)}
+    return [p.chain for p in parents if id(p) in kept]
+
+
+def senior_longest_chains(g: FrozenMolecule) -> Tuple[List[List[int]], int]:
+    """The senior longest chain, then one chain per other look a tied chain has.
+
+    Also returns how many longest chains carry the most multiple bonds.  The
+    choice is the one :func:`senior_chains` makes among those (the first in
+    :func:`~.chain_finder.longest_chains` order wins), but a chain is built
+    only for the winner and for each tie that could be named differently.
+    """
+    centres = list(chain_centres(g))
+    if not centres:
+        return [], 0
+    if not centres[0][1]:  # lone carbons
+        chains = [[centre[0]] for centre, _, _ in centres]
+        return list(senior_chains(g, chains)), len(chains)
+
+    spines = [_Spine(g, *centre) for centre in centres]
+    most = max(s.most for s in spines)
+    contenders = sum(s.count(most) for s in spines)
+
+    combos = []
+    parents = []
+    for s, spine in enumerate(spines):
+        for i, j, middle in spine.pairs(most):
+            for cx, xs in spine.classes[i].items():
+                for cy, ys in spine.classes[j].items():
+                    for x_first in (True, False):
+                        if (min(xs) < max(ys)) if x_first else (min(ys) < max(xs)):
+                            first, second = (cx, cy) if x_first else (cy, cx)
+                            combos.append((s, i, j, cx, cy, x_first, first, middle, second))
+                            parents.append(_walk(first, middle, second))
+    numberings = [Numbering(p, forward) for p in parents for forward in (True, False)]
+    by_parent = {id(p): combo for p, combo in zip(parents, combos)}
+    tied = [by_parent[id(p)] for p in dict.fromkeys(n.parent for n in select(numberings, CHAIN_RULES))]
+    kept = {combo[:6] for combo in tied}
+
+    winner, chain = _first_tied(spines, most, kept)
+    chains = [chain]
+    seen = set()
+    for combo in sorted(tied, key=lambda c: c[:6] != winner):
+        s, i, j, cx, cy, x_first, first, middle, second = combo
+        if (first, middle, second) in seen:  # walked alike, so named alike
+            continue
+        seen.add((first, middle, second))
+        if combo[:6] != winner:
+            xs, ys = spines[s].classes[i][cx], spines[s].classes[j][cy]
+            x, y = (min(xs), max(ys)) if x_first else (max(xs), min(ys))
+            chains.append(spines[s].join(x, y))
+    return chains, contenders
+
+
+def _first_tied(spines: List["_Spine"], most: int, kept: set) -> Tuple[tuple, List[int]]:
+    """The first chain, in :func:`~.chain_finder.longest_chains` order, of a kept kind."""
+    for s, spine in enumerate(spines):
+        for i, j, _ in spine.pairs(most):
+            starts = {combo[3] for combo in kept if combo[:3] == (s, i, j)}
+            for x in spine.branches[i]:
+                cx = spine.cls.get(x)
+                if cx not in starts:
+                    continue
+                for y in spine.branches[j]:
+                    combo = (s, i, j, cx, spine.cls.get(y), x < y)
+                    if combo in kept:
+                        return combo, spine.join(x, y)
+    raise AssertionError("no tied chain")  # pragma: no cover
+
+
+# A half is ``(names, bonds)``: the substituent labels on each atom from the
+# leaf up, and the orders of the bonds leading up from them.
+_Half = Tuple[Tuple[tuple, ...], Tuple[object, ...]]
+
+
+class _Spine:
+    """The longest chains through one centre, described half by half."""
+
+    def __init__(self, g: FrozenMolecule, centre: Tuple[int, ...], branches: List[List[int]], parent) -> None:
+        self.centre, self.branches, self.parent = centre, branches, parent
+        self.kids, labels = _substituent_labels(g, centre[0])
+        self.roots: List[int] = []
+        self.best: List[int] = []  # most multiple bonds on a half, per branch
+        self.counts: List[int] = []  # halves with that many
+        self.classes: List[Dict[_Half, List[int]]] = []  # best halves of each branch, alike ones together
+        self.cls: Dict[int, _Half] = {}
+        for leaves in branches:
+            most = count = 0
+            score = (-1, -1)
+            classes: Dict[_Half, List[int]] = {}
+            for x in leaves:
+                path = _climb(x, parent)
+                half, bonds, subs = self._half(g, path, labels)
+                if bonds > most:
+                    most, count = bonds, 0
+                count += bonds == most
+                if (bonds, subs) > score:
+                    score, classes = (bonds, subs), {}
+                if (bonds, subs) == score:
+                    classes.setdefault(half, []).append(x)
+            self.roots.append(path[-1])
+            self.best.append(most)
+            self.counts.append(count)
+            self.classes.append(classes)
+            self.cls.update((x, half) for half, xs in classes.items() for x in xs)
+        if len(centre) == 1:
+            c = centre[0]
+            self.middle = {
+                (i, j): tuple(sorted(labels[b] for b in self.kids[c] if labels[b] and b not in (ri, rj)))
+                for i, ri in enumerate(self.roots)
+                for j, rj in enumerate(self.roots)
+                if i < j
+            }
+        else:
+            self.middle = {(0, 1): g.bond_order(*centre)}
+        self.most = max(self._bonds(i, j) for i, j in self.middle)
+
+    def _half(self, g: FrozenMolecule, path: List[int], labels) -> Tuple[_Half, int, int]:
+        kids = self.kids
+        centre = self.centre
+        if len(centre) == 1:
+            path.pop()  # the centre; the branch root is now last
+            above = path[1:] + [centre[0]]
+        else:
+            above = path[1:] + [centre[0] if path[-1] == centre[1] else centre[1]]
+        names = []
+        for k, a in enumerate(path):
+            skip = (path[k - 1] if k else -1, above[k])
+            names.append(tuple(sorted(labels[b] for b in kids[a] if labels[b] and b not in skip)))
+        bonds = tuple(g.bond_order(a, b) for a, b in zip(path, above))
+        if len(centre) == 2:
+            bonds = bonds[:-1]  # the central bond belongs to every chain
+        return (tuple(names), bonds), sum(b in (2, 3) for b in bonds), sum(map(len, names))
+
+    def _bonds(self, i: int, j: int) -> int:
+        middle = self.middle[i, j]
+        return self.best[i] + self.best[j] + (len(self.centre) == 2 and middle in (2, 3))
+
+    def pairs(self, most: int):
+        for (i, j), middle in self.middle.items():
+            if self._bonds(i, j) == most:
+                yield i, j, middle
+
+    def count(self, most: int) -> int:
+        return sum(self.counts[i] * self.counts[j] for i, j, _ in self.pairs(most))
+
+    def join(self, x: int, y: int) -> List[int]:
+        return join(x, y, self.centre, self.parent)
+
+
+def _substituent_labels(g: FrozenMolecule, root: int):
+    """Children of each atom with the molecule hung from ``root``, and a label
+    per atom for the substituent its subtree would be (``None`` if unnamed).
+
+    Equal labels mean equal substituents: a halogen atom, or an all‑carbon
+    subtree interned by shape.
+    """
+    offsets, targets, elements = g.offsets, g.targets, g.elements
+    up = {root: -1}
+    order = [root]
+    for a in order:  # the list grows while it is walked (BFS)
+        for k in range(offsets[a], offsets[a + 1]):
+            b = targets[k]
+            if b not in up:
+                up[b] = a
+                order.append(b)
+    kids: Dict[int, List[int]] = {a: [] for a in order}
+    for a in order[1:]:
+        kids[up[a]].append(a)
+    shapes: Dict[tuple, int] = {}
+    shape: Dict[int, int] = {}
+    height: Dict[int, int] = {}
+    labels: Dict[int, tuple | None] = {}
+    for a in reversed(order):
+        below = kids[a]
+        if elements[a] == _CARBON and all(b in shape for b in below):
+            shape[a] = shapes.setdefault(tuple(sorted(shape[b] for b in below)), len(shapes))
+            height[a] = 1 + max((height[b] for b in below), default=0)
+            labels[a] = ("C", shape[a]) if height[a] <= MAX_NUMERAL else None
+        elif not below and elements[a] in _HALOGENS:
+            labels[a] = ("X", elements[a])
+        else:
+            labels[a] = None
+    return kids, labels
+
+
+def _walk(first: _Half, middle, second: _Half) -> Parent:
+    """The chain through two halves, walked from the leaf of ``first``.
+
+    ``middle`` is the centre atom's labels, or the order of the central bond.
+    """
+    names, bonds = list(first[0]), list(first[1])
+    if isinstance(middle, tuple):
+        names.append(middle)
+    else:
+        bonds.append(middle)
+    names.extend(reversed(second[0]))
+    bonds.extend(reversed(second[1]))
+    unsat = [k for k, order in enumerate(bonds, 1) if order in (2, 3)]
+    locants = [k for k, here in enumerate(names, 1) for _ in here]
+    return Parent(None, range(len(names)), unsat, {"": locants} if locants else {})
+
+
+def keeps_direction(length: int, unsat_pos: List[int], subs: Dict[str, List[int]]) -> bool:
+    """True if the chain is numbered as walked (ties keep the walk)."""
+    parent = Parent(None, range(length), unsat_pos, subs)
+    return select((Numbering(parent, True), Numbering(parent, False)), NUMBERING_RULES)[0].forward
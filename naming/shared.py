@@ -0,0 +1,156 @@
+"""Multi‑process naming over shared memory instead of pickled molecules.
+
+The parent packs the molecules into one :class:`~chemname.core.batch.MoleculeBatch`
+buffer in a ``multiprocessing.shared_memory`` segment; workers attach to
+it once and name index ranges straight from views into it.  Names come back
+through a second segment holding a span table (start and length per
+molecule) and a string arena in which each range owns ``name_bytes`` bytes
+per molecule.  Only range bounds are sent to the workers, and only errors
+and names that did not fit their range come back pickled.
+
+Both segments belong to the parent and are unlinked when the result
+iterator finishes, is closed or fails, so a worker that crashes loses its
+range (reported per molecule, as in :func:`~chemname.naming.batch.name_many`)
+but leaks nothing.
+"""
+
+from __future__ import annotations
+
+import os
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from functools import partial
+from typing import TYPE_CHECKING, Deque, Dict, Iterable, Iterator, List, Tuple
+
+from ..core.batch import MoleculeBatch
+from ..core.frozen import FrozenMolecule
+from ..core.structures import Molecule
+from .batch import NameResult, _collect, _name_chunk, _stored, _stream, _submit
+from .store import stored
+
+if TYPE_CHECKING:  # pragma: no cover
+    from multiprocessing.shared_memory import SharedMemory
+
+_SPAN = 16  # bytes per molecule in the span table: start i64, length i64 (-1: pickled)
+
+
+def name_shared(
+    molecules: MoleculeBatch | Iterable[Molecule | FrozenMolecule],
+    workers: int | None = None,
+    chunksize: int = 1024,
+    *,
+    name_bytes: int = 64,
+    store: str | None = None,
+) -> Iterator[NameResult]:
+    """Name ``molecules`` in worker processes that read them from shared memory.
+
+    Yields one :class:`NameResult` per molecule, in input order.  An
+    iterable of molecules is packed into a batch first (so, unlike
+    ``name_many``, the whole input is held at once).  ``name_bytes`` is the
+    arena space per molecule; longer names still arrive, pickled.
+    ``workers <= 1`` names in‑process.
+    """
+    if chunksize < 1:
+        raise ValueError("chunksize must be >= 1")
+    batch = molecules if isinstance(molecules, MoleculeBatch) else MoleculeBatch(molecules)
+    if workers is None:
+        workers = os.cpu_count() or 1
+    if workers <= 1 or not len(batch):
+        return _stream(batch, _stored(_name_chunk, store), 1, chunksize, True, None)
+    return _shared(batch, workers, chunksize, name_bytes, store)
+
+
+def _shared(
+    batch: MoleculeBatch, workers: int, chunksize: int, name_bytes: int, store: str | None
+) -> Iterator[NameResult]:
+    from multiprocessing.shared_memory import SharedMemory
+
+    n = len(batch)
+    segments: List[SharedMemory] = []
+    pool = None
+    try:
+        graphs = SharedMemory(create=True, size=batch.packed_size())
+        segments.append(graphs)
+        batch.pack_into(graphs.buf)
+        results = SharedMemory(create=True, size=(_SPAN + name_bytes) * n)
+        segments.append(results)
+
+        pool = ProcessPoolExecutor(max_workers=workers)
+        work = partial(_name_range, graphs.name, results.name, n, name_bytes, store)
+        pending: Deque[Tuple[Future, int, int]] = deque()
+        for lo in range(0, n, chunksize):
+            hi = min(lo + chunksize, n)
+            pending.append((_submit(pool, work, lo, hi), lo, hi))
+            if len(pending) >= 2 * workers:
+                yield from _read_back(results, n, *pending.popleft())
+        while pending:
+            yield from _read_back(results, n, *pending.popleft())
+    finally:
+        if pool is not None:
+            pool.shutdown(wait=True, cancel_futures=True)
+        for shm in segments:
+            shm.close()
+            shm.unlink()
+
+
+def _read_back(results: "SharedMemory", n: int, fut: Future, lo: int, hi: int) -> List[NameResult]:
+    # a failed range comes back from _collect as one error per molecule
+    sent = {r.index: r for r in _collect(fut, [(k, None) for k in range(lo, hi)])}
+    if len(sent) == hi - lo:
+        return [sent[k] for k in range(lo, hi)]
+    out: List[NameResult] = []
+    with results.buf[: _SPAN * n] as raw, raw.cast("q") as spans, results.buf[_SPAN * n :] as arena:
+        for k in range(lo, hi):
+            size = spans[2 * k + 1]
+            if size < 0:
+                out.append(sent[k])
+            else:
+                start = spans[2 * k]
+                out.append(NameResult(k, str(arena[start : start + size], "utf-8")))
+    return out
+
+
+# worker side: the segments of the current call, attached once per process
+_attached: Dict[Tuple[str, str], Tuple["SharedMemory", "SharedMemory", MoleculeBatch]] = {}
+
+
+def _attach(graphs: str, results: str) -> Tuple["SharedMemory", MoleculeBatch]:
+    key = (graphs, results)
+    entry = _attached.get(key)
+    if entry is None:
+        from multiprocessing.shared_memory import SharedMemory
+
+        for old in _attached.values():  # an earlier call's segments
+            for shm in old[:2]:
+                try:
+                    shm.close()
+                except BufferError:  # pragma: no cover – a view outlived its call
+                    pass
+        _attached.clear()
+        g = SharedMemory(graphs)
+        r = SharedMemory(results)
+        entry = _attached[key] = (g, r, MoleculeBatch.from_buffer(g.buf))
+    return entry[1], entry[2]
+
+
+def _name_range(
+    graphs: str, results: str, n: int, name_bytes: int, store: str | None, lo: int, hi: int
+) -> List[NameResult]:
+    """Pool worker entry point: name molecules ``lo…hi‑1``; return what did not fit."""
+    shm, batch = _attach(graphs, results)
+    with stored(store):
+        named = _name_chunk([(k, batch[k]) for k in range(lo, hi)])
+    back: List[NameResult] = []
+    at, end = lo * name_bytes, hi * name_bytes
+    with shm.buf[: _SPAN * n] as raw, raw.cast("q") as spans, shm.buf[_SPAN * n :] as arena:
+        for r in named:
+            text = r.name.encode() if r.ok else None
+            if text is None or at + len(text) > end:
+                spans[2 * r.index + 1] = -1
+                back.append(r)
+                continue
+            arena[at : at + len(text)] = text
+            spans[2 * r.index] = at
+            spans[2 * r.index + 1] = len(text)
+            at += len(text)
+    return back
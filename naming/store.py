@@ -0,0 +1,261 @@
+"""Persistent name store: an SQLite file shared by processes and restarts.
+
+Rows are ``(canonical key, rules, name)``; ``rules`` records the naming
+rules revision that produced the name, so a store written under other rules
+is simply not consulted (and :meth:`NameStore.purge` drops its rows).  The
+database runs in WAL mode: any number of processes read while one writes,
+and writes are buffered and committed ``batch_size`` at a time.
+
+``use_store(path)`` makes :func:`~chemname.naming.namer.name` look names up
+there after the in‑process LRU cache and record what it computes; the batch
+APIs take ``store=path`` and open it in every worker.
+"""
+
+from __future__ import annotations
+
+import os
+from contextlib import contextmanager
+from itertools import islice
+from threading import RLock
+from typing import TYPE_CHECKING, Dict, Iterable, Iterator, List, Tuple
+
+from .cache import _cache
+
+if TYPE_CHECKING:  # pragma: no cover
+    import sqlite3
+
+SCHEMA = 1
+_SELECT_CHUNK = 500  # keys per IN (…) query, well under SQLite's variable limit
+
+
+def rules_version() -> str:
+    """Tag for names produced by the current naming rules."""
+    from .namer import RULES_VERSION
+
+    return f"chemname rules {RULES_VERSION}"
+
+
+class NameStore:
+    """Canonical key → name mapping in an SQLite file (thread‑ and fork‑safe)."""
+
+    def __init__(self, path: str, *, batch_size: int = 512, readonly: bool = False, rules: str | None = None) -> None:
+        if batch_size < 1:
+            raise ValueError("batch_size must be >= 1")
+        self.path = path
+        self.batch_size = batch_size
+        self.readonly = readonly
+        self.rules = rules or rules_version()
+        self._pending: Dict[str, str] = {}
+        self._lock = RLock()
+        self._pid = -1
+        self._db: sqlite3.Connection | None = None
+        self._connect()
+
+    # ------------------------------------------------------------- connection
+    def _connect(self) -> sqlite3.Connection:
+        import sqlite3  # only processes that open a store pay for it
+
+        if self._db is not None:
+            if self._pid == os.getpid():
+                return self._db
+            # inherited through fork: the parent owns the connection and the
+            # buffered names; keep the object alive so it is never closed here
+            _inherited.append(self._db)
+            self._pending = {}
+        if self.readonly:
+            db = sqlite3.connect(f"file:{self.path}?mode=ro", uri=True, timeout=30, check_same_thread=False)
+        else:
+            db = sqlite3.connect(self.path, timeout=30, isolation_level=None, check_same_thread=False)
+            db.execute("PRAGMA journal_mode=WAL")
+            db.execute("PRAGMA synchronous=NORMAL")
+            db.execute(
+                "CREATE TABLE IF NOT EXISTS names ("
+                " key TEXT NOT NULL, rules TEXT NOT NULL, name TEXT NOT NULL,"
+                " PRIMARY KEY (key, rules)) WITHOUT ROWID"
+            )
+            db.execute(f"PRAGMA user_version={SCHEMA}")
+        version = db.execute("PRAGMA user_version").fetchone()[0]
+        if version != SCHEMA:
+            db.close()
+            raise ValueError(f"{self.path}: unsupported name store schema {version}")
+        self._db, self._pid = db, os.getpid()
+        return db
+
+    def close(self) -> None:
+        with self._lock:
+            if self._db is None:
+                return
+            if self._pid == os.getpid():
+                self.flush()
+                self._db.close()
+            else:
+                _inherited.append(self._db)
+            self._db = None
+
+    def __enter__(self) -> "NameStore":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    # ---------------------------------------------------------------- look‑up
+    def get(self, key: str) -> str | None:
+        with self._lock:
+            pending = self._pending.get(key)
+            if pending is not None:
+                return pending
+            row = self._connect().execute(
+                "SELECT name FROM names WHERE key = ? AND rules = ?", (key, self.rules)
+            ).fetchone()
+        return row[0] if row else None
+
+    def get_many(self, keys: Iterable[str]) -> Dict[str, str]:
+        """Names of those ``keys`` that are stored."""
+        found: Dict[str, str] = {}
+        it = iter(keys)
+        with self._lock:
+            db = self._connect()
+            while True:
+                chunk = list(islice(it, _SELECT_CHUNK))
+                if not chunk:
+                    break
+                marks = ",".join("?" * len(chunk))
+                rows = db.execute(
+                    f"SELECT key, name FROM names WHERE rules = ? AND key IN ({marks})", (self.rules, *chunk)
+                )
+                found.update(rows)
+                found.update((k, self._pending[k]) for k in chunk if k in self._pending)
+        return found
+
+    def __len__(self) -> int:
+        with self._lock:
+            self.flush()
+            return self._connect().execute("SELECT COUNT(*) FROM names WHERE rules = ?", (self.rules,)).fetchone()[0]
+
+    # ----------------------------------------------------------------- writes
+    def put(self, key: str, name: str) -> None:
+        """Buffer one name; the buffer is committed every ``batch_size`` puts."""
+        if self.readonly:
+            return
+        with self._lock:
+            self._connect()
+            self._pending[key] = name
+            if len(self._pending) >= self.batch_size:
+                self.flush()
+
+    def flush(self) -> None:
+        """Commit buffered names in one transaction."""
+        with self._lock:
+            if not self._pending or self.readonly:
+                return
+            rows = [(k, self.rules, v) for k, v in self._pending.items()]
+            self._write(rows)
+            self._pending.clear()
+
+    def _write(self, rows: List[Tuple[str, str, str]]) -> None:
+        db = self._connect()
+        db.execute("BEGIN IMMEDIATE")
+        try:
+            db.executemany("INSERT OR REPLACE INTO names (key, rules, name) VALUES (?, ?, ?)", rows)
+        except BaseException:
+            db.execute("ROLLBACK")
+            raise
+        db.execute("COMMIT")
+
+    def load(self, pairs: Iterable[Tuple[str, str]]) -> int:
+        """Bulk‑insert ``(key, name)`` pairs (e.g. from :meth:`export`); return the count."""
+        if self.readonly:
+            raise ValueError("store is read‑only")
+        count = 0
+        it = iter(pairs)
+        with self._lock:
+            self.flush()
+            while True:
+                rows = [(k, self.rules, v) for k, v in islice(it, 10 * self.batch_size)]
+                if not rows:
+                    return count
+                self._write(rows)
+                count += len(rows)
+
+    def export(self) -> Iterator[Tuple[str, str]]:
+        """Yield every ``(key, name)`` stored for the current rules."""
+        with self._lock:
+            self.flush()
+            rows = self._connect().execute("SELECT key, name FROM names WHERE rules = ? ORDER BY key", (self.rules,))
+        while True:
+            with self._lock:
+                batch = rows.fetchmany(1000)
+            if not batch:
+                return
+            yield from batch
+
+    def warm_cache(self, limit: int | None = None) -> int:
+        """Copy up to ``limit`` stored names (default: the cache size) into the LRU cache."""
+        limit = _cache.maxsize if limit is None else min(limit, _cache.maxsize)
+        count = 0
+        for key, name in islice(self.export(), limit):
+            _cache.put(key, name)
+            count += 1
+        return count
+
+    def purge(self) -> int:
+        """Delete names written under other rules; return how many."""
+        with self._lock:
+            self.flush()
+            db = self._connect()
+            db.execute("BEGIN IMMEDIATE")
+            deleted = db.execute("DELETE FROM names WHERE rules != ?", (self.rules,)).rowcount
+            db.execute("COMMIT")
+        return deleted
+
+
+class _Active:
+    """The store :func:`~chemname.naming.namer.name` consults, if any."""
+
+    __slots__ = ("store",)
+
+    def __init__(self) -> None:
+        self.store: NameStore | None = None
+
+
+_active = _Active()
+_opened: Dict[str, NameStore] = {}
+_inherited: List[sqlite3.Connection] = []
+
+
+def use_store(store: NameStore | str | None) -> NameStore | None:
+    """Make ``name()`` consult ``store`` (a path opens one); ``None`` stops it.
+
+    The previously active store is flushed and returned (not closed).
+    """
+    if isinstance(store, str):
+        store = NameStore(store)
+    previous = _active.store
+    if previous is not None:
+        previous.flush()
+    _active.store = store
+    return previous
+
+
+def current_store() -> NameStore | None:
+    return _active.store
+
+
+@contextmanager
+def stored(path: str | None) -> Iterator[NameStore | None]:
+    """Use the store at ``path`` (opened once per process) for the duration.
+
+    Buffered names are committed on exit, so every batch‑worker chunk is one
+    write transaction.
+    """
+    if path is None:
+        yield _active.store
+        return
+    store = _opened.get(path)
+    if store is None:
+        store = _opened[path] = NameStore(path)
+    previous = use_store(store)
+    try:
+        yield store
+    finally:
+        use_store(previous)
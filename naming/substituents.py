@@ -1,31 +1,65 @@
 """Merge halogen and alkyl substituents."""
 
-from typing import Dict, List
+from typing import Dict, List, Sequence, Tuple
 
+from ..core.frozen import FrozenMolecule
 from ..core.structures import Molecule
+from ..instrumentation import timed
 from .alkyl import get_alkyl_substituents
+from .fragments import Fragment, label_fragments
 from ..util import HALO_PREFIXES
 
 
-def get_all_substituents(chain: list[int], mol: Molecule) -> Dict[str, List[int]]:
-    """Return merged substituent map."""
-    loc_by_idx = {idx: pos for pos, idx in enumerate(chain, 1)}
-    halo = {}
-    # halogens
-    for c in chain:
-        for nb in mol.neighbours(c):
-            atom = mol._atoms[nb]  # type: ignore[attr-defined]
-            if atom.symbol in HALO_PREFIXES and nb not in loc_by_idx:
-                name = HALO_PREFIXES[atom.symbol]
-                halo.setdefault(name, []).append(loc_by_idx[c])
+def get_all_substituents(chain: list[int], mol: Molecule | FrozenMolecule) -> Dict[str, List[int]]:
+    """Return merged substituent map, leaving out groups that have no name."""
+    g = mol.freeze()
+    if g is not mol:
+        chain = [g.position(i) for i in chain]
+    return perceive_substituents(chain, g, partial=True)[0]
+
+
+def perceive_substituents(
+    chain: Sequence[int], g: FrozenMolecule, *, partial: bool = False
+) -> Tuple[Dict[str, List[int]], List[Fragment]]:
+    """Return the substituent map together with the fragments it was read from."""
+    fragments = timed("fragments", label_fragments, g, chain)
+    return substituents_from_fragments(chain, fragments, partial=partial), fragments
+
+
+def substituents_from_fragments(
+    chain: Sequence[int], fragments: Sequence[Fragment], *, partial: bool = False
+) -> Dict[str, List[int]]:
+    """Name already labelled fragments; needs no graph.
+
+    A fragment that is neither a lone halogen nor an alkyl group raises
+    :class:`ValueError`, or with ``partial`` is left out (enough to rank
+    candidate chains, which is all it is used for).
+    """
+    # halogens: single‑atom fragments; alkyls are named below, anything else is not
+    halo: Dict[str, List[int]] = {}
+    for frag in fragments:
+        if frag.is_hydrocarbon:
+            continue
+        name = HALO_PREFIXES.get(next(iter(frag.elements))) if frag.size == 1 else None
+        if name is None:
+            if partial:
+                continue
+            raise ValueError(f"Substituents containing {_makeup(frag)} not yet supported")
+        halo.setdefault(name, []).append(frag.locant)
 
     for v in halo.values():
         v.sort()
 
     # alkyls
-    alkyl = get_alkyl_substituents(chain, mol)
+    alkyl = timed("alkyl", get_alkyl_substituents, chain, None, fragments)
 
     merged: Dict[str, List[int]] = {}
     merged.update(halo)
     merged.update(alkyl)
     return merged
+
+
+def _makeup(frag: Fragment) -> str:
+    """Hill‑order formula of ``frag``'s atoms, e.g. ``CCl`` or ``C2O``."""
+    order = sorted(frag.elements, key=lambda sym: (sym != "C", sym))
+    return "".join(sym + (str(frag.elements[sym]) if frag.elements[sym] > 1 else "") for sym in order)
@@ -0,0 +1,292 @@
+"""Optional NumPy engine naming whole batches of straight‑chain molecules.
+
+Covers the v0.2–v0.3 core class: one unbranched carbon chain (at most twelve
+carbons, single/double/triple bonds of one kind) carrying only halogen
+substituents.  A batch is held as padded arrays (:class:`PaddedBatch`);
+chain walking, unsaturation and halogen locants and the lowest‑locant
+orientation are computed for every molecule at once, and each *distinct*
+name is assembled only once.  Results match :func:`~chemname.naming.name`
+exactly, including its orientation rules; molecules outside the class are
+reported as ``None`` by :func:`name_padded` and handed to ``name()`` by
+:func:`name_batch`.
+
+Importing this module requires NumPy.
+"""
+
+from __future__ import annotations
+
+from array import array
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Sequence, Tuple
+
+try:
+    import numpy as np
+except ImportError as exc:  # pragma: no cover – optional dependency
+    raise ImportError("chemname.naming.vectorized requires NumPy (pip install numpy)") from exc
+
+from ..core.frozen import FrozenMolecule
+from ..core.structures import Molecule
+from ..util import HALO_PREFIXES, ATOMIC_NUMBERS
+from .assembler import alphabetic_key, assemble_name
+from .namer import name
+
+MAX_ATOMS = 64  # larger molecules are never in the class; keeps padding small
+MAX_CHAIN = 12  # the key packs the chain length into four bits
+
+_CARBON = 6
+_BIG = 127
+# halogens in alphabetical order of their prefixes (bromo < chloro < fluoro < iodo)
+_HALOGENS = sorted(HALO_PREFIXES, key=lambda s: alphabetic_key(HALO_PREFIXES[s]))
+_HALOGEN_CODES = np.array([ATOMIC_NUMBERS[s] for s in _HALOGENS])
+
+
+@dataclass(frozen=True, slots=True)
+class PaddedBatch:
+    """``B`` molecules padded to ``N`` atoms of at most ``D`` neighbours.
+
+    ``elements[b, p]`` is the atomic number of position ``p`` (``-1`` past
+    the end), ``neighbours[b, p]`` its neighbour positions (``-1`` padded)
+    and ``orders[b, p]`` the matching bond‑order codes (``util.BOND_ORDERS``).
+    Positions follow :class:`FrozenMolecule` numbering.
+    """
+
+    elements: np.ndarray
+    neighbours: np.ndarray
+    orders: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.elements)
+
+    def __getitem__(self, rows: slice) -> "PaddedBatch":
+        return PaddedBatch(self.elements[rows], self.neighbours[rows], self.orders[rows])
+
+
+def pack(
+    molecules: Iterable[Molecule | FrozenMolecule], max_atoms: int = MAX_ATOMS
+) -> Tuple[PaddedBatch, List[int]]:
+    """Pad ``molecules`` into a :class:`PaddedBatch`.
+
+    Returns the batch and the input index of each row; molecules with more
+    than ``max_atoms`` atoms are left out.
+    """
+    rows: List[int] = []
+    sizes = array("q")
+    elements = array("H")
+    offsets = array("q")
+    targets = array("q")
+    orders = array("B")
+    for i, mol in enumerate(molecules):
+        g = mol.freeze()
+        if len(g) > max_atoms:
+            continue
+        rows.append(i)
+        sizes.append(len(g))
+        elements.extend(g.elements)
+        offsets.extend(g.offsets)
+        targets.extend(g.targets)
+        orders.extend(g.orders)
+
+    b = len(rows)
+    n_atoms = np.frombuffer(sizes, dtype=np.int64)
+    width = int(n_atoms.max()) if b else 0
+    # per‑molecule offsets arrays have n + 1 entries; drop the diff across each seam
+    seams = np.cumsum(n_atoms + 1)[:-1] - 1
+    degree = np.delete(np.diff(np.frombuffer(offsets, dtype=np.int64)), seams)
+    depth = int(degree.max()) if degree.size else 0
+
+    mol_of_atom = np.repeat(np.arange(b), n_atoms)
+    pos_of_atom = np.arange(len(mol_of_atom)) - np.repeat(np.cumsum(n_atoms) - n_atoms, n_atoms)
+    out_elements = np.full((b, width), -1, dtype=np.int16)
+    out_elements[mol_of_atom, pos_of_atom] = np.frombuffer(elements, dtype=np.uint16)
+
+    src = np.repeat(np.arange(len(degree)), degree)
+    slot = np.arange(len(src)) - np.repeat(np.cumsum(degree) - degree, degree)
+    out_neighbours = np.full((b, width, depth), -1, dtype=np.int16)
+    out_orders = np.zeros((b, width, depth), dtype=np.int8)
+    if len(src):
+        out_neighbours[mol_of_atom[src], pos_of_atom[src], slot] = np.frombuffer(targets, dtype=np.int64)
+        out_orders[mol_of_atom[src], pos_of_atom[src], slot] = np.frombuffer(orders, dtype=np.uint8)
+    return PaddedBatch(out_elements, out_neighbours, out_orders), rows
+
+
+def _walk_chains(batch: PaddedBatch, is_c: np.ndarray, ok: np.ndarray):
+    """Walk every carbon chain in lock‑step from its lowest‑position end.
+
+    Returns (chain positions ``(B, MAX_CHAIN)``, bond codes along the chain
+    ``(B, MAX_CHAIN - 1)``, number of carbons reached).
+    """
+    b = len(batch)
+    rows = np.arange(b)
+    nb, orders = batch.neighbours, batch.orders
+    nb_is_c = is_c[rows[:, None, None], np.where(nb < 0, 0, nb)] & (nb >= 0)
+    c_degree = nb_is_c.sum(axis=2)
+    ends = is_c & (c_degree <= 1)
+    ok &= ends.any(axis=1)  # a pure carbon ring has no end
+
+    chain = np.full((b, MAX_CHAIN), -1, dtype=np.int64)
+    bond_codes = np.zeros((b, MAX_CHAIN - 1), dtype=np.int8)
+    cur = np.where(ok, ends.argmax(axis=1), -1)
+    prev = np.full(b, -1)
+    reached = np.zeros(b, dtype=np.int64)
+    for t in range(MAX_CHAIN):
+        alive = cur >= 0
+        if not alive.any():
+            break
+        chain[:, t] = cur
+        reached += alive
+        here = np.where(alive, cur, 0)
+        cand = nb[rows, here]
+        step = nb_is_c[rows, here] & (cand != prev[:, None]) & alive[:, None]
+        has_next = step.any(axis=1)
+        slot = step.argmax(axis=1)
+        if t < MAX_CHAIN - 1:
+            bond_codes[:, t] = np.where(has_next, orders[rows, here, slot], 0)
+        prev = cur
+        cur = np.where(has_next, cand[rows, slot], -1)
+    # longer chains (still moving after MAX_CHAIN carbons) are out of class
+    ok &= cur < 0
+    return chain, bond_codes, reached
+
+
+def _features(batch: PaddedBatch):
+    """Per‑molecule class membership and oriented naming features."""
+    elements, nb = batch.elements, batch.neighbours
+    b = len(batch)
+    rows = np.arange(b)
+    is_c = elements == _CARBON
+    kind = np.full(elements.shape, -1, dtype=np.int8)
+    for k, code in enumerate(_HALOGEN_CODES):
+        kind[elements == code] = k
+    is_hal = kind >= 0
+    n_c = is_c.sum(axis=1)
+
+    ok = ((is_c | is_hal | (elements < 0)).all(axis=1)) & (n_c > 0)
+    # halogens: exactly one bond, to a carbon
+    degree = (nb >= 0).sum(axis=2)
+    first_nb = np.where(nb[:, :, 0] < 0, 0, nb[:, :, 0]) if nb.shape[2] else np.zeros_like(elements)
+    hal_on_c = is_c[rows[:, None], first_nb]
+    ok &= (~is_hal | ((degree == 1) & hal_on_c)).all(axis=1)
+
+    chain, bond_codes, reached = _walk_chains(batch, is_c, ok)
+    ok &= reached == n_c  # one connected, unbranched, acyclic chain
+    length = n_c
+
+    double, triple = bond_codes == 2, bond_codes == 3
+    unsat = double | triple
+    ok &= ~(double.any(axis=1) & triple.any(axis=1))  # mixed: name() raises
+    utype = np.where(triple.any(axis=1), 2, np.where(double.any(axis=1), 1, 0))
+
+    # chain locant (1‑based) of every atom, then of every halogen's carbon
+    rank = np.zeros(elements.shape, dtype=np.int64)
+    placed = chain >= 0
+    rank[np.nonzero(placed)[0], chain[placed]] = np.nonzero(placed)[1] + 1
+    hal_loc = np.where(is_hal & ok[:, None], rank[rows[:, None], first_nb], 0)
+    return ok, length, utype, unsat, kind, hal_loc
+
+
+def _forward(length: np.ndarray, unsat: np.ndarray, kind: np.ndarray, hal_loc: np.ndarray) -> np.ndarray:
+    """Vectorised ``seniority.keeps_direction``: True where the walked direction is kept."""
+    ends = (length + 1)[:, None]
+    # unsaturation locants ascending; reversed ones keep that (descending) order
+    u_fwd = np.sort(np.where(unsat, np.arange(1, unsat.shape[1] + 1), _BIG), axis=1)
+    u_rev = np.where(u_fwd < _BIG, ends - u_fwd, _BIG)
+    s_fwd = np.sort(np.where(hal_loc > 0, hal_loc, _BIG), axis=1)
+    s_rev = np.sort(np.where(s_fwd < _BIG, ends - s_fwd, _BIG), axis=1)
+    # then locants in order of citation: halogen kinds are alphabetical
+    halo = hal_loc > 0
+    c_fwd = np.sort(np.where(halo, kind * _LOC_SPAN + hal_loc, _BIG), axis=1)
+    c_rev = np.sort(np.where(halo, kind * _LOC_SPAN + ends - hal_loc, _BIG), axis=1)
+    fwd = np.concatenate([u_fwd, s_fwd, c_fwd], axis=1)
+    rev = np.concatenate([u_rev, s_rev, c_rev], axis=1)
+
+    rows = np.arange(len(length))
+    differ = fwd != rev
+    first = differ.argmax(axis=1)
+    # a complete tie keeps the walk
+    return ~differ.any(axis=1) | (fwd[rows, first] < rev[rows, first])
+
+
+# oriented features packed into int64 words: word 0 holds the chain length
+# (4 bits), the suffix (2 bits) and the unsaturation locant bitmask; then
+# halogens as sorted 6‑bit codes ``kind * 13 + locant``, ten per word
+_LOC_SPAN = MAX_CHAIN + 1
+_CODE_BITS = 6
+_CODES_PER_WORD = 10
+_CODE_MASK = (1 << _CODE_BITS) - 1
+_PREFIXES = [HALO_PREFIXES[symbol] for symbol in _HALOGENS]
+_SUFFIXES = (None, "ene", "yne")
+
+
+def _keys(length, utype, unsat, kind, hal_loc, forward) -> np.ndarray:
+    ends = (length + 1)[:, None]
+    bonds = np.arange(1, unsat.shape[1] + 1, dtype=np.int64)
+    u_loc = np.where(forward[:, None], bonds, ends - bonds)
+    mask = np.where(unsat, np.left_shift(1, u_loc), 0).sum(axis=1)
+    word0 = length | (utype << 4) | (mask << 6)
+
+    s_loc = np.where(forward[:, None], hal_loc, ends - hal_loc)
+    codes = np.sort(np.where(hal_loc > 0, kind.astype(np.int64) * _LOC_SPAN + s_loc, 0), axis=1)
+    most = int((hal_loc > 0).sum(axis=1).max()) if len(hal_loc) else 0
+    n_words = -(-most // _CODES_PER_WORD)
+    codes = codes[:, codes.shape[1] - most :] if most else codes[:, :0]
+    codes = np.pad(codes, ((0, 0), (0, n_words * _CODES_PER_WORD - most)))
+    shifts = np.arange(_CODES_PER_WORD, dtype=np.int64) * _CODE_BITS
+    words = (codes.reshape(len(codes), n_words, _CODES_PER_WORD) << shifts).sum(axis=2)
+    return np.concatenate([word0[:, None], words], axis=1)
+
+
+def _unique_rows(keys: np.ndarray):
+    """Return (one row index per distinct key, group of every row)."""
+    order = np.lexsort(keys.T[::-1])
+    ordered = keys[order]
+    new = np.ones(len(keys), dtype=bool)
+    new[1:] = (ordered[1:] != ordered[:-1]).any(axis=1)
+    group = np.empty(len(keys), dtype=np.int64)
+    group[order] = np.cumsum(new) - 1
+    return order[new], group
+
+
+def _render(key: List[int]) -> str:
+    word0 = key[0]
+    length, utype, mask = word0 & 15, (word0 >> 4) & 3, word0 >> 6
+    unsat_locs = [loc for loc in range(1, _LOC_SPAN) if mask >> loc & 1]
+    # codes ascend, i.e. halogens come alphabetically and locants in order
+    subs: Dict[str, List[int]] = {}
+    for word in key[1:]:
+        while word:
+            kind, loc = divmod(word & _CODE_MASK, _LOC_SPAN)
+            word >>= _CODE_BITS
+            if loc:
+                subs.setdefault(_PREFIXES[kind], []).append(loc)
+    return assemble_name(length, _SUFFIXES[utype], unsat_locs, list(subs.items()))
+
+
+def name_padded(batch: PaddedBatch) -> List[str | None]:
+    """Name every row of ``batch``; ``None`` for molecules outside the class."""
+    out: List[str | None] = [None] * len(batch)
+    if not out:
+        return out
+    ok, length, utype, unsat, kind, hal_loc = _features(batch)
+    forward = _forward(length, unsat, kind, hal_loc)
+    idx = np.nonzero(ok)[0]
+    if not len(idx):
+        return out
+    keys = _keys(length[idx], utype[idx], unsat[idx], kind[idx], hal_loc[idx], forward[idx])
+    first, group = _unique_rows(keys)
+    names = [_render(key) for key in keys[first].tolist()]
+    for i, g in zip(idx.tolist(), group.tolist()):
+        out[i] = names[g]
+    return out
+
+
+def name_batch(molecules: Sequence[Molecule | FrozenMolecule]) -> List[str]:
+    """Name a sequence of molecules; the straight‑chain class is vectorised.
+
+    Everything else goes through :func:`~chemname.naming.name`, so the result
+    (and any exception) is the same as ``[name(m) for m in molecules]``.
+    """
+    batch, rows = pack(molecules)
+    out: List[str | None] = [None] * len(molecules)
+    for i, text in zip(rows, name_padded(batch)):
+        out[i] = text
+    return [text if text is not None else name(mol) for text, mol in zip(out, molecules)]
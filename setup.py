@@ -18,6 +18,7 @@ setup(
     python_requires=">=3.9",
     packages=find_packages(include=[NAME, f"{NAME}.*"]),
     include_package_data=True,
+    extras_require={"numpy": ["numpy>=1.22"]},
     license="MIT",
     classifiers=[
         "Programming Language :: Python :: 3 :: Only",
@@ -44,12 +44,12 @@ CASES = [
     ("2-chloro-2-methylpropane", build_molecule(3, substituents=[(2, "Cl"), (2, "C")])),
     # 26: two ethyls
     ("3,4-diethyloctane", build_molecule(8, substituents=[(3, ["C", "C"]), (4, ["C", "C"])])),
-    # 27: ethyl + methyl
-    ("2-ethyl-3-methylhexane", build_molecule(6, substituents=[(2, ["C", "C"]), (3, "C")])),
+    # 27: ethyl + methyl (ethyl at C2 extends the longest chain)
+    ("3,4-dimethylheptane", build_molecule(6, substituents=[(2, ["C", "C"]), (3, "C")])),
     # 28: diethyl
     ("3,3-diethylpentane", build_molecule(5, substituents=[(3, ["C", "C"]), (3, ["C", "C"])])),
-    # 29: diethyl + methyl
-    ("2,5-diethyl-5-methylheptane", build_molecule(7, substituents=[(2, ["C", "C"]), (5, ["C", "C"]), (5, "C")])),
+    # 29: diethyl + methyl (longest chain runs through an ethyl)
+    ("3-ethyl-3,6-dimethyloctane", build_molecule(7, substituents=[(2, ["C", "C"]), (5, ["C", "C"]), (5, "C")])),
     # 30: halo + multi‑unsat
     ("4-chlorohexa-1,4-diene", build_molecule(6, unsat="ene", unsat_locs=[1, 4], substituents=[(4, "Cl")])),
     # 31: halo + ethyl + single unsat
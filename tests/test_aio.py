@@ -0,0 +1,170 @@
+"""asyncio naming front‑end."""
+import asyncio
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from contextlib import aclosing
+
+import pytest
+
+from chemname import Molecule
+from chemname.naming.aio import aname, aname_stream
+from chemname.naming.namer import name
+from .golden.builders import build_molecule
+
+
+def _corpus(n=30):
+    mols = [build_molecule(k % 10 + 2, substituents=[(2, "Br")]) for k in range(n)]
+    bad = Molecule()
+    bad.add_atom("O", 0)
+    mols[5] = bad
+    return mols
+
+
+async def _collect(stream):
+    return [r async for r in stream]
+
+
+def test_aname():
+    mol = build_molecule(4, substituents=[(2, "Cl")])
+    assert asyncio.run(aname(mol)) == "2-chlorobutane"
+
+
+@pytest.mark.parametrize("chunksize", [1, 4])
+def test_stream_ordered_with_per_item_errors(chunksize):
+    mols = _corpus()
+    results = asyncio.run(_collect(aname_stream(mols, 3, chunksize=chunksize)))
+    assert [r.index for r in results] == list(range(len(mols)))
+    assert [r.index for r in results if not r.ok] == [5]
+    assert all(r.name == name(m) for r, m in zip(results, mols) if r.ok)
+
+
+def test_stream_async_input_unordered():
+    mols = _corpus()
+
+    async def source():
+        for m in mols:
+            await asyncio.sleep(0)
+            yield m
+
+    results = asyncio.run(_collect(aname_stream(source(), 4, ordered=False)))
+    assert sorted(r.index for r in results) == list(range(len(mols)))
+
+
+def test_sync_input_is_read_off_the_loop():
+    mols = _corpus(12)
+    readers = set()
+
+    def slow():
+        for m in mols:
+            readers.add(threading.get_ident())
+            time.sleep(0.02)  # a blocking producer, e.g. a file being parsed
+            yield m
+
+    async def main():
+        lag = 0.0
+
+        async def tick():
+            nonlocal lag
+            while True:
+                t0 = time.perf_counter()
+                await asyncio.sleep(0.005)
+                lag = max(lag, time.perf_counter() - t0 - 0.005)
+
+        ticker = asyncio.ensure_future(tick())
+        results = await _collect(aname_stream(slow(), 2, chunksize=3))
+        ticker.cancel()
+        return results, lag
+
+    results, lag = asyncio.run(main())
+    assert [r.index for r in results] == list(range(len(mols)))
+    assert threading.get_ident() not in readers
+    assert lag < 0.05  # reading three items inline would stall the loop for 0.06 s
+
+
+def test_backpressure_bounds_reads():
+    mols = _corpus()
+    pulled = []
+
+    async def source():
+        for m in mols:
+            pulled.append(m)
+            yield m
+
+    async def main():
+        seen = []
+        async with aclosing(aname_stream(source(), 2, chunksize=3)) as stream:
+            async for r in stream:
+                await asyncio.sleep(0.01)  # slow consumer
+                seen.append(len(pulled) - len(seen))  # read but not yet handed out
+                if len(seen) == 4:
+                    break
+        return seen
+
+    seen = asyncio.run(main())
+    # two chunks in flight or being consumed, plus one full chunk waiting
+    assert max(seen) <= (2 + 1) * 3
+    assert len(pulled) < len(mols)
+
+
+def test_input_error_after_named_results():
+    async def source():
+        yield build_molecule(3)
+        raise RuntimeError("feed broke")
+
+    async def main():
+        got = []
+        with pytest.raises(RuntimeError, match="feed broke"):
+            async for r in aname_stream(source()):
+                got.append(r.name)
+        return got
+
+    assert asyncio.run(main()) == ["propane"]
+
+
+@pytest.mark.parametrize("chunksize", [1, 4])
+def test_refused_submit_ends_the_stream(chunksize):
+    pool = ThreadPoolExecutor(2)
+    pool.shutdown()
+
+    async def main():
+        stream = aname_stream(_corpus(10), executor=pool, chunksize=chunksize)
+        with pytest.raises(RuntimeError, match="shutdown"):
+            await asyncio.wait_for(_collect(stream), 5)
+
+    asyncio.run(main())
+
+
+def test_cancellation_stops_the_producer():
+    async def endless():
+        k = 0
+        while True:
+            k += 1
+            yield build_molecule(k % 8 + 1)
+
+    async def consume():
+        async for _ in aname_stream(endless(), 2):
+            pass
+
+    async def main():
+        task = asyncio.ensure_future(consume())
+        await asyncio.sleep(0.05)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+    asyncio.run(main())
+
+
+def test_process_executor():
+    mols = _corpus(8)
+
+    async def main():
+        with ProcessPoolExecutor(1) as pool:
+            first = await aname(mols[0], executor=pool)
+            rest = await _collect(aname_stream(mols, 2, executor=pool, chunksize=4))
+        return first, rest
+
+    first, rest = asyncio.run(main())
+    assert first == name(mols[0])
+    assert [r.name for r in rest if r.ok] == [name(m) for k, m in enumerate(mols) if k != 5]
@@ -0,0 +1,56 @@
+"""Behaviour tests for the batch naming API."""
+import os
+from concurrent.futures.process import BrokenProcessPool
+
+from chemname import Molecule, NameResult, name_many
+from chemname.naming.batch import _name_chunk, _stream
+from chemname.naming.namer import name
+from .golden.builders import build_molecule
+
+
+def _corpus():
+    mols = [build_molecule(n % 12 + 1, substituents=[(1, "Cl")]) for n in range(40)]
+    bad = Molecule()
+    bad.add_atom("O", 0)
+    mols[7] = bad
+    return mols
+
+
+def test_serial_matches_name():
+    mols = _corpus()
+    results = list(name_many(mols, workers=1, chunksize=3))
+    assert [r.index for r in results] == list(range(len(mols)))
+    for r, m in zip(results, mols):
+        if r.index == 7:
+            assert not r.ok and isinstance(r.error, ValueError)
+        else:
+            assert r.ok and r.name == name(m)
+
+
+def test_pool_ordered_with_per_item_errors():
+    mols = _corpus()
+    results = list(name_many(iter(mols), workers=2, chunksize=4))
+    assert [r.index for r in results] == list(range(len(mols)))
+    assert [r.index for r in results if not r.ok] == [7]
+    assert results[0] == NameResult(0, "chloromethane")
+
+
+def test_pool_unordered_covers_all():
+    mols = _corpus()
+    results = list(name_many(mols, workers=2, chunksize=5, ordered=False))
+    assert sorted(r.index for r in results) == list(range(len(mols)))
+
+
+def _dies_on_zero(chunk):
+    if chunk[0][0] == 0:
+        os._exit(1)
+    return _name_chunk(chunk)
+
+
+def test_broken_pool_is_reported_per_item():
+    mols = _corpus()
+    for ordered in (True, False):
+        results = list(_stream(mols, _dies_on_zero, 2, 1, ordered, 2))
+        assert sorted(r.index for r in results) == list(range(len(mols)))
+        assert isinstance(next(r for r in results if r.index == 0).error, BrokenProcessPool)
+        assert all(r.ok or isinstance(r.error, (BrokenProcessPool, ValueError)) for r in results)
@@ -0,0 +1,42 @@
+"""Benchmark suite plumbing (generator, result schema, regression detection)."""
+import random
+
+from chemname.benchmarks.compare import compare, mann_whitney_greater
+from chemname.benchmarks.generator import AXES, corpus
+from chemname.benchmarks.run import STAGES, run_suite
+from chemname.naming import cache_info
+from chemname.naming.namer import name
+
+
+def test_corpus_is_deterministic_and_nameable():
+    for axis, values in AXES.items():
+        for value in values:
+            a = corpus(axis, value, 5)
+            b = corpus(axis, value, 5)
+            assert [m.canonical_key() for m in a] == [m.canonical_key() for m in b]
+            for m in a:
+                name(m)
+
+
+def test_run_suite_schema_keeps_cache_size():
+    before = cache_info().maxsize
+    doc = run_suite(count=5, repeats=2, axes={"chain_length": (4,)})
+    res = doc["results"]["chain_length=4"]
+    assert set(res["stages"]) == set(STAGES)
+    assert len(res["stages"]["name"]["samples_us"]) == 2
+    assert set(res["latency_us"]) == {"p50", "p90", "p99"}
+    assert cache_info().maxsize == before
+
+
+def _doc(samples):
+    return {"results": {"c": {"stages": {s: {"samples_us": v} for s, v in samples.items()}}}}
+
+
+def test_compare_flags_only_significant_slowdowns():
+    rng = random.Random(1)
+    noise = [10 + rng.random() for _ in range(10)]
+    base = _doc({"chain": noise, "name": noise})
+    current = _doc({"chain": [v * 1.5 for v in noise], "name": [v + rng.random() * 0.1 for v in noise]})
+    regressions = compare(base, current)
+    assert [r.stage for r in regressions] == ["chain"]
+    assert mann_whitney_greater(noise, noise) > 0.4
@@ -0,0 +1,135 @@
+"""Binary molecule records and the memory‑mapped container."""
+import gc
+import os
+import pickle
+import random
+import time
+
+import pytest
+
+from chemname import FrozenMolecule, Molecule
+from chemname.core.exceptions import BinaryFormatError
+from chemname.formats.binary import MoleculeFile, MoleculeWriter, dump, encode, record_size
+from chemname.naming.namer import name
+from .golden.builders import build_molecule
+
+SKIP = os.getenv("CI_SKIPPERF")
+
+
+def _same(a, b):
+    return (
+        {at.index: (at.symbol, at.isotope, at.charge) for at in a}
+        == {at.index: (at.symbol, at.isotope, at.charge) for at in b}
+        and {(bd.atoms, bd.order) for bd in a._bonds.values()}
+        == {(bd.atoms, bd.order) for bd in b._bonds.values()}
+    )
+
+
+def _corpus(count, seed=0):
+    rng = random.Random(seed)
+    out = []
+    for _ in range(count):
+        n = rng.randint(3, 10)
+        subs = [(rng.randint(2, n - 1), rng.choice(["Cl", "C", ["C", "C"]])) for _ in range(rng.randint(0, 2))]
+        out.append(build_molecule(n, unsat=rng.choice([None, "ene"]), unsat_locs=[1], substituents=subs))
+    return out
+
+
+def test_record_round_trip():
+    mol = Molecule.from_arrays(
+        ["C", "C", "O", "Xx"], [(10, 20), (20, 30), (10, 40)], [2, 1, 1],
+        indices=[10, 20, 30, 40], charges=[0, 0, -1, 0], isotopes=[13, None, None, None],
+    )
+    data = mol.to_bytes()
+    assert record_size(data) == len(data)
+    back = Molecule.from_buffer(data)
+    assert _same(back, mol)
+    view = FrozenMolecule.from_buffer(data)
+    assert isinstance(view.targets, memoryview)
+    assert view.symbols() == ("C", "C", "O", "Xx") and view.position(30) == 2
+    assert pickle.loads(pickle.dumps(view)).canonical_key() == mol.canonical_key()
+
+
+def test_bad_records():
+    data = build_molecule(3).to_bytes()
+    with pytest.raises(BinaryFormatError):
+        Molecule.from_buffer(b"XXXX" + data[4:])
+    with pytest.raises(BinaryFormatError):
+        Molecule.from_buffer(data[:4] + b"\x09" + data[5:])
+    with pytest.raises(BinaryFormatError):
+        Molecule.from_buffer(data[:-4])
+    big = Molecule()
+    big.add_atom("C", 2**33)
+    with pytest.raises(BinaryFormatError):
+        encode(big)
+
+
+def test_container_random_access_and_naming(tmp_path):
+    mols = _corpus(50)
+    path = str(tmp_path / "c.cnm")
+    assert dump(mols, path) == 50
+    with MoleculeFile(path) as f:
+        assert len(f) == 50
+        assert _same(f[37], mols[37]) and _same(f[-1], mols[-1])
+        assert name(f.frozen(12)) == name(mols[12])
+        assert [m.canonical_key() for m in f] == [m.canonical_key() for m in mols]
+        with pytest.raises(IndexError):
+            f.frozen(50)
+        results = list(f.name_many(workers=1, chunksize=7))
+        assert [r.name for r in results] == [name(m) for m in mols]
+        pooled = list(f.name_many(workers=2, chunksize=16))
+        assert [r.name for r in pooled] == [r.name for r in results]
+
+
+def test_writer_and_bad_container(tmp_path):
+    path = str(tmp_path / "w.cnm")
+    with MoleculeWriter(path) as w:
+        assert w.add(build_molecule(2)) == 0
+        assert w.add(build_molecule(4).freeze()) == 1
+    with MoleculeFile(path) as f:
+        assert [name(m) for m in f.iter_frozen()] == ["ethane", "butane"]
+    bad = tmp_path / "bad.cnm"
+    bad.write_bytes(b"nope" + bytes(40))
+    with pytest.raises(BinaryFormatError):
+        MoleculeFile(str(bad))
+    for data in (b"", b"CNM"):  # empty: mmap itself would refuse with ValueError
+        bad.write_bytes(data)
+        with pytest.raises(BinaryFormatError, match="Truncated container header"):
+            MoleculeFile(str(bad))
+
+
+def test_close_with_live_views_can_be_retried(tmp_path):
+    path = str(tmp_path / "v.cnm")
+    dump(_corpus(5), path)
+    f = MoleculeFile(path)
+    view = f.frozen(3)
+    expected = name(f.frozen(3))
+    f.close()
+    assert not f.closed and name(view) == expected  # the view still reads the map
+    with pytest.raises(ValueError):
+        f.frozen(0)
+    del view
+    gc.collect()
+    f.close()
+    assert f.closed
+    f.close()
+
+
+@pytest.mark.skipif(SKIP, reason="Perf test skipped by env var")
+def test_mapped_views_faster_than_unpickling(tmp_path):
+    mols = _corpus(5000, seed=1)
+    path = str(tmp_path / "p.cnm")
+    dump(mols, path)
+    blob = pickle.dumps(mols)
+    assert os.path.getsize(path) < len(blob)
+
+    t0 = time.perf_counter()
+    pickle.loads(blob)
+    unpickle = time.perf_counter() - t0
+    with MoleculeFile(path) as f:
+        t0 = time.perf_counter()
+        views = [f.frozen(k) for k in range(len(f))]
+        mapped = time.perf_counter() - t0
+        del views
+    print(f"unpickle={unpickle * 1e3:.1f}ms mapped={mapped * 1e3:.1f}ms")
+    assert mapped < unpickle
@@ -0,0 +1,155 @@
+"""Branched substituent names and their shape table."""
+import os
+import random
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from chemname import Molecule, parse
+from chemname.benchmarks.branched import dendrimer
+from chemname.naming import alkyl
+from chemname.naming.alkyl import branched_name, shape_cache_clear
+from chemname.naming.cache import _cache
+from chemname.naming.namer import name
+
+SKIP = os.getenv("CI_SKIPPERF")
+M = []  # a methyl leaf in the nested specs below
+
+
+def _chain_with(length, branches):
+    """Straight chain with nested branch specs: (locant, [child spec, …])."""
+    symbols = ["C"] * length
+    edges = [(k, k + 1) for k in range(length - 1)]
+    todo = [(loc - 1, spec) for loc, spec in branches]
+    while todo:
+        at, spec = todo.pop()
+        symbols.append("C")
+        edges.append((at, len(symbols) - 1))
+        todo.extend((len(symbols) - 1, child) for child in spec)
+    return Molecule.from_arrays(symbols, edges, [1] * len(edges))
+
+
+@pytest.mark.parametrize(
+    "parents, expected",
+    [
+        ([-1, 0, 0], "1-methylethyl"),
+        ([-1, 0, 0, 0], "1,1-dimethylethyl"),
+        ([-1, 0, 0, 1], "1-methylpropyl"),
+        ([-1, 0, 1, 1], "2-methylpropyl"),
+        ([-1, 0, 1, 1, 1], "2,2-dimethylpropyl"),
+        ([-1, 0, 0, 1, 1, 2, 2], "2-methyl-1-(1-methylethyl)propyl"),
+    ],
+)
+def test_group_names(parents, expected):
+    assert branched_name(parents) == expected
+
+
+@pytest.mark.parametrize(
+    "mol, expected",
+    [
+        (_chain_with(7, [(4, [M, M])]), "4-(1-methylethyl)heptane"),
+        (_chain_with(9, [(5, [M, M, M])]), "5-(1,1-dimethylethyl)nonane"),
+        (_chain_with(9, [(4, [M, M]), (6, [M, M])]), "4,6-bis(1-methylethyl)nonane"),
+        (_chain_with(8, [(2, M), (4, [M, M])]), "2-methyl-4-(1-methylethyl)octane"),
+        (_chain_with(12, [(6, [[M, M], [M, M]])]), "6-[2-methyl-1-(1-methylethyl)propyl]dodecane"),
+        (_chain_with(6, [(3, [M, M])]), "3-ethyl-2-methylhexane"),  # the main chain runs through it
+    ],
+)
+def test_molecule_names_round_trip(mol, expected):
+    assert name(mol) == expected
+    assert name(parse(expected)) == expected
+
+
+def test_ring_substituent():
+    ring = _chain_with(6, [(1, [M, M])])
+    ring.add_bond(0, 5)
+    assert name(ring) == "(1-methylethyl)cyclohexane"
+
+
+def test_repeated_shapes_are_described_once(monkeypatch):
+    shape_cache_clear()
+    described = []
+    real = alkyl._describe
+    monkeypatch.setattr(alkyl, "_describe", lambda kids: described.append(kids) or real(kids))
+    mol = dendrimer(2, 3)
+    saved = _cache.maxsize
+    _cache.resize(0)
+    try:
+        first = name(mol)
+        # leaf, tert‑butyl‑like level and the arm itself: three shapes for 52 arm atoms
+        assert len(described) == 3
+        assert name(dendrimer(2, 3)) == first and len(described) == 3
+    finally:
+        _cache.resize(saved)
+    assert first == "5,6,7,8-tetrakis[1,1-bis(1,1-dimethylethyl)-2,2-dimethylpropyl]dodecane"
+
+
+def _random_tree(rng, n):
+    """BFS parent array of a random rooted tree, at most three children a carbon."""
+    parents = [-1]
+    free = [0]
+    while len(parents) < n:
+        at = rng.choice(free)
+        parents.append(at)
+        free.append(len(parents) - 1)
+        if parents.count(at) == 3:
+            free.remove(at)
+    children = [[] for _ in range(n)]
+    for k in range(1, n):
+        children[parents[k]].append(k)
+    order = [0]
+    for v in order:
+        order.extend(children[v])
+    pos = {v: p for p, v in enumerate(order)}
+    return [-1] + [pos[parents[v]] for v in order[1:]]
+
+
+def test_names_do_not_depend_on_earlier_shapes():
+    rng = random.Random(1)
+    trees = [_random_tree(rng, rng.randint(5, 18)) for _ in range(200)]
+    cold = []
+    for tree in trees:
+        shape_cache_clear()
+        cold.append(branched_name(tree))
+    shape_cache_clear()
+    for k in rng.sample(range(len(trees)), len(trees)):
+        assert branched_name(trees[k]) == cold[k]
+
+
+def test_shape_table_is_thread_safe():
+    rng = random.Random(2)
+    trees = [_random_tree(rng, rng.randint(5, 18)) for _ in range(300)]
+    shape_cache_clear()
+    expected = [branched_name(tree) for tree in trees]
+
+    def work(seed):
+        order = random.Random(seed).sample(range(len(trees)), len(trees))
+        wrong = 0
+        for step, k in enumerate(order):
+            if step % 50 == seed:
+                shape_cache_clear()
+            wrong += branched_name(trees[k]) != expected[k]
+        return wrong
+
+    with ThreadPoolExecutor(8) as pool:
+        assert sum(pool.map(work, range(16))) == 0
+
+
+@pytest.mark.skipif(SKIP, reason="Perf test skipped by env var")
+def test_memoised_shapes_beat_a_cold_table():
+    arm = [-1] + [0] * 3 + [1 + k // 3 for k in range(9)]  # one 13‑carbon dendritic arm
+    rounds = 3000
+
+    t0 = time.perf_counter()
+    for _ in range(rounds):
+        shape_cache_clear()
+        branched_name(arm)
+    cold = time.perf_counter() - t0
+    shape_cache_clear()
+    t0 = time.perf_counter()
+    for _ in range(rounds):
+        branched_name(arm)
+    warm = time.perf_counter() - t0
+    print(f"cold={cold * 1e3:.1f}ms memoised={warm * 1e3:.1f}ms")
+    assert warm < cold / 2
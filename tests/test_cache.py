@@ -0,0 +1,104 @@
+"""Canonical keys and the LRU name cache."""
+import random
+
+import pytest
+
+from chemname import Molecule, cache_clear, cache_info, set_cache_size
+from chemname.naming.cache import DEFAULT_MAXSIZE
+from chemname.naming.namer import name
+from .golden.builders import build_molecule
+
+
+def _permuted(mol, seed):
+    """Copy *mol* with shuffled atom indices and insertion order."""
+    rng = random.Random(seed)
+    old = [a.index for a in mol]
+    new = old[:]
+    rng.shuffle(new)
+    remap = dict(zip(old, new))
+    atoms = list(mol)
+    rng.shuffle(atoms)
+    bonds = list(mol._bonds.values())
+    rng.shuffle(bonds)
+    out = Molecule()
+    for a in atoms:
+        out.add_atom(a.symbol, remap[a.index])
+    for b in bonds:
+        i, j = tuple(b.atoms)
+        out.add_bond(remap[j], remap[i], b.order)
+    return out
+
+
+@pytest.fixture(autouse=True)
+def _fresh_cache():
+    cache_clear()
+    yield
+    set_cache_size(DEFAULT_MAXSIZE)
+    cache_clear()
+
+
+def test_key_is_index_independent():
+    mol = build_molecule(4, unsat="ene", unsat_locs=[1], substituents=[(2, "C"), (3, ["C", "C"]), (2, "Cl")])
+    keys = {_permuted(mol, s).canonical_key() for s in range(20)}
+    assert keys == {mol.canonical_key()}
+
+
+def test_key_separates_isomers():
+    a = build_molecule(4, substituents=[(2, "C"), (2, "C")])
+    b = build_molecule(4, substituents=[(2, "C"), (3, "C")])
+    c = build_molecule(4, unsat="ene", unsat_locs=[1], substituents=[(2, "C"), (2, "C")])
+    assert len({a.canonical_key(), b.canonical_key(), c.canonical_key()}) == 3
+
+
+def test_ring_has_no_key():
+    m = build_molecule(3)
+    m.add_bond(0, 2)
+    assert m.canonical_key() is None
+
+
+def test_permuted_copies_hit_same_entry():
+    mol = build_molecule(4, substituents=[(2, "C"), (2, "C")])
+    assert name(mol) == "2,2-dimethylbutane"
+    assert name(_permuted(mol, 1)) == "2,2-dimethylbutane"
+    info = cache_info()
+    assert (info.hits, info.misses, info.currsize) == (1, 1, 1)
+
+
+def test_eviction_and_disable():
+    set_cache_size(2)
+    for n in (1, 2, 3):
+        name(build_molecule(n))
+    info = cache_info()
+    assert (info.evictions, info.currsize) == (1, 2)
+
+    set_cache_size(0)
+    name(build_molecule(2))
+    assert cache_info().currsize == 0
+    assert cache_info().hits == 0
+
+
+def test_unsaturated_keyed_on_chain_direction():
+    a = build_molecule(3, unsat="ene", unsat_locs=[1], substituents=[(3, "Cl")])
+    b = build_molecule(3, unsat="ene", unsat_locs=[2], substituents=[(1, "Cl")])
+    assert name(a) == "3-chloroprop-1-ene"
+    assert name(b) == "1-chloroprop-2-ene"
+    # same graph key as ``a`` but walked from the chlorine end: a cached
+    # "3-chloroprop-1-ene" must not be served for it
+    c = _permuted(a, 3)
+    assert c.canonical_key() == a.canonical_key()
+    assert name(c) == "1-chloroprop-2-ene"
+    set_cache_size(0)
+    assert name(c) == "1-chloroprop-2-ene"
+
+
+def test_numbering_dependent_names_are_not_shared():
+    # mirror images whose orientation is left to the first‑candidate tie‑break
+    a = Molecule.from_edge_list(["C", "C", "Br", "Br", "Cl", "F"], [(0, 1), (0, 2), (1, 3), (0, 4), (1, 5)])
+    b = Molecule.from_edge_list(["C", "C", "Br", "Br", "Cl", "F"], [(0, 1), (0, 2), (1, 3), (1, 4), (0, 5)])
+    assert a.canonical_key() == b.canonical_key()
+    set_cache_size(0)
+    expected = [name(a), name(b)]
+    set_cache_size(DEFAULT_MAXSIZE)
+    cache_clear()
+    assert [name(a), name(b)] == expected
+    assert [name(b), name(a)] == expected[::-1]
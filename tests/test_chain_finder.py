@@ -0,0 +1,63 @@
+"""Longest‑chain enumeration on branched skeletons."""
+import random
+
+from chemname import Molecule
+from chemname.naming.chain_finder import find_chain, longest_chains
+from chemname.naming.namer import name
+from .golden.builders import build_molecule
+
+
+def random_tree(n, seed, *, max_degree=4):
+    """Random carbon tree; every atom keeps at most ``max_degree`` bonds."""
+    rng = random.Random(seed)
+    m = Molecule()
+    m.add_atom("C", 0)
+    open_atoms = [0]
+    degree = [0]
+    for i in range(1, n):
+        j = rng.choice(open_atoms)
+        m.add_atom("C", i)
+        m.add_bond(j, i)
+        degree[j] += 1
+        degree.append(1)
+        if degree[j] == max_degree:
+            open_atoms.remove(j)
+        open_atoms.append(i)
+    return m
+
+
+def _brute_force(mol):
+    """All longest simple paths, via a DFS from every atom."""
+    best, found = 0, set()
+    for start in range(len(mol)):
+        stack = [[start]]
+        while stack:
+            path = stack.pop()
+            ext = [nb for nb in mol.neighbours(path[-1]) if nb not in path]
+            if not ext:
+                key = tuple(path) if path[0] <= path[-1] else tuple(reversed(path))
+                if len(path) > best:
+                    best, found = len(path), {key}
+                elif len(path) == best:
+                    found.add(key)
+            stack.extend(path + [nb] for nb in ext)
+    return found
+
+
+def test_enumeration_matches_brute_force():
+    for seed in range(40):
+        mol = random_tree(random.Random(seed).randint(1, 14), seed)
+        chains = [tuple(c) for c in longest_chains(mol)]
+        assert len(chains) == len(set(chains))
+        assert set(chains) == _brute_force(mol)
+
+
+def test_ignores_heteroatoms():
+    mol = build_molecule(3, substituents=[(2, ["O", "C", "C", "C"])])
+    assert find_chain(mol) == [0, 1, 2]
+
+
+def test_unsaturated_chain_preferred():
+    mol = build_molecule(4, unsat="yne", unsat_locs=[1], substituents=[(2, "C"), (4, "C")])
+    assert len(list(longest_chains(mol))) == 2
+    assert name(mol) == "2-methylpent-1-yne"
@@ -0,0 +1,60 @@
+"""`python -m chemname` streaming pipeline."""
+import io
+import json
+
+from chemname.cli import main
+
+INPUT = "CCC\n\nC1CC1 ring\nCC(C)C  isobutane\n"
+
+
+def _run(monkeypatch, capsys, *argv, stdin=INPUT):
+    monkeypatch.setattr("sys.stdin", io.StringIO(stdin))
+    status = main(list(argv))
+    return status, capsys.readouterr()
+
+
+def test_tsv_records_errors(monkeypatch, capsys):
+    status, out = _run(monkeypatch, capsys, "--buffer", "0")
+    lines = out.out.splitlines()
+    assert status == 0
+    assert lines[0] == "CCC\tpropane"
+    assert lines[1].startswith("C1CC1\t\tSmilesError")
+    assert lines[2] == "CC(C)C\t2-methylpropane"
+
+
+def test_jsonl_skip_and_rejects(monkeypatch, capsys, tmp_path):
+    rejects = tmp_path / "bad.smi"
+    status, out = _run(monkeypatch, capsys, "--format", "jsonl", "--on-error", "skip", "--rejects", str(rejects))
+    records = [json.loads(line) for line in out.out.splitlines()]
+    assert [r["name"] for r in records] == ["propane", "2-methylpropane"]
+    assert rejects.read_text() == "C1CC1\n"
+
+
+def test_fail_fast_and_workers(monkeypatch, capsys, tmp_path):
+    status, out = _run(monkeypatch, capsys, "--on-error", "fail")
+    assert status == 1 and out.out == "CCC\tpropane\n"
+
+    src = tmp_path / "in.smi"
+    src.write_text("C\nCC\n" * 50)
+    status, out = _run(monkeypatch, capsys, str(src), "-j", "2", "--chunksize", "7")
+    assert out.out.splitlines() == ["C\tmethane", "CC\tethane"] * 50
+
+
+def test_unnameable_smiles_are_errors(monkeypatch, capsys, tmp_path):
+    bad = ["CC(=O)C", "C(C)C.CC", "CC[N+](C)(C)C", "CC(C)(C)(C)(C)C"]
+    stdin = "CCC\n" + "\n".join(bad) + "\n"
+    status, out = _run(monkeypatch, capsys, stdin=stdin)
+    lines = out.out.splitlines()
+    assert status == 0 and lines[0] == "CCC\tpropane"
+    assert len(lines) == 5
+    for line, smiles in zip(lines[1:], bad):
+        assert line.startswith(f"{smiles}\t\tSmilesError")
+
+    rejects = tmp_path / "bad.smi"
+    status, out = _run(monkeypatch, capsys, "--on-error", "skip", "--rejects", str(rejects), stdin=stdin)
+    assert status == 0 and out.out == "CCC\tpropane\n"
+    assert rejects.read_text().splitlines() == bad
+
+    status, out = _run(monkeypatch, capsys, "--on-error", "fail", stdin=stdin)
+    assert status == 1 and out.out == "CCC\tpropane\n"
+    assert "CC(=O)C" in out.err
@@ -0,0 +1,78 @@
+"""Columnar MoleculeBatch: appending, views, naming and memory."""
+import os
+import pickle
+from array import array
+
+import pytest
+
+from chemname import Molecule, MoleculeBatch
+from chemname.benchmarks.columnar import run
+from chemname.naming import name_many
+from chemname.naming.namer import name
+
+SKIP = os.getenv("CI_SKIPPERF")
+
+
+def _mols():
+    hexene = Molecule.from_arrays(["C"] * 6, [(k, k + 1) for k in range(5)], [1, 2, 1, 1, 1])
+    chloro = Molecule.from_arrays(["C", "C", "C", "Cl"], [(0, 1), (1, 2), (1, 3)])
+    odd = Molecule.from_arrays(["C", "Xx"], [(7, 3)], indices=[7, 3], charges=[0, 1])
+    return [hexene, chloro, odd]
+
+
+def test_append_and_views():
+    mols = _mols()
+    batch = MoleculeBatch(mols)
+    assert len(batch) == 3 and batch.n_atoms == 12 and batch.n_bonds == 9
+    assert list(batch.atom_offsets) == [0, 6, 10, 12]
+    assert batch.extra_symbols == ("Xx",)
+    for view, mol in zip(batch, mols):
+        g, h = view.freeze(), mol.freeze()
+        assert g.symbols() == h.symbols()
+        assert list(g.edges()) == list(h.edges())
+        assert list(g.charges) == list(h.charges)
+    assert batch[-1].symbols() == ("Xx", "C")  # ascending original index
+    with pytest.raises(IndexError):
+        batch[3]
+
+
+def test_views_name_like_molecules():
+    mols = _mols()[:2]
+    batch = MoleculeBatch(mols)
+    assert [name(v) for v in batch] == [name(m) for m in mols]
+    assert name(batch[0].to_molecule()) == "hex-2-ene"
+    back = pickle.loads(pickle.dumps(batch[1]))
+    assert name(back) == "2-chloropropane"
+    assert [r.name for r in name_many(batch, workers=1)] == ["hex-2-ene", "2-chloropropane"]
+
+
+def test_append_arrays():
+    batch = MoleculeBatch()
+    batch.append_arrays(["C", "C", "C", "Br"], [(0, 1), (1, 2), (2, 3)], isotopes=[None, 13, None, None])
+    assert name(batch[0]) == "1-bromopropane"
+    assert list(batch.isotopes) == [0, 13, 0, 0]
+    for edges, orders in (([(0, 4)], None), ([(0, 0)], None), ([(0, 1), (1, 0)], None), ([(0, 1)], [5])):
+        with pytest.raises(ValueError):
+            batch.append_arrays(["C"] * 3, edges, orders)
+    for charges, isotopes in (([0, 0, 300], None), ([0, 0, -129], None), (None, [12, -1, None]), (None, [70000, 0, 0])):
+        with pytest.raises(ValueError):
+            batch.append_arrays(["C", "C", "Zz"], [(0, 1)], charges=charges, isotopes=isotopes)
+    assert len(batch) == 1 and batch.n_atoms == 4  # failed appends leave no trace
+    assert len(batch.charges) == len(batch.isotopes) == len(batch.elements) == 4 and not batch._extra
+    batch.append_arrays(["C", "C"], [(0, 1)], charges=array("b", [1, -1]), isotopes=array("H", [13, 0]))
+    assert list(batch.charges) == [0, 0, 0, 0, 1, -1] and list(batch.isotopes)[4:] == [13, 0]
+
+
+def test_append_arrays_takes_numpy_columns():
+    np = pytest.importorskip("numpy")
+    batch = MoleculeBatch()
+    batch.append_arrays(["C", "C", "N"], [(0, 1), (1, 2)], charges=np.array([0, 0, 1]), isotopes=np.array([13, 0, 0]))
+    assert list(batch.charges) == [0, 0, 1] and list(batch.isotopes) == [13, 0, 0]
+
+
+@pytest.mark.skipif(SKIP, reason="Perf test skipped by env var")
+def test_batch_uses_a_fraction_of_the_memory():
+    doc = run(count=20_000, sample=2000)
+    print(doc)
+    assert doc["batch_bytes_per_atom"] < 32
+    assert doc["ratio"] > 10
@@ -0,0 +1,82 @@
+"""Isomer enumeration by canonical augmentation."""
+import pytest
+
+from chemname import Molecule
+from chemname.enumerate import isomers
+
+# acyclic alkanes C1…C10 (OEIS A000602)
+ALKANES = [1, 1, 1, 2, 3, 5, 9, 18, 35, 75]
+
+
+def _brute_force(max_carbons, halogens, max_halogens, max_multiples):
+    """Every extension of every molecule, de‑duplicated by canonical key."""
+    start = Molecule()
+    start.add_atom("C", 0)
+    seen = {start.canonical_key()}
+    frontier = [(["C"], [], [])]
+    while frontier:
+        nxt = []
+        for symbols, edges, orders in frontier:
+            carbons = symbols.count("C")
+            used = [0] * len(symbols)
+            for (i, j), o in zip(edges, orders):
+                used[i] += o
+                used[j] += o
+            multiples = sum(o > 1 for o in orders)
+            for at, sym in enumerate(symbols):
+                if sym != "C":
+                    continue
+                for new in ["C", *halogens]:
+                    if new == "C" and carbons == max_carbons:
+                        continue
+                    if new != "C" and len(symbols) - carbons == max_halogens:
+                        continue
+                    for o in (1, 2, 3) if new == "C" else (1,):
+                        if o > 4 - used[at] or (o > 1 and multiples == max_multiples):
+                            continue
+                        grown = (symbols + [new], edges + [(at, len(symbols))], orders + [o])
+                        key = Molecule.from_arrays(*grown).canonical_key()
+                        if key not in seen:
+                            seen.add(key)
+                            nxt.append(grown)
+        frontier = nxt
+    return seen
+
+
+def test_alkane_counts():
+    for n, expected in enumerate(ALKANES, 1):
+        assert sum(1 for _ in isomers(n, min_carbons=n)) == expected
+
+
+@pytest.mark.parametrize(
+    "bounds",
+    [(5, ("Cl",), 3, 0), (4, ("F", "Br"), 3, 1), (5, (), 0, 2)],
+)
+def test_matches_brute_force_without_duplicates(bounds):
+    max_carbons, halogens, max_halogens, max_multiples = bounds
+    keys = [
+        m.canonical_key()
+        for m in isomers(max_carbons, halogens=halogens, max_halogens=max_halogens, max_multiple_bonds=max_multiples)
+    ]
+    assert len(keys) == len(set(keys))
+    assert set(keys) == _brute_force(*bounds)
+
+
+def test_shards_partition_the_output():
+    kwargs = dict(halogens=("Cl", "I"), max_halogens=2, max_multiple_bonds=1)
+    whole = [m.canonical_key() for m in isomers(6, **kwargs)]
+    parts = [[m.canonical_key() for m in isomers(6, shard=i, of=4, **kwargs)] for i in range(4)]
+    assert sorted(sum(parts, [])) == sorted(whole)
+    assert all(parts)
+
+
+def test_bounds_progress_and_validation():
+    reports = []
+    mols = list(isomers(6, min_carbons=5, multiple_orders=(2,), max_multiple_bonds=1, progress=reports.append, report_every=5))
+    assert all(5 <= sum(a.symbol == "C" for a in m) <= 6 for m in mols)
+    assert all(b.order in (1, 2) for m in mols for b in m._bonds.values())
+    assert [r.count for r in reports] == list(range(5, len(mols) + 1, 5)) + [len(mols)]
+    assert reports[-1].rate > 0
+    for bad in (dict(halogens=("At",)), dict(shard=2, of=2), dict(multiple_orders=(4,))):
+        with pytest.raises(ValueError):
+            next(isomers(3, **bad))
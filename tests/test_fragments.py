@@ -0,0 +1,52 @@
+"""Single‑pass substituent fragment labelling."""
+import os
+import time
+
+import pytest
+
+from chemname.naming.fragments import label_fragments
+from chemname.naming.substituents import get_all_substituents
+from .golden.builders import build_molecule
+
+SKIP = os.getenv("CI_SKIPPERF")
+
+
+def test_fragment_records():
+    mol = build_molecule(6, substituents=[(2, "Cl"), (3, ["C", "C"]), (4, ["O", "C"]), (5, "C")])
+    mol.add_atom("C", 12)
+    mol.add_bond(7, 12)  # branch the ethyl on C3 at its root → 1‑methylethyl
+    chain = list(range(6))
+    frags = {f.locant: f for f in label_fragments(mol.freeze(), chain)}
+    assert sorted(frags) == [2, 3, 4, 5]
+    assert frags[2].elements == {"Cl": 1} and frags[2].size == 1
+    assert frags[3].is_hydrocarbon and frags[3].size == 3 and frags[3].branch_points == 1
+    assert frags[3].parents == [-1, 0, 0]
+    assert frags[4].elements == {"O": 1, "C": 1} and not frags[4].is_hydrocarbon
+    assert frags[5].attachment == 4 and frags[5].root == 11
+
+    subs = get_all_substituents(chain, mol)
+    assert subs == {"chloro": [2], "1-methylethyl": [3], "methyl": [5]}
+
+
+def _comb(n):
+    """n‑carbon backbone with a halogen and a methyl on every carbon."""
+    mol = build_molecule(n)
+    idx = n
+    for c in range(n):
+        for sym in ("Br", "C"):
+            mol.add_atom(sym, idx)
+            mol.add_bond(c, idx)
+            idx += 1
+    return mol.freeze(), list(range(n))
+
+
+@pytest.mark.skipif(SKIP, reason="Perf test skipped by env var")
+def test_thousands_of_substituents_scale_linearly():
+    timings = {}
+    for n in (1_000, 8_000):
+        g, chain = _comb(n)
+        t0 = time.perf_counter()
+        frags = label_fragments(g, chain)
+        timings[n] = time.perf_counter() - t0
+        assert len(frags) == 2 * n
+    assert timings[8_000] / timings[1_000] < 24  # 8× input, linear with noise headroom
@@ -0,0 +1,54 @@
+"""Unit tests for the CSR FrozenMolecule snapshot."""
+import pickle
+
+import pytest
+
+from chemname import FrozenMolecule, Molecule
+from chemname.naming.chain_finder import find_chain
+from chemname.naming.namer import name
+from .golden.builders import build_molecule
+
+
+def test_csr_layout():
+    mol = build_molecule(3, unsat="ene", unsat_locs=[1], substituents=[(2, "Cl")])
+    g = mol.freeze()
+    assert isinstance(g, FrozenMolecule)
+    assert len(g) == 4 and g.n_bonds == 3
+    assert list(g.offsets) == [0, 1, 4, 5, 6]
+    assert list(g.neighbours(1)) == [0, 2, 3]
+    assert g.symbols() == ("C", "C", "C", "Cl")
+    assert g.bond_order(0, 1) == 2 and g.bond_order(2, 1) == 1
+    assert sorted(g.edges()) == [(0, 1, 2), (1, 2, 1), (1, 3, 1)]
+
+
+def test_snapshot_is_cached_and_invalidated():
+    mol = build_molecule(2)
+    g = mol.freeze()
+    assert mol.freeze() is g
+    mol.add_atom("Br", 2)
+    assert mol.freeze() is not g
+    with pytest.raises(AttributeError):
+        g.offsets = None
+
+
+def test_non_contiguous_indices_and_unknown_symbols():
+    mol = Molecule()
+    mol.add_atom("C", 40)
+    mol.add_atom("C", 10)
+    mol.add_atom("R", 25)
+    mol.add_bond(40, 10)
+    mol.add_bond(10, 25)
+    g = mol.freeze()
+    assert list(g.indices) == [10, 25, 40]
+    assert g.position(40) == 2
+    assert g.symbol(1) == "R"
+    assert find_chain(mol) in ([10, 40], [40, 10])
+
+
+def test_naming_runs_on_frozen_and_pickles():
+    mol = build_molecule(6, unsat="ene", unsat_locs=[1, 4], substituents=[(3, "Cl"), (5, "C")])
+    g = mol.freeze()
+    assert name(g) == name(mol) == "3-chloro-5-methylhexa-1,4-diene"
+    clone = pickle.loads(pickle.dumps(g))
+    assert list(clone.targets) == list(g.targets)
+    assert name(clone) == name(g)
@@ -0,0 +1,49 @@
+"""Lazy top‑level package: what ``import chemname`` and a first name() load."""
+import os
+import subprocess
+import sys
+
+import pytest
+
+import chemname
+from chemname.benchmarks.startup import import_profile
+
+SKIP = os.getenv("CI_SKIPPERF")
+HEAVY = ("asyncio", "sqlite3", "importlib.metadata", "concurrent.futures", "multiprocessing", "json", "tracemalloc")
+
+
+def _loaded_after(code):
+    probe = f"import sys\n{code}\nprint(' '.join(sys.modules))"
+    out = subprocess.run([sys.executable, "-c", probe], check=True, capture_output=True, text=True)
+    return set(out.stdout.split())
+
+
+def test_import_loads_no_submodules():
+    loaded = _loaded_after("import chemname")
+    assert not loaded & {"chemname.core", "chemname.naming", *HEAVY}
+
+
+def test_first_name_skips_unrelated_modules():
+    loaded = _loaded_after(
+        "import chemname\n"
+        "chemname.name(chemname.Molecule.from_arrays(['C'] * 3, [(0, 1), (1, 2)], [1, 1]))"
+    )
+    assert "chemname.naming.namer" in loaded
+    assert not loaded & set(HEAVY)
+
+
+def test_lazy_attributes():
+    assert chemname.name is chemname.naming.namer.name
+    assert chemname.NameStore is chemname.naming.store.NameStore
+    assert {"Molecule", "name", "parse", "naming"} <= set(dir(chemname))
+    assert isinstance(getattr(chemname, "__pkg_version"), str)
+    with pytest.raises(AttributeError):
+        chemname.no_such_thing  # noqa: B018
+
+
+@pytest.mark.skipif(SKIP, reason="Perf test skipped by env var")
+def test_import_time_budget():
+    # cumulative µs of the ``chemname`` line in ``-X importtime``; best of three
+    best = min(import_profile()["chemname"] for _ in range(3))
+    print(f"import chemname: {best}us")
+    assert best < 25_000
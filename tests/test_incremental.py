@@ -0,0 +1,136 @@
+"""Incremental re‑naming after local edits."""
+import os
+import random
+import time
+
+import pytest
+
+import chemname
+from chemname import Molecule
+from chemname.naming.cache import DEFAULT_MAXSIZE
+from chemname.naming.namer import name
+from .golden.builders import build_molecule
+
+SKIP = os.getenv("CI_SKIPPERF")
+
+HALOGENS = ["F", "Cl", "Br", "I"]
+
+
+@pytest.fixture(autouse=True)
+def _no_cache():
+    # the cache would answer the full‑path comparisons on its own
+    chemname.set_cache_size(0)
+    yield
+    chemname.set_cache_size(DEFAULT_MAXSIZE)
+
+
+def _full(mol):
+    fresh = mol.copy()
+    fresh._perception = None
+    return name(fresh)
+
+
+def _add_halogen(mol, attach, symbol):
+    idx = max(a.index for a in mol) + 1
+    mol.add_atom(symbol, idx)
+    mol.add_bond(attach, idx)
+    return idx
+
+
+def test_version_counts_mutations():
+    mol = Molecule()
+    assert mol.version == 0
+    mol.add_atom("C", 0)
+    mol.add_atom("C", 1)
+    mol.add_bond(0, 1)
+    assert mol.version == 3
+    assert mol.copy().version == 3
+
+
+def test_local_edits_reuse_the_record():
+    mol = build_molecule(6, substituents=[(3, ["C", "C"])])
+    assert name(mol) == "3-ethylhexane"
+    record = mol._perception
+    assert record is not None and record.version == mol.version
+    _add_halogen(mol, 1, "Cl")
+    assert name(mol) == "2-chloro-3-ethylhexane"
+    assert mol._perception.chain == record.chain
+    assert len(mol._perception.fragments) == len(record.fragments) + 1
+    assert mol._journal == []
+
+
+def test_pending_atom_is_carried_over():
+    mol = build_molecule(5, unsat="ene", unsat_locs=[2])
+    name(mol)
+    mol.add_atom("Br", 9)
+    assert name(mol) == _full(mol)
+    assert mol._perception.pending == {9: "Br"}
+    mol.add_bond(3, 9)
+    assert name(mol) == _full(mol) == "4-bromopent-2-ene"
+    assert mol._perception.pending == {}
+
+
+def test_non_local_edits_fall_back():
+    mol = build_molecule(5, substituents=[(2, "Cl")])
+    name(mol)
+    record = mol._perception
+    mol.add_atom("C", 10)
+    mol.add_bond(4, 10)  # the chain grows
+    assert name(mol) == "2-chlorohexane"
+    assert mol._perception is not record and mol._perception.chain != record.chain
+
+    mol = build_molecule(5, substituents=[(3, ["C", "C"])])
+    name(mol)
+    _add_halogen(mol, 6, "F")  # on the ethyl group, not the backbone
+    assert name(mol) == _full(mol)
+
+
+def test_tied_chains_are_not_reused():
+    # 3-ethylpentane: three equally long chains, substituents decide
+    mol = build_molecule(5, substituents=[(3, ["C", "C"])])
+    name(mol)
+    _add_halogen(mol, 6, "Cl")
+    assert name(mol) == _full(mol)
+    assert mol._perception.chain_fixed is False
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_random_edits_match_full_path(seed):
+    rng = random.Random(seed)
+    length = rng.randint(4, 9)
+    branches = [(rng.randint(2, length - 1), ["C"] * rng.randint(1, 2))]
+    unsat = rng.choice([None, "ene", "yne"])
+    locs = [rng.randint(1, length - 1)] if unsat else None
+    base = build_molecule(length, unsat=unsat, unsat_locs=locs, substituents=branches)
+    name(base)
+    for _ in range(20):
+        mol = base.copy()
+        for _ in range(rng.randint(1, 3)):
+            if rng.random() < 0.2:
+                mol.add_atom(rng.choice(HALOGENS), max(a.index for a in mol) + 1)
+            else:
+                _add_halogen(mol, rng.randrange(length), rng.choice(HALOGENS))
+            assert name(mol) == _full(mol)
+        base = mol if rng.random() < 0.5 else base
+
+
+@pytest.mark.skipif(SKIP, reason="Perf test skipped by env var")
+def test_incremental_faster_than_full_path():
+    base = build_molecule(12, substituents=[(4, ["C", "C"]), (6, "C"), (8, ["C", "C", "C"])])
+    name(base)
+    sites = [i for i in range(12) if i not in (3, 5, 7)]
+
+    def loop(incremental):
+        t0 = time.perf_counter()
+        for k, site in enumerate(sites):
+            mol = base.copy()
+            if not incremental:
+                mol._perception = None
+            _add_halogen(mol, site, HALOGENS[k % 4])
+            name(mol)
+        return time.perf_counter() - t0
+
+    full = min(loop(False) for _ in range(3))
+    fast = min(loop(True) for _ in range(3))
+    print(f"full={full * 1e3:.1f}ms incremental={fast * 1e3:.1f}ms")
+    assert fast < full
@@ -0,0 +1,50 @@
+"""Opt‑in per‑stage instrumentation."""
+import json
+
+import pytest
+
+import chemname
+from chemname import instrumentation
+from chemname.naming.namer import name
+from .golden.builders import build_molecule
+
+
+@pytest.fixture(autouse=True)
+def _clean():
+    instrumentation.reset()
+    chemname.cache_clear()
+    yield
+    instrumentation.disable()
+    instrumentation.reset()
+
+
+def test_disabled_records_nothing():
+    name(build_molecule(5, substituents=[(2, "Cl")]))
+    assert chemname.stats() == {}
+
+
+def test_stage_counters_and_graph_sizes():
+    instrumentation.enable()
+    mol = build_molecule(6, substituents=[(2, "Br"), (3, ["C", "C"])])
+    name(mol)
+    name(mol)  # second call is a cache hit: no pipeline stages
+    stats = chemname.stats()
+    assert stats["name"]["calls"] == 2
+    assert stats["name"]["atoms_max"] == 9 and stats["name"]["bonds"] == 16
+    assert stats["name;find_chain"]["calls"] == 1
+    for path in ("name;canonical_key", "name;substituents;alkyl", "name;orientation", "name;assemble"):
+        assert stats[path]["calls"] >= 1
+        assert stats[path]["max_s"] <= stats[path]["total_s"] <= stats["name"]["total_s"]
+    instrumentation.reset()
+    assert chemname.stats() == {}
+
+
+def test_exports(tmp_path):
+    instrumentation.enable(allocations=True)
+    name(build_molecule(4, unsat="ene", unsat_locs=[1]))
+    doc = json.loads(instrumentation.to_json(str(tmp_path / "s.json")))
+    assert "alloc_bytes" in doc["stages"]["name"]
+    collapsed = instrumentation.to_collapsed(str(tmp_path / "s.folded"))
+    paths = dict(line.rsplit(" ", 1) for line in collapsed.splitlines())
+    assert "name;find_chain" in paths and all(v.isdigit() for v in paths.values())
+    assert (tmp_path / "s.folded").read_text() == collapsed
@@ -1,4 +1,6 @@
 """Behaviour tests (non‑golden) for v0.2."""
+import pytest
+
 from chemname.core.structures import Molecule
 from chemname.naming.namer import name
 
@@ -53,3 +55,28 @@ def test_multiplicative_prefix():
 def test_substituent_alphabetical():
     mol = _build_linear(3, subs=[(1, "Br"), (2, "Cl")])
     assert name(mol) == "1-bromo-2-chloropropane"
+
+
+def _with_group(n, loc, group):
+    """Linear chain of ``n`` carbons with the path ``group`` hanging off ``loc``."""
+    m = _build_linear(n)
+    prev = loc - 1
+    for k, elem in enumerate(group, n):
+        m.add_atom(elem, k)
+        m.add_bond(prev, k)
+        prev = k
+    return m
+
+
+@pytest.mark.parametrize(
+    "mol, makeup",
+    [
+        (_with_group(5, 3, ["C", "Cl"]), "CCl"),  # 3-(chloromethyl)pentane
+        (_with_group(5, 2, ["O", "C"]), "CO"),  # methoxy
+        (_with_group(7, 4, ["C", "Cl", "I"]), "CClI"),
+        (_build_linear(4, subs=[(2, "O")]), "O"),
+    ],
+)
+def test_unnameable_substituent_raises(mol, makeup):
+    with pytest.raises(ValueError, match=f"Substituents containing {makeup} not yet supported"):
+        name(mol)
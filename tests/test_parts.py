@@ -0,0 +1,76 @@
+"""name_parts(): structured names and their lazily rendered string."""
+import os
+import time
+
+import pytest
+
+from chemname import Molecule, name_parts
+from chemname.naming import parts
+from chemname.naming.namer import name
+from .golden.test_golden_v02 import CASES as V02
+from .golden.test_golden_v03 import CASES as V03
+
+SKIP = os.getenv("CI_SKIPPERF")
+
+
+@pytest.mark.parametrize("expected, mol", V02 + V03)
+def test_rendered_name_matches_golden(expected, mol):
+    assert name_parts(mol).name == expected == name(mol)
+
+
+def test_chain_parts():
+    # 2‑chloro‑4‑methylpent‑2‑ene drawn from the other end with scattered indices
+    mol = Molecule.from_arrays(
+        ["C", "C", "C", "C", "C", "C", "Cl"],
+        [(10, 11), (11, 12), (12, 13), (13, 14), (11, 15), (13, 16)],
+        [1, 1, 2, 1, 1, 1],
+        indices=[10, 11, 12, 13, 14, 15, 16],
+    )
+    p = name_parts(mol)
+    assert p.chain[:4] == (14, 13, 12, 11) and p.chain[4] in (10, 15)  # C10 and C15 are alike
+    assert p.length == 5 and not p.cyclic
+    assert p.unsat_type == "ene" and p.unsat_locants == (2,)
+    assert p.substituents == (("chloro", (2,)), ("methyl", (4,)))
+    assert str(p) == name(mol) == "2-chloro-4-methylpent-2-ene"
+
+
+def test_ring_parts():
+    mol = Molecule.from_arrays(["C"] * 7, [(k, (k + 1) % 6) for k in range(6)] + [(3, 6)], [2] + [1] * 6)
+    p = name_parts(mol)
+    assert p.cyclic and p.length == 6 and p.unsat_locants == (1,)
+    assert p.substituents == (("methyl", (4,)),)
+    assert p.chain[3] == 3 and {p.chain[0], p.chain[1]} == {0, 1}
+    assert p.name == name(mol) == "4-methylcyclohex-1-ene"
+
+
+def test_string_is_rendered_once_and_only_on_demand(monkeypatch):
+    calls = []
+    real = parts.assemble_name
+    monkeypatch.setattr(parts, "assemble_name", lambda *a: calls.append(a) or real(*a))
+    p = name_parts(Molecule.from_arrays(["C"] * 4, [(0, 1), (1, 2), (1, 3)]))
+    assert p.substituents == (("methyl", (2,)),) and calls == []
+    assert p.name == "2-methylpropane" and p.name is p.name
+    assert len(calls) == 1
+
+
+def test_errors_match_name():
+    with pytest.raises(ValueError):
+        name_parts(Molecule.from_arrays(["O"], []))
+
+
+@pytest.mark.skipif(SKIP, reason="Perf test skipped by env var")
+def test_rendering_is_deferred_and_cached():
+    mols = [mol for _, mol in V03] * 20
+    t0 = time.perf_counter()
+    results = [name_parts(mol) for mol in mols]
+    structure = time.perf_counter() - t0
+    t0 = time.perf_counter()
+    for p in results:
+        p.name
+    first = time.perf_counter() - t0
+    t0 = time.perf_counter()
+    for p in results:
+        p.name
+    cached = time.perf_counter() - t0
+    print(f"structure={structure * 1e3:.1f}ms render={first * 1e3:.2f}ms cached={cached * 1e3:.2f}ms")
+    assert cached < first / 3
@@ -0,0 +1,41 @@
+"""Scaling benchmark: name_many should speed up near‑linearly with cores."""
+import os
+import random
+import time
+
+import pytest
+
+from chemname import name_many
+from .golden.builders import build_molecule
+
+SKIP = os.getenv("CI_SKIPPERF")
+CORES = min(os.cpu_count() or 1, 4)
+
+
+def _molecules(count):
+    random.seed(7)
+    out = []
+    for _ in range(count):
+        n = random.randint(1, 12)
+        subs = [(random.randint(1, n), random.choice(["F", "Cl", "Br", "I"])) for _ in range(random.randint(0, 3))]
+        out.append(build_molecule(n, substituents=subs))
+    return out
+
+
+def _timed(mols, workers):
+    t0 = time.perf_counter()
+    for _ in name_many(mols, workers=workers, chunksize=500):
+        pass
+    return time.perf_counter() - t0
+
+
+@pytest.mark.skipif(SKIP, reason="Perf test skipped by env var")
+@pytest.mark.skipif(CORES < 2, reason="needs at least two cores")
+def test_scaling_near_linear():
+    mols = _molecules(40_000)
+    serial = _timed(mols, 1)
+    timings = {w: _timed(mols, w) for w in range(2, CORES + 1)}
+    for workers, duration in timings.items():
+        speedup = serial / duration
+        print(f"workers={workers} speedup={speedup:.2f}")
+        assert speedup >= 0.5 * workers
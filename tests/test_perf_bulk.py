@@ -0,0 +1,45 @@
+"""Benchmark: bulk construction vs one add_atom/add_bond call per item."""
+import os
+import time
+
+import pytest
+
+from chemname import Molecule
+
+SKIP = os.getenv("CI_SKIPPERF")
+
+
+def _incremental(symbols, edges):
+    mol = Molecule()
+    for i, sym in enumerate(symbols):
+        mol.add_atom(sym, i)
+    for i, j in edges:
+        mol.add_bond(i, j)
+    return mol
+
+
+def _best(build, repeats=3):
+    times = []
+    for _ in range(repeats):
+        t0 = time.perf_counter()
+        mol = build()
+        times.append(time.perf_counter() - t0)
+        del mol
+    return min(times)
+
+
+@pytest.mark.skipif(SKIP, reason="Perf test skipped by env var")
+def test_from_arrays_faster_than_incremental():
+    n = 50_000
+    symbols = ["C"] * n
+    edges = [(i, i + 1) for i in range(n - 1)]
+
+    slow = _incremental(symbols, edges)
+    fast = Molecule.from_arrays(symbols, edges)
+    incremental = _best(lambda: _incremental(symbols, edges))
+    bulk = _best(lambda: Molecule.from_arrays(symbols, edges))
+    trusted = _best(lambda: Molecule.from_arrays(symbols, edges, trusted=True))
+
+    print(f"incremental={incremental * 1e3:.1f}ms bulk={bulk * 1e3:.1f}ms trusted={trusted * 1e3:.1f}ms")
+    assert fast.canonical_key() == slow.canonical_key()
+    assert bulk < incremental
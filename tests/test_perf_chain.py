@@ -0,0 +1,37 @@
+"""Benchmark: longest‑chain selection is linear on highly branched trees."""
+import os
+import time
+
+import pytest
+
+from chemname.naming.chain_finder import longest_chains
+from .test_chain_finder import random_tree
+
+SKIP = os.getenv("CI_SKIPPERF")
+
+
+def _first_chain_time(mol):
+    g = mol.freeze()
+    t0 = time.perf_counter()
+    chain = next(longest_chains(g))
+    return time.perf_counter() - t0, chain
+
+
+@pytest.mark.skipif(SKIP, reason="Perf test skipped by env var")
+def test_diameter_scales_linearly():
+    timings = {}
+    for n in (1_000, 10_000, 100_000):
+        timings[n], chain = _first_chain_time(random_tree(n, n))
+        print(f"n={n} chain={len(chain)} t={timings[n] * 1e3:.1f} ms")
+    # 100× more carbons must cost well under 100²×: allow generous noise
+    assert timings[100_000] / timings[1_000] < 400
+    assert timings[100_000] < 2.0
+
+
+@pytest.mark.skipif(SKIP, reason="Perf test skipped by env var")
+def test_enumerates_many_candidates_quickly():
+    mol = random_tree(10_000, 11, max_degree=3)
+    t0 = time.perf_counter()
+    count = sum(1 for _ in longest_chains(mol))
+    assert count >= 1
+    assert time.perf_counter() - t0 < 2.0
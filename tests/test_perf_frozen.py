@@ -0,0 +1,70 @@
+"""Benchmark: per‑molecule time and memory of the CSR snapshot vs the dict form."""
+import os
+import random
+import time
+import tracemalloc
+
+import pytest
+
+from chemname.naming import set_cache_size
+from chemname.naming.cache import DEFAULT_MAXSIZE
+from chemname.naming.namer import name
+from .golden.builders import build_molecule
+
+SKIP = os.getenv("CI_SKIPPERF")
+
+
+def _molecules(count):
+    random.seed(3)
+    out = []
+    for _ in range(count):
+        n = random.randint(4, 9)
+        subs = [(random.randint(2, n - 1), random.choice(["C", "Cl", ["C", "C"]])) for _ in range(3)]
+        out.append(build_molecule(n, substituents=subs))
+    return out
+
+
+def _footprint(factory):
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    objs = factory()
+    size = tracemalloc.get_traced_memory()[0] - before
+    tracemalloc.stop()
+    return size / len(objs), objs
+
+
+def _walk(mol, n_atoms):
+    # neighbour scan as done by the substituent code
+    return sum(len(mol.neighbours(i)) for i in range(n_atoms))
+
+
+@pytest.mark.skipif(SKIP, reason="Perf test skipped by env var")
+def test_frozen_time_and_memory():
+    dict_bytes, mols = _footprint(lambda: _molecules(2000))
+    frozen_bytes, frozen = _footprint(lambda: [m.freeze() for m in mols])
+
+    t0 = time.perf_counter()
+    for m in mols:
+        _walk(m, len(m))
+    dict_walk = time.perf_counter() - t0
+    t0 = time.perf_counter()
+    for g in frozen:
+        _walk(g, len(g))
+    frozen_walk = time.perf_counter() - t0
+
+    set_cache_size(0)
+    try:
+        t0 = time.perf_counter()
+        for g in frozen:
+            name(g)
+        frozen_name = time.perf_counter() - t0
+    finally:
+        set_cache_size(DEFAULT_MAXSIZE)
+
+    n = len(mols)
+    print(
+        f"bytes/mol dict={dict_bytes:.0f} frozen={frozen_bytes:.0f}; "
+        f"µs/mol neighbour walk dict={dict_walk / n * 1e6:.1f} frozen={frozen_walk / n * 1e6:.1f}; "
+        f"name(frozen)={frozen_name / n * 1e6:.1f}"
+    )
+    assert frozen_bytes < dict_bytes
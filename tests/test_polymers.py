@@ -0,0 +1,131 @@
+"""Long chains: generated numerical terms, linear scaling, no recursion."""
+import gc
+import math
+import os
+import sys
+import time
+
+import pytest
+
+from chemname import Molecule, name_parts, parse
+from chemname.naming.namer import name
+from chemname.util import MULTIPLIER_PREFIXES, ROOT_NAMES, YL_NAMES, numerical_term
+
+SKIP = os.getenv("CI_SKIPPERF")
+
+
+def _polymer(n, side=None, every=2):
+    """``n`` chain carbons with ``side`` ("C", "Cl" or "iBu") on every ``every``‑th."""
+    symbols = ["C"] * n
+    edges = [(k, k + 1) for k in range(n - 1)]
+    for k in range(every, n - every, every) if side else ():
+        if side == "iBu":
+            a = len(symbols)
+            symbols += ["C"] * 3
+            edges += [(k, a), (a, a + 1), (a, a + 2)]
+        else:
+            symbols.append(side)
+            edges.append((k, len(symbols) - 1))
+    return Molecule.from_arrays(symbols, edges, trusted=True)
+
+
+@pytest.mark.parametrize(
+    "n, term",
+    [(11, "undeca"), (13, "trideca"), (20, "icosa"), (21, "henicosa"), (22, "docosa"), (23, "tricosa"),
+     (30, "triaconta"), (100, "hecta"), (101, "henhecta"), (111, "undecahecta"), (120, "icosahecta"),
+     (1000, "kilia"), (2022, "docosadilia"), (9999, "nonanonacontanonactanonalia")],
+)
+def test_numerical_terms(n, term):
+    assert numerical_term(n) == term
+    assert ROOT_NAMES[n] == term[:-1] and YL_NAMES[n] == term[:-1] + "yl"
+
+
+def test_tables_are_lazy_and_bounded():
+    assert ROOT_NAMES[4] == "but" and MULTIPLIER_PREFIXES[2] == "di"
+    assert 9999 in ROOT_NAMES and 10000 not in ROOT_NAMES and ROOT_NAMES.get(0) is None
+    with pytest.raises(KeyError):
+        ROOT_NAMES[10000]
+    for bad in (0, 10000):
+        with pytest.raises(ValueError):
+            numerical_term(bad)
+
+
+@pytest.mark.parametrize(
+    "text",
+    ["tridecane", "henicosane", "hectane", "trideca-1,3-diene", "14-tridecylheptacosane",
+     "2,3,4,5,6-pentachlorotridecane", "15-(1-methyldodecyl)nonacosane"],
+)
+def test_round_trip(text):
+    assert name(parse(text)) == text
+
+
+def test_polymer_names():
+    assert name(_polymer(13)) == "tridecane"
+    assert name(_polymer(100)) == "hectane"
+    assert name(_polymer(41, "Cl", every=20)) == "21-chlorohentetracontane"
+    assert name(parse(name(_polymer(301, "Cl")))) == name(_polymer(301, "Cl"))
+
+
+def test_parents_beyond_the_numerical_terms():
+    mol = _polymer(10_001)
+    with pytest.raises(ValueError, match="9999"):
+        name(mol)
+    p = name_parts(mol)
+    assert p.length == 10_001 and p.substituents == ()
+
+
+def test_no_recursion_on_long_chains():
+    mol = _polymer(20_000, "iBu", every=4)
+    depth = 0
+    frame = sys._getframe()
+    while frame is not None:
+        depth, frame = depth + 1, frame.f_back
+    limit = sys.getrecursionlimit()
+    sys.setrecursionlimit(depth + 60)
+    try:
+        p = name_parts(mol)
+    finally:
+        sys.setrecursionlimit(limit)
+    assert p.length == 20_000 and len(p.substituents) == 1
+
+
+def _slope(fn, sizes):
+    """Least‑squares slope of log(time) against log(n): about 1 when linear."""
+    points = []
+    for n in sizes:
+        arg = fn.prepare(n)
+        best = math.inf
+        gc.disable()
+        try:
+            for _ in range(5):
+                t0 = time.perf_counter()
+                fn(arg)
+                best = min(best, time.perf_counter() - t0)
+        finally:
+            gc.enable()
+        points.append((math.log(n), math.log(best)))
+    mx = sum(x for x, _ in points) / len(points)
+    my = sum(y for _, y in points) / len(points)
+    return sum((x - mx) * (y - my) for x, y in points) / sum((x - mx) ** 2 for x, _ in points)
+
+
+def _case(fn, prepare):
+    fn.prepare = prepare
+    return fn
+
+
+@pytest.mark.skipif(SKIP, reason="Perf test skipped by env var")
+@pytest.mark.parametrize(
+    "label, fn",
+    [
+        ("name", _case(lambda m: name(m), lambda n: _polymer(n))),
+        ("name pvc", _case(lambda m: name(m), lambda n: _polymer(n, "Cl"))),
+        ("name comb", _case(lambda m: name(m), lambda n: _polymer(n, "iBu", every=4))),
+        ("parse pvc", _case(lambda t: parse(t), lambda n: name(_polymer(n, "Cl")))),
+        ("name_parts", _case(lambda m: name_parts(m), lambda n: _polymer(n * 8, "C"))),
+    ],
+)
+def test_scaling_is_linear(label, fn):
+    slope = _slope(fn, [1000, 2000, 4000, 8000])
+    print(f"{label}: slope={slope:.2f}")
+    assert slope < 1.4  # quadratic work shows up as ~2
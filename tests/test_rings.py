@@ -0,0 +1,152 @@
+"""Ring perception and monocyclic ring names."""
+import os
+import time
+
+import pytest
+
+from chemname import Molecule
+from chemname.core.exceptions import NameParseError
+from chemname.core.rings import ring_info
+from chemname.naming.namer import name
+from chemname.naming.parser import parse
+from .golden.builders import build_molecule
+
+SKIP = os.getenv("CI_SKIPPERF")
+
+
+def _ring(size, **kwargs):
+    """``build_molecule`` with the chain closed from its last carbon to its first."""
+    m = build_molecule(size, **kwargs)
+    m.add_bond(0, size - 1)
+    return m
+
+
+def _carbons(n, edges):
+    return Molecule.from_arrays(["C"] * n, edges, [1] * len(edges))
+
+
+def test_acyclic_and_monocyclic():
+    chain = build_molecule(6, substituents=[(3, ["C", "C"])])
+    assert ring_info(chain).is_acyclic and not chain.ring_info().ring_atoms
+    ring = _ring(6, substituents=[(2, "C")])
+    info = ring.ring_info()
+    assert info.rings == ((0, 1, 2, 3, 4, 5),)
+    assert info.ring_atoms == frozenset(range(6))
+    # two unconnected chains, a triangle with a tail
+    assert _carbons(4, [(0, 1), (2, 3)]).ring_info().is_acyclic
+    assert _carbons(5, [(0, 1), (1, 2), (2, 0), (3, 4)]).ring_info().rings == ((0, 1, 2),)
+
+
+def test_smallest_rings_of_fused_bridged_and_spiro_systems():
+    decalin = _carbons(10, [(0, 1), (1, 2), (2, 3), (3, 4), (4, 5), (5, 0), (4, 6), (6, 7), (7, 8), (8, 9), (9, 5)])
+    info = decalin.ring_info()
+    assert [len(r) for r in info.rings] == [6, 6] and len(info.systems) == 1
+    norbornane = _carbons(7, [(0, 1), (1, 2), (2, 3), (3, 4), (4, 0), (0, 5), (5, 6), (6, 3)])
+    assert [len(r) for r in norbornane.ring_info().rings] == [5, 5]
+    cube = [(0, 1), (1, 2), (2, 3), (3, 0), (4, 5), (5, 6), (6, 7), (7, 4), (0, 4), (1, 5), (2, 6), (3, 7)]
+    assert [len(r) for r in _carbons(8, cube).ring_info().rings] == [4] * 5
+    spiro = _carbons(6, [(0, 1), (1, 2), (2, 0), (0, 3), (3, 4), (4, 0), (4, 5)]).ring_info()
+    assert spiro.rings == ((0, 1, 2), (0, 3, 4))
+    assert spiro.systems == (frozenset({0, 1, 2}), frozenset({0, 3, 4}))
+
+
+def test_perceived_once_per_snapshot():
+    m = build_molecule(5)
+    g = m.freeze()
+    assert ring_info(m) is ring_info(g) is g.ring_info()
+    m.add_bond(0, 4)
+    assert m.ring_info().rings == ((0, 1, 2, 3, 4),)
+    assert m.ring_info() is m.ring_info()
+
+
+@pytest.mark.parametrize(
+    "mol, expected",
+    [
+        (_ring(3), "cyclopropane"),
+        (_ring(6, substituents=[(4, "C")]), "methylcyclohexane"),
+        (_ring(6, substituents=[(1, "C"), (4, "C")]), "1,4-dimethylcyclohexane"),
+        (_ring(6, substituents=[(2, "C"), (3, "Cl")]), "1-chloro-2-methylcyclohexane"),
+        (_ring(5, substituents=[(1, "C"), (1, "C"), (3, "Br")]), "3-bromo-1,1-dimethylcyclopentane"),
+        (_ring(6, substituents=[(2, ["C", "C"]), (3, "C")]), "1-ethyl-2-methylcyclohexane"),
+        (_ring(6, unsat="ene", unsat_locs=[3]), "cyclohexene"),
+        (_ring(6, unsat="ene", unsat_locs=[3], substituents=[(1, "C")]), "4-methylcyclohex-1-ene"),
+        (_ring(6, unsat="ene", unsat_locs=[3], substituents=[(4, "C")]), "1-methylcyclohex-1-ene"),
+        (_ring(6, unsat="ene", unsat_locs=[2, 4]), "cyclohexa-1,3-diene"),
+        (_ring(8, unsat="yne", unsat_locs=[5]), "cyclooctyne"),
+    ],
+)
+def test_ring_names(mol, expected):
+    assert name(mol) == expected
+
+
+@pytest.mark.parametrize(
+    "text",
+    [
+        "cyclopropane",
+        "methylcyclohexane",
+        "chlorocyclohexane",
+        "1,4-dimethylcyclohexane",
+        "1-chloro-2-methylcyclohexane",
+        "3-bromo-1,1-dimethylcyclopentane",
+        "(1-methylethyl)cyclohexane",
+        "1,3-bis(1-methylethyl)cyclohexane",
+        "cyclohexene",
+        "4-methylcyclohex-1-ene",
+        "1-methylcyclohex-1-ene",
+        "cyclohexa-1,3-diene",
+        "cyclooctyne",
+        "cyclododecane",
+    ],
+)
+def test_ring_names_round_trip(text):
+    mol = parse(text)
+    assert mol.ring_info().rings and name(mol) == text
+
+
+def test_ring_parse_errors():
+    for bad in ("cycloethane", "methylcyclohex-1-ene", "cyclohex-7-ene", "7-methylcyclohexane", "cyclohexyl"):
+        with pytest.raises(NameParseError):
+            parse(bad)
+
+
+def test_unsupported_rings():
+    fused = _carbons(10, [(0, 1), (1, 2), (2, 3), (3, 4), (4, 5), (5, 0), (4, 6), (6, 7), (7, 8), (8, 9), (9, 5)])
+    exocyclic = _ring(4)
+    exocyclic.add_atom("C", 9)
+    exocyclic.add_bond(0, 9, 2)
+    hetero = Molecule.from_arrays(["C", "C", "O"], [(0, 1), (1, 2), (2, 0)], [1, 1, 1])
+    disconnected = _ring(8, unsat="ene", unsat_locs=[1])
+    disconnected.add_atom("C", 8)  # a second component: still a single ring
+    mixed = Molecule.from_arrays(["C"] * 8, [(i, (i + 1) % 8) for i in range(8)], [2, 1, 1, 3, 1, 1, 1, 1])
+    for bad in (fused, exocyclic, hetero, disconnected, mixed):
+        with pytest.raises(ValueError):
+            name(bad)
+
+
+def test_closing_a_ring_drops_the_incremental_record():
+    m = build_molecule(6)
+    assert name(m) == "hexane"
+    m.add_bond(0, 5)
+    assert name(m) == "cyclohexane"
+    assert m._perception is None
+    m.add_atom("Cl", 6)
+    m.add_bond(2, 6)
+    assert name(m) == "chlorocyclohexane"
+
+
+@pytest.mark.skipif(SKIP, reason="Perf test skipped by env var")
+def test_acyclic_fast_path_is_cheap():
+    mols = [build_molecule(n % 10 + 3, substituents=[(2, "C"), (3, "Cl")]) for n in range(2000)]
+    frozen = [m.freeze() for m in mols]
+
+    t0 = time.perf_counter()
+    for g in frozen:
+        ring_info(g)
+    perceive = time.perf_counter() - t0
+    fresh = [m.freeze().__reduce__() for m in mols]  # uncached copies
+    t0 = time.perf_counter()
+    for restore, state in fresh:
+        name(restore(*state))
+    naming = time.perf_counter() - t0
+    print(f"rings={perceive * 1e3:.1f}ms name={naming * 1e3:.1f}ms")
+    assert perceive < naming / 5
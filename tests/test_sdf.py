@@ -0,0 +1,243 @@
+"""Streaming SDF reader: V2000/V3000 tables, data items, bad records, byte ranges."""
+import io
+import os
+import random
+import tracemalloc
+from concurrent.futures import ProcessPoolExecutor
+
+import pytest
+
+from chemname import Molecule
+from chemname.benchmarks.generator import BASE, make_molecule
+from chemname.benchmarks.sdf import _name_range, molblock, run
+from chemname.core.exceptions import SdfError
+from chemname.formats import read_sdf, sdf_ranges
+from chemname.naming import name_many
+from chemname.naming.namer import name
+
+SKIP = os.getenv("CI_SKIPPERF")
+
+V2000 = """\
+2-chloropropane
+  test
+
+  4  3  0  0  0  0  0  0  0  0999 V2000
+    0.0000    0.0000    0.0000 C   0  0  0  0  0  0  0  0  0  0  0  0
+    1.0000    0.0000    0.0000 C   0  0  0  0  0  0  0  0  0  0  0  0
+    2.0000    0.0000    0.0000 C   0  0  0  0  0  0  0  0  0  0  0  0
+    1.0000    1.0000    0.0000 Cl  0  0  0  0  0  0  0  0  0  0  0  0
+  1  2  1  0  0  0  0
+  2  3  1  0  0  0  0
+  2  4  1  0  0  0  0
+M  END
+> <ID>
+CMP-1
+
+>  <NOTE>  (MD-7)
+line one
+line two
+
+$$$$
+"""
+
+V3000 = """\
+labelled butene
+  test
+
+  0  0  0     0  0            999 V3000
+M  V30 BEGIN CTAB
+M  V30 COUNTS 5 4 0 0 0
+M  V30 BEGIN ATOM
+M  V30 10 C 0 0 0 0
+M  V30 20 C 0 0 0 0
+M  V30 30 C 0 0 0 0 -
+M  V30 MASS=13
+M  V30 40 C 0 0 0 0
+M  V30 50 N 0 0 0 0 CHG=1
+M  V30 END ATOM
+M  V30 BEGIN BOND
+M  V30 1 2 10 20
+M  V30 2 1 20 30
+M  V30 3 1 30 40
+M  V30 4 1 40 50
+M  V30 END BOND
+M  V30 BEGIN SGROUP
+M  V30 1 SUP 0 ATOMS=(2 10 20)
+M  V30 END SGROUP
+M  V30 END CTAB
+M  END
+$$$$
+"""
+
+
+def _read(text):
+    return list(read_sdf(io.BytesIO(text.encode())))
+
+
+def _file(tmp_path, count=300, seed=3):
+    rng = random.Random(seed)
+    mols = [make_molecule(rng, **BASE) for _ in range(count)]
+    path = tmp_path / "many.sdf"
+    path.write_text("".join(molblock(m, f"mol{k}", {"ID": str(k)}) for k, m in enumerate(mols)))
+    return path, mols
+
+
+def test_v2000_record(tmp_path):
+    path = tmp_path / "one.sdf"
+    path.write_text(V2000)
+    (record,) = read_sdf(path)
+    assert record.title == "2-chloropropane" and record.offset == 0
+    assert record.properties == {"ID": "CMP-1", "NOTE": "line one\nline two"}
+    assert record.symbols == ["C", "C", "C", "Cl"] and record.edges == [(0, 1), (1, 2), (1, 3)]
+    assert name(record) == name(record.to_molecule()) == "2-chloropropane"
+
+
+def test_v3000_record():
+    (record,) = _read(V3000)
+    assert record.error is None
+    assert record.symbols == ["C", "C", "C", "C", "N"] and record.orders == [2, 1, 1, 1]
+    assert record.isotopes == [0, 0, 13, 0, 0] and record.charges == [0, 0, 0, 0, 1]
+    mol = record.to_molecule()
+    assert mol._atoms[2].isotope == 13 and mol._atoms[4].charge == 1
+    g = record.freeze()
+    assert list(g.edges()) == list(mol.freeze().edges()) and list(g.isotopes) == [0, 0, 13, 0, 0]
+
+
+def test_charges_and_isotopes_v2000():
+    lines = V2000.splitlines()
+    lines[4] = lines[4][:36] + "  3" + lines[4][39:]  # atom-block +1 on C1
+    assert _read("\n".join(lines) + "\n")[0].charges == [1, 0, 0, 0]
+    lines.insert(11, "M  CHG  1   4  -1")
+    lines.insert(12, "M  ISO  2   1  13   4  37")
+    (record,) = _read("\n".join(lines) + "\n")
+    assert record.charges == [0, 0, 0, -1]  # M  CHG replaces every atom-block charge
+    assert record.isotopes == [13, 0, 0, 37]
+
+
+def test_molfile_without_terminator_and_crlf():
+    molfile = V2000.split("$$$$")[0].replace("\n", "\r\n")
+    (record,) = _read(molfile)
+    assert record.title == "2-chloropropane" and record.properties["ID"] == "CMP-1"
+    assert name(record) == "2-chloropropane"
+    assert _read("") == [] and _read("\n\n") == []
+
+
+@pytest.mark.parametrize(
+    "broken, message",
+    [
+        (lambda t: t.replace("  2  4  1", "  2  4  9"), "bond type 9"),
+        (lambda t: t.replace("  2  4  1", "  2  7  1"), "missing atom"),
+        (lambda t: t.replace("  4  3  0", "  4  9  0"), "promises"),
+        (lambda t: t.replace("M  END\n", ""), "M  END"),
+        (lambda t: t.replace("Cl  0", "Cl  1"), "M  ISO"),
+        (lambda t: t.replace("  2  4  1", "  1  2  1"), "twice"),
+    ],
+)
+def test_bad_record_is_reported_and_stream_goes_on(broken, message):
+    text = broken(V2000)
+    records = _read(text + V2000)
+    assert len(records) == 2 and records[1].error is None
+    bad = records[0]
+    assert bad.title == "2-chloropropane"
+    assert bad.properties == ({"ID": "CMP-1", "NOTE": "line one\nline two"} if "M  END" in text else {})
+    with pytest.raises(SdfError, match=message):
+        bad.freeze()
+    results = list(name_many(records, workers=1))
+    assert not results[0].ok and isinstance(results[0].error, SdfError)
+    assert results[1].name == "2-chloropropane"
+
+
+def test_graph_errors_carry_the_record_offset():
+    good, bad = _read(V2000 + V2000.replace("  2  4  1", "  2  2  1"))  # bad: a self-bond
+    assert bad.error is None and bad.offset > 0
+    for build in (bad.freeze, bad.to_molecule):
+        with pytest.raises(SdfError, match=f"Record at byte {bad.offset}: "):
+            build()
+    assert good.to_molecule().canonical_key() == good.freeze().canonical_key()
+
+
+def test_query_atoms_are_rejected():
+    (record,) = _read(V3000.replace("50 N", "50 [N,O]"))
+    assert isinstance(record.error, SdfError) and "query" in str(record.error)
+    for symbol in ("A  ", "Q  ", "L  ", "*  "):
+        record, good = _read(V2000.replace("Cl ", symbol) + V2000)
+        assert "query" in str(record.error) and good.error is None
+    (record,) = _read(V3000.replace("50 N", "50 Q"))
+    assert "query" in str(record.error)
+
+
+@pytest.mark.parametrize(
+    "text, message",
+    [
+        (V3000.replace("CHG=1", "CHG=300"), "CHG value 300"),
+        (V3000.replace("MASS=13", "MASS=70000"), "MASS value 70000"),
+        (V3000.replace("MASS=13", "MASS=-2"), "MASS value -2"),
+        (V2000.replace("M  END", "M  CHG  1   4 200\nM  END"), "M  CHG value 200"),
+        (V2000.replace("M  END", "M  ISO  1   4 65536\nM  END"), "M  ISO value 65536"),
+    ],
+    ids=["v3000-charge", "v3000-mass", "v3000-negative-mass", "v2000-charge", "v2000-isotope"],
+)
+def test_out_of_range_charges_and_masses(text, message):
+    good, bad = _read(V2000 + text)
+    assert good.error is None
+    assert isinstance(bad.error, SdfError) and message in str(bad.error) and f"byte {bad.offset}" in str(bad.error)
+    with pytest.raises(SdfError, match=message):
+        bad.freeze()
+
+
+def test_matches_the_molecules_written(tmp_path):
+    path, mols = _file(tmp_path)
+    records = list(read_sdf(path))
+    assert [r.title for r in records] == [f"mol{k}" for k in range(len(mols))]
+    assert [r.properties for r in records] == [{"ID": str(k)} for k in range(len(mols))]
+    assert [name(r) for r in records] == [name(m) for m in mols]
+    assert isinstance(records[0].to_molecule(), Molecule)
+
+
+@pytest.mark.parametrize("parts", [1, 2, 3, 7, 1000])
+def test_ranges_split_at_record_boundaries(tmp_path, parts):
+    path, mols = _file(tmp_path)
+    ranges = sdf_ranges(path, parts)
+    assert ranges[0][0] == 0 and ranges[-1][1] == os.path.getsize(path)
+    assert all(a < b for a, b in ranges) and all(x[1] == y[0] for x, y in zip(ranges, ranges[1:]))
+    assert len(ranges) <= parts
+    pieces = [list(read_sdf(path, start, end)) for start, end in ranges]
+    assert [r.title for piece in pieces for r in piece] == [f"mol{k}" for k in range(len(mols))]
+    assert all(start <= piece[0].offset < end for (start, end), piece in zip(ranges, pieces))
+
+
+def test_ranges_read_in_parallel(tmp_path):
+    path, mols = _file(tmp_path, count=200)
+    ranges = sdf_ranges(path, 2)
+    with ProcessPoolExecutor(2) as pool:
+        parts = list(pool.map(_name_range, [str(path)] * len(ranges), *zip(*ranges)))
+    assert [pair for part in parts for pair in part] == [(f"mol{k}", name(m)) for k, m in enumerate(mols)]
+    with pytest.raises(ValueError):
+        sdf_ranges(path, 0)
+
+
+@pytest.mark.skipif(SKIP, reason="Perf test skipped by env var")
+def test_memory_stays_flat_while_streaming(tmp_path):
+    path, _ = _file(tmp_path, count=3000)
+
+    def peak(limit):
+        tracemalloc.start()
+        try:
+            for k, record in enumerate(read_sdf(path)):
+                record.freeze()
+                if k == limit:
+                    break
+            return tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+
+    few, all_ = peak(100), peak(3000)
+    print(f"peak after 100 records={few} bytes, after 3000={all_} bytes")
+    assert all_ < 2 * few
+
+
+@pytest.mark.skipif(SKIP, reason="Perf test skipped by env var")
+def test_benchmark_runs():
+    doc = run(count=500, workers=2)
+    print(doc)
+    assert doc["records"] == 500 and doc["frozen_per_s"] > 0
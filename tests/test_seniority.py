@@ -0,0 +1,150 @@
+"""Lazy rule cascade for chain selection and numbering."""
+import os
+import random
+import time
+
+import pytest
+
+from chemname import Molecule
+from chemname.benchmarks.branched import symmetric_dendrimer
+from chemname.naming import seniority
+from chemname.naming.chain_finder import longest_chains
+from chemname.naming.namer import _name_checked, name
+from chemname.naming.seniority import (
+    NUMBERING_RULES,
+    Numbering,
+    Parent,
+    keeps_direction,
+    select,
+    senior_chains,
+    senior_longest_chains,
+)
+from .golden.builders import build_molecule
+
+SKIP = os.getenv("CI_SKIPPERF")
+
+
+def _counting(rules, calls):
+    def wrap(rule):
+        def counted(n):
+            calls.append(rule.__name__)
+            return rule(n)
+
+        counted.__name__ = rule.__name__
+        return counted
+
+    return [wrap(rule) for rule in rules]
+
+
+def test_stops_at_the_first_separating_rule():
+    calls = []
+    rules = _counting(NUMBERING_RULES, calls)
+    parent = Parent(None, range(6), [1], {"chloro": [5]})
+    best = select([Numbering(parent, True), Numbering(parent, False)], rules)
+    assert [n.forward for n in best] == [True]
+    assert calls == ["multiple_bond_locants"] * 2
+
+    calls.clear()
+    parent = Parent(None, range(6), [], {"chloro": [2], "bromo": [5]})
+    assert keeps_direction(6, [], {"chloro": [2], "bromo": [5]}) is False
+    select([Numbering(parent, True), Numbering(parent, False)], rules)
+    assert calls == ["multiple_bond_locants"] * 2 + ["substituent_locants"] * 2 + ["citation_locants"] * 2
+
+
+def test_losers_are_pruned_before_later_rules():
+    seen = []
+
+    def first(n):
+        return n.parent.length
+
+    def second(n):
+        seen.append(n.parent.length)
+        return 0
+
+    parents = [Parent(None, range(k), [], {}) for k in (4, 3, 3, 5)]
+    best = select([Numbering(p, True) for p in parents], [first, second])
+    assert [n.parent.length for n in best] == [3, 3] and seen == [3, 3]
+
+
+def test_citation_order_breaks_locant_ties():
+    # {2,3,4} either way: bromo is cited first, then chloro takes the lower locant
+    assert name(build_molecule(5, substituents=[(3, "Br"), (4, "Cl"), (2, "F")])) == "3-bromo-2-chloro-4-fluoropentane"
+    assert name(build_molecule(5, substituents=[(2, "Br"), (5, "Br"), (1, "F"), (4, "F")])) == (
+        "1,4-dibromo-2,5-difluoropentane"
+    )
+
+
+def test_substituents_perceived_once_per_chain(monkeypatch):
+    calls = []
+    real = seniority.perceive_substituents
+
+    def spy(chain, g, **kw):
+        calls.append(tuple(chain))
+        return real(chain, g, **kw)
+
+    monkeypatch.setattr(seniority, "perceive_substituents", spy)
+    # three five‑carbon chains meet at C3; the one leaving C1–C2–Cl as a fragment has fewer substituents
+    mol = build_molecule(5, substituents=[(3, ["C", "C"]), (2, "Cl")])
+    g = mol.freeze()
+    chains = [[0, 1, 2, 3, 4], [0, 1, 2, 5, 6], [4, 3, 2, 5, 6]]
+    best = senior_chains(g, chains)
+    assert best == [[0, 1, 2, 3, 4], [0, 1, 2, 5, 6]]
+    assert sorted(calls) == sorted(map(tuple, chains))
+
+
+def _random_acyclic(rng):
+    symbols, edges, orders, valence = ["C"], [], [], [0]
+    for k in range(1, rng.randint(1, 30)):
+        free = [j for j in range(k) if symbols[j] == "C" and valence[j] < 4]
+        if not free:
+            break
+        j = rng.choice(free)
+        symbol = rng.choices(["C", "Cl", "F", "O"], [30, 2, 2, 1])[0]
+        order = rng.choice([2, 3]) if symbol == "C" and valence[j] < 3 and rng.random() < 0.1 else 1
+        symbols.append(symbol)
+        valence.append(order)
+        valence[j] += order
+        edges.append((j, k))
+        orders.append(order)
+    perm = list(range(len(symbols)))
+    rng.shuffle(perm)
+    shuffled = [symbols[perm.index(k)] for k in range(len(symbols))]
+    return Molecule.from_arrays(shuffled, [(perm[a], perm[b]) for a, b in edges], orders)
+
+
+def test_centre_choice_matches_comparing_every_chain():
+    rng = random.Random(18)
+    for _ in range(600):
+        g = _random_acyclic(rng).freeze()
+        chains = list(longest_chains(g))
+        bonds = [sum(g.bond_order(a, b) in (2, 3) for a, b in zip(c, c[1:])) for c in chains]
+        contenders = [c for c, k in zip(chains, bonds) if k == max(bonds)]
+        every = senior_chains(g, contenders)
+        picked, count = senior_longest_chains(g)
+        assert picked[0] == every[0] and count == len(contenders)
+        assert all(c in every for c in picked)
+        try:
+            expected = _name_checked(g, every, check=True)
+        except ValueError:  # mixed multiple bonds
+            continue
+        assert _name_checked(g, picked, check=True) == expected
+
+
+def test_symmetric_dendrimer_builds_few_chains():
+    g = symmetric_dendrimer(3).freeze()  # 4,374 tied longest chains
+    chains, count = senior_longest_chains(g)
+    assert count == 4374 and len(chains) == 1
+    assert name(g).endswith("-2,2,8,8-tetramethylnonane")
+
+
+@pytest.mark.skipif(SKIP, reason="Perf test skipped by env var")
+def test_symmetric_dendrimer_scaling():
+    times = []
+    for generation in (3, 4):
+        g = symmetric_dendrimer(generation).freeze()  # 161 and 485 atoms
+        t0 = time.perf_counter()
+        senior_longest_chains(g)
+        times.append(time.perf_counter() - t0)
+    print(f"161 atoms {times[0]:.4f}s, 485 atoms {times[1]:.4f}s")
+    # nine times the chains, three times the atoms
+    assert times[1] < 0.5 and times[1] < 6 * times[0] + 0.01
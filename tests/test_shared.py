@@ -0,0 +1,79 @@
+"""Shared‑memory naming: results, overflow, crashes and cleanup."""
+import os
+import random
+
+import pytest
+
+from chemname import Molecule, MoleculeBatch
+from chemname.benchmarks.generator import BASE, make_molecule
+from chemname.benchmarks.shared import run
+from chemname.naming import name_many, name_shared, shared
+from chemname.naming.namer import name
+
+SKIP = os.getenv("CI_SKIPPERF")
+SHM = "/dev/shm"
+
+
+def _mols(count=300):
+    rng = random.Random(5)
+    return [make_molecule(rng, **BASE) for _ in range(count)]
+
+
+def _segments():
+    return set(os.listdir(SHM)) if os.path.isdir(SHM) else set()
+
+
+def test_matches_name_many():
+    mols = _mols()
+    before = _segments()
+    results = list(name_shared(mols, workers=2, chunksize=64))
+    assert [r.index for r in results] == list(range(len(mols)))
+    assert [r.name for r in results] == [r.name for r in name_many(mols, workers=1)]
+    assert _segments() == before
+
+
+def test_long_names_and_errors_come_back_pickled():
+    batch = MoleculeBatch(_mols(20))
+    batch.append(Molecule.from_arrays(["O"], []))  # no carbon chain
+    results = list(name_shared(batch, workers=2, chunksize=8, name_bytes=4))
+    assert [r.name for r in results[:20]] == [name(v) for v in list(batch)[:20]]
+    assert not results[20].ok and isinstance(results[20].error, ValueError)
+
+
+def test_in_process_without_workers():
+    mols = _mols(10)
+    assert [r.name for r in name_shared(mols, workers=1)] == [name(m) for m in mols]
+    assert list(name_shared([], workers=2)) == []
+    with pytest.raises(ValueError):
+        name_shared(mols, chunksize=0)
+
+
+def test_worker_crash_is_reported_and_cleaned_up(monkeypatch):
+    def crash(chunk):
+        if any(k == 0 for k, _ in chunk):
+            os._exit(1)
+        return real(chunk)
+
+    real = shared._name_chunk
+    monkeypatch.setattr(shared, "_name_chunk", crash)  # inherited by forked workers
+    before = _segments()
+    # 40 chunks, far more than the 2 * workers in flight: later submits meet a broken pool
+    results = list(name_shared(_mols(400), workers=2, chunksize=10))
+    assert [r.index for r in results] == list(range(400))
+    assert not results[0].ok
+    assert _segments() == before
+
+
+def test_abandoned_iterator_cleans_up():
+    before = _segments()
+    it = name_shared(_mols(100), workers=2, chunksize=10)
+    next(it)
+    it.close()
+    assert _segments() == before
+
+
+@pytest.mark.skipif(SKIP, reason="Perf test skipped by env var")
+def test_shared_memory_beats_pickling():
+    doc = run(count=5000, workers=2)
+    print(doc)
+    assert doc["speedup"] > 1
@@ -0,0 +1,43 @@
+"""SMILES reader: acyclic subset."""
+import pytest
+
+from chemname.core.exceptions import SmilesError
+from chemname.formats.smiles import parse_smiles
+from chemname.naming.namer import name
+
+
+@pytest.mark.parametrize(
+    "smiles, expected",
+    [
+        ("C", "methane"),
+        ("CC(C)(C)CC", "2,2-dimethylbutane"),
+        ("C=CC=C", "buta-1,3-diene"),
+        ("C=CCCl", "3-chloroprop-1-ene"),
+        ("CC(Br)C(Cl)C(C)CC", "2-bromo-3-chloro-4-methylhexane"),
+        ("C#CC(C)C", "3-methylbut-1-yne"),
+        ("[CH3][CH2]I", "iodoethane"),
+        ("C/C=C/C", "but-2-ene"),
+    ],
+)
+def test_names_from_smiles(smiles, expected):
+    assert name(parse_smiles(smiles)) == expected
+
+
+def test_bracket_atoms_and_fragments():
+    mol = parse_smiles("[13CH4].[O-][N+](=O)C", strict=False)
+    atoms = list(mol)
+    assert (atoms[0].isotope, atoms[1].charge, atoms[2].charge) == (13, -1, 1)
+    assert mol.neighbours(0) == []
+    assert sorted(mol.neighbours(2)) == [1, 3, 4]
+
+
+@pytest.mark.parametrize(
+    "bad",
+    [
+        "", "C1CC1", "c1ccccc1", "C(C", "CC)", "C=", "[C", "C$C", "X",
+        "CC(=O)C", "C(C)C.CC", "CC[N+](C)(C)C", "C[CH2-]", "CC(C)(C)(C)(C)C", "C=C(C)=C", "[CH4]C", "CClC",
+    ],
+)
+def test_rejects_unsupported(bad):
+    with pytest.raises(SmilesError):
+        parse_smiles(bad)
@@ -0,0 +1,97 @@
+"""Persistent SQLite name store."""
+import io
+
+import pytest
+
+import chemname
+from chemname import NameStore, name_many, use_store
+from chemname.cli import main
+from chemname.naming.namer import RULES_VERSION, name
+from chemname.naming.store import rules_version
+from .golden.builders import build_molecule
+
+
+@pytest.fixture(autouse=True)
+def _no_store():
+    chemname.cache_clear()
+    yield
+    use_store(None)
+    chemname.cache_clear()
+
+
+def test_buffered_writes_and_lookups(tmp_path):
+    path = str(tmp_path / "n.db")
+    with NameStore(path, batch_size=3) as store:
+        store.put("a", "ethane")
+        store.put("b", "propane")
+        assert store.get("a") == "ethane"  # still buffered
+        with NameStore(path) as other:
+            assert other.get("a") is None
+            store.put("c", "butane")  # third put commits the batch
+            assert other.get("a") == "ethane"
+            assert other.get_many(["a", "c", "zz"]) == {"a": "ethane", "c": "butane"}
+        assert len(store) == 3
+    with NameStore(path, readonly=True) as ro:
+        assert ro.get("b") == "propane"
+        ro.put("d", "ignored")
+        with pytest.raises(ValueError):
+            ro.load([("d", "x")])
+
+
+def test_rules_version_invalidates(tmp_path):
+    path = str(tmp_path / "n.db")
+    with NameStore(path, rules="chemname 0.3.0") as old:  # tag of the release‑keyed stores
+        old.load([("k1", "old name"), ("k2", "other")])
+    with NameStore(path) as store:
+        assert store.rules == rules_version() == f"chemname rules {RULES_VERSION}"
+        assert store.get("k1") is None and len(store) == 0
+        store.put("k1", "new name")
+        assert store.purge() == 2
+        assert list(store.export()) == [("k1", "new name")]
+
+
+def test_name_consults_the_store(tmp_path):
+    path = str(tmp_path / "n.db")
+    mol = build_molecule(6, substituents=[(3, "C")])
+    use_store(path)
+    assert name(mol) == "3-methylhexane"
+    use_store(None)  # flushes
+
+    chemname.cache_clear()  # a restarted worker: empty LRU, same file
+    with NameStore(path) as store:
+        key = mol.canonical_key()
+        assert store.get(key) == "3-methylhexane"
+        store.load([(key, "from the store")])
+        use_store(store)
+        assert name(build_molecule(6, substituents=[(4, "C")])) == "from the store"
+
+
+def test_export_load_and_warm_cache(tmp_path):
+    src, dst = str(tmp_path / "a.db"), str(tmp_path / "b.db")
+    mols = [build_molecule(n, substituents=[(2, "Br")]) for n in range(3, 9)]
+    use_store(src)
+    expected = [name(m) for m in mols]
+    use_store(None)
+    with NameStore(src) as a, NameStore(dst) as b:
+        assert b.load(a.export()) == len(mols)
+        chemname.cache_clear()
+        assert b.warm_cache() == len(mols)
+    assert chemname.cache_info().currsize == len(mols)
+    assert [name(m) for m in mols] == expected
+    assert chemname.cache_info().hits == len(mols)
+
+
+def test_batch_workers_share_the_store(tmp_path, monkeypatch, capsys):
+    path = str(tmp_path / "n.db")
+    mols = [build_molecule(n % 10 + 2, substituents=[(2, "Cl")]) for n in range(40)]
+    results = list(name_many(mols, workers=2, chunksize=8, store=path))
+    assert all(r.ok for r in results)
+    with NameStore(path) as store:
+        assert len(store) == 10
+        assert store.get(mols[0].canonical_key()) == results[0].name
+
+    monkeypatch.setattr("sys.stdin", io.StringIO("CC(C)C\nCCCC\n"))
+    assert main(["--store", path]) == 0
+    assert capsys.readouterr().out.splitlines() == ["CC(C)C\t2-methylpropane", "CCCC\tbutane"]
+    with NameStore(path) as store:
+        assert len(store) == 12
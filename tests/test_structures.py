@@ -54,3 +54,68 @@ def test_unknown_atom_error() -> None:
     with pytest.raises(UnknownAtomError):
         mol.add_bond(0, 99)
 
+
+def _equivalent(a: Molecule, b: Molecule) -> bool:
+    return (
+        {at.index: (at.symbol, at.isotope, at.charge) for at in a}
+        == {at.index: (at.symbol, at.isotope, at.charge) for at in b}
+        and {(tuple(sorted(bd.atoms)), bd.order) for bd in a._bonds.values()}
+        == {(tuple(sorted(bd.atoms)), bd.order) for bd in b._bonds.values()}
+    )
+
+
+def test_from_arrays_matches_incremental() -> None:
+    mol = Molecule()
+    for i, sym in enumerate(["C", "C", "C", "Cl"]):
+        mol.add_atom(sym, i)
+    mol.add_bond(0, 1, 2)
+    mol.add_bond(1, 2)
+    mol.add_bond(2, 3)
+    bulk = Molecule.from_arrays(["C", "C", "C", "Cl"], [(0, 1), (1, 2), (2, 3)], [2, 1, 1])
+    assert _equivalent(bulk, mol)
+    assert sorted(bulk.neighbours(1)) == [0, 2]
+    assert bulk.canonical_key() == mol.canonical_key()
+
+
+def test_from_arrays_indices_charges_isotopes() -> None:
+    mol = Molecule.from_arrays(
+        ["C", "O"], [(10, 20)], indices=[10, 20], charges=[0, -1], isotopes=[13, None]
+    )
+    assert mol._atoms[10].isotope == 13
+    assert mol._atoms[20].charge == -1
+    assert mol.degree(10) == 1
+
+
+def test_from_arrays_takes_numpy_columns() -> None:
+    np = pytest.importorskip("numpy")
+    symbols, edges = ["C", "C", "N"], [(0, 1), (1, 2)]
+    mol = Molecule.from_arrays(symbols, edges, charges=np.array([0, 0, 1]), isotopes=np.array([13, 0, 0]))
+    plain = Molecule.from_arrays(symbols, edges, charges=[0, 0, 1], isotopes=[13, None, None])
+    assert mol._atoms[0].isotope == 13 and mol._atoms[1].isotope is None and mol._atoms[2].charge == 1
+    assert mol.canonical_key() == plain.canonical_key()
+
+
+def test_from_edge_list() -> None:
+    mol = Molecule.from_edge_list(["C", "C", "O"], [(0, 1, 2), (1, 2)])
+    assert mol._bonds[frozenset((0, 1))].order == 2
+    assert mol._bonds[frozenset((1, 2))].order == 1
+    mapped = Molecule.from_edge_list({5: "C", 7: "C"}, [(5, 7)])
+    assert mapped.neighbours(5) == [7]
+
+
+def test_bulk_errors() -> None:
+    with pytest.raises(DuplicateAtomError):
+        Molecule.from_arrays(["C", "C"], [], indices=[3, 3])
+    with pytest.raises(DuplicateBondError):
+        Molecule.from_arrays(["C", "C"], [(0, 1), (1, 0)])
+    with pytest.raises(UnknownAtomError):
+        Molecule.from_edge_list(["C"], [(0, 1)])
+    with pytest.raises(ValueError):
+        Molecule.from_arrays(["C", "C"], [(0, 1)], orders=[1, 2])
+    with pytest.raises(ValueError):
+        Molecule.from_arrays(["C"], [(0, 0)])
+
+
+def test_bulk_trusted_skips_checks() -> None:
+    mol = Molecule.from_arrays(["C", "C", "C"], [(0, 1), (1, 2)], trusted=True)
+    assert sorted(mol.neighbours(1)) == [0, 2]
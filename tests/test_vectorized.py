@@ -0,0 +1,65 @@
+"""NumPy straight‑chain engine agrees with name() (skipped without NumPy)."""
+import random
+
+import pytest
+
+from chemname import Molecule
+from chemname.naming.namer import name
+from .golden.test_golden_v02 import CASES as V02
+from .golden.test_golden_v03 import CASES as V03
+
+np = pytest.importorskip("numpy")
+vectorized = pytest.importorskip("chemname.naming.vectorized")
+bench = pytest.importorskip("chemname.benchmarks.vectorized")
+
+
+def test_golden_cases_match_name():
+    mols = [mol for _, mol in V02 + V03]
+    assert vectorized.name_batch(mols) == [expected for expected, _ in V02 + V03]
+    batch, rows = vectorized.pack(mols)
+    assert rows == list(range(len(mols)))
+    assert sum(text is not None for text in vectorized.name_padded(batch)) > len(mols) // 2
+
+
+def _shuffled_chain(rng):
+    n = rng.randint(1, 12)
+    order = rng.choice((2, 3))
+    multiple = set(rng.sample(range(n - 1), rng.randint(0, min(4, n - 1)))) if n > 1 else set()
+    symbols = ["C"] * n
+    edges = [(i, i + 1, order if i in multiple else 1) for i in range(n - 1)]
+    for _ in range(rng.randint(0, 4)):
+        symbols.append(rng.choice(["F", "Cl", "Br", "I"]))
+        edges.append((rng.randrange(n), len(symbols) - 1, 1))
+    perm = list(range(len(symbols)))
+    rng.shuffle(perm)
+    return Molecule.from_edge_list(
+        {perm[i]: s for i, s in enumerate(symbols)}, [(perm[a], perm[b], o) for a, b, o in edges]
+    )
+
+
+def test_random_straight_chains_match_name():
+    rng = random.Random(7)
+    mols = [_shuffled_chain(rng) for _ in range(2000)]
+    batch, _ = vectorized.pack(mols)
+    got = vectorized.name_padded(batch)
+    assert all(text is not None for text in got)
+    assert got == [name(m) for m in mols]
+
+
+def test_outside_class_is_none_and_falls_back():
+    branched = Molecule.from_edge_list(["C"] * 4, [(0, 1), (1, 2), (1, 3)])
+    hetero = Molecule.from_edge_list(["C", "C", "O"], [(0, 1), (1, 2)])
+    mixed = Molecule.from_edge_list(["C"] * 4, [(0, 1, 2), (1, 2), (2, 3, 3)])
+    batch, _ = vectorized.pack([branched, hetero, mixed])
+    assert vectorized.name_padded(batch) == [None, None, None]
+    assert vectorized.name_batch([branched]) == [name(branched)]
+    for mol in (hetero, mixed):
+        with pytest.raises(ValueError):
+            vectorized.name_batch([mol])
+
+
+def test_generated_batch_roundtrips_through_name():
+    batch = bench.random_batch(500, seed=1)
+    got = vectorized.name_padded(batch)
+    assert got == [name(bench.to_molecule(batch, i)) for i in range(len(batch))]
+    assert vectorized.name_padded(batch[:0]) == []
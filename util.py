@@ -1,19 +1,88 @@
 """Shared constants."""
-ROOT_NAMES = {
-    1: "meth",
-    2: "eth",
-    3: "prop",
-    4: "but",
-    5: "pent",
-    6: "hex",
-    7: "hept",
-    8: "oct",
-    9: "non",
-    10: "dec",
-    11: "undec",
-    12: "dodec",
-}
-
-YL_NAMES = {n: root + "yl" for n, root in ROOT_NAMES.items()}
-MULTIPLIER_PREFIXES = {2: "di", 3: "tri", 4: "tetra"}
+
+from __future__ import annotations
+
+from typing import Callable, Mapping
+
+# IUPAC numerical terms (P‑14.2.1) are composed units → tens → hundreds →
+# thousands: 13 trideca, 21 henicosa, 132 dotriacontahecta, 2000 dilia
+MAX_NUMERAL = 9999
+_UNITS = ("", "hen", "do", "tri", "tetra", "penta", "hexa", "hepta", "octa", "nona")
+_TENS = ("", "deca", "icosa", "triaconta", "tetraconta", "pentaconta", "hexaconta", "heptaconta", "octaconta", "nonaconta")
+_HUNDREDS = ("", "hecta", "dicta", "tricta", "tetracta", "pentacta", "hexacta", "heptacta", "octacta", "nonacta")
+_THOUSANDS = ("", "kilia", "dilia", "trilia", "tetralia", "pentalia", "hexalia", "heptalia", "octalia", "nonalia")
+_SIMPLE = ("", "mono", "di", "tri", "tetra", "penta", "hexa", "hepta", "octa", "nona")
+
+
+def numerical_term(n: int) -> str:
+    """IUPAC numerical term for ``1 <= n <= MAX_NUMERAL`` (``hexa``, ``undeca``, ``hecta``)."""
+    if not 1 <= n <= MAX_NUMERAL:
+        raise ValueError(f"No IUPAC numerical term for {n}")
+    if n < 10:
+        return _SIMPLE[n]
+    units, tens, hundreds, thousands = n % 10, n // 10 % 10, n // 100 % 10, n // 1000
+    term = "un" if units == 1 and tens == 1 else _UNITS[units]
+    if tens:
+        # icosa loses its i after a vowel: docosa, tricosa (but henicosa)
+        term += _TENS[tens][1:] if tens == 2 and term[-1:] in ("a", "o", "i") else _TENS[tens]
+    return term + _HUNDREDS[hundreds] + _THOUSANDS[thousands]
+
+
+class LazyTable(dict):
+    """``table[n]`` for every ``n`` in ``span``, built by ``make`` on first use and kept.
+
+    ``in`` and ``get`` answer for the whole span; iteration only sees the
+    entries built so far.
+    """
+
+    def __init__(self, make: Callable[[int], str], span: range, seed: Mapping[int, str] | None = None) -> None:
+        super().__init__(seed or {})
+        self._make = make
+        self._span = span
+
+    def __missing__(self, n: int) -> str:
+        if n not in self._span:
+            raise KeyError(n)
+        value = self[n] = self._make(n)
+        return value
+
+    def __contains__(self, n: object) -> bool:
+        return isinstance(n, int) and n in self._span
+
+    def get(self, n: int, default: str | None = None) -> str | None:  # type: ignore[override]
+        return self[n] if n in self else default
+
+
+ROOT_NAMES = LazyTable(
+    lambda n: numerical_term(n)[:-1],  # hexa → hex, undeca → undec
+    range(1, MAX_NUMERAL + 1),
+    {1: "meth", 2: "eth", 3: "prop", 4: "but"},
+)
+YL_NAMES = LazyTable(lambda n: ROOT_NAMES[n] + "yl", range(1, MAX_NUMERAL + 1))
+MULTIPLIER_PREFIXES = LazyTable(numerical_term, range(2, MAX_NUMERAL + 1))
+# multiplying parenthesised (branched) substituent groups
+GROUP_MULTIPLIERS = LazyTable(
+    lambda n: numerical_term(n) + "kis", range(2, MAX_NUMERAL + 1), {2: "bis", 3: "tris"}
+)
 HALO_PREFIXES = {"F": "fluoro", "Cl": "chloro", "Br": "bromo", "I": "iodo"}
+
+# element symbols indexed by atomic number (0 = dummy/unknown atom)
+ELEMENTS = (
+    "*", "H", "He", "Li", "Be", "B", "C", "N", "O", "F", "Ne",
+    "Na", "Mg", "Al", "Si", "P", "S", "Cl", "Ar", "K", "Ca",
+    "Sc", "Ti", "V", "Cr", "Mn", "Fe", "Co", "Ni", "Cu", "Zn",
+    "Ga", "Ge", "As", "Se", "Br", "Kr", "Rb", "Sr", "Y", "Zr",
+    "Nb", "Mo", "Tc", "Ru", "Rh", "Pd", "Ag", "Cd", "In", "Sn",
+    "Sb", "Te", "I", "Xe", "Cs", "Ba", "La", "Ce", "Pr", "Nd",
+    "Pm", "Sm", "Eu", "Gd", "Tb", "Dy", "Ho", "Er", "Tm", "Yb",
+    "Lu", "Hf", "Ta", "W", "Re", "Os", "Ir", "Pt", "Au", "Hg",
+    "Tl", "Pb", "Bi", "Po", "At", "Rn", "Fr", "Ra", "Ac", "Th",
+    "Pa", "U", "Np", "Pu", "Am", "Cm", "Bk", "Cf", "Es", "Fm",
+    "Md", "No", "Lr", "Rf", "Db", "Sg", "Bh", "Hs", "Mt", "Ds",
+    "Rg", "Cn", "Nh", "Fl", "Mc", "Lv", "Ts", "Og",
+)
+ATOMIC_NUMBERS = {sym: z for z, sym in enumerate(ELEMENTS)}
+
+# bond orders as stored in array form ('ar' → 4, as in MDL bond blocks)
+BOND_ORDER_CODES = {1: 1, 2: 2, 3: 3, "ar": 4}
+BOND_ORDERS = {code: order for order, code in BOND_ORDER_CODES.items()}